@@ -0,0 +1,240 @@
+import math
+import random
+import time
+from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from agents.gameplay.mcts_agent import MCTSAgent
+from engine.core.game import Game
+from engine.state import GameState
+from engine.core.actions import GameAction
+from engine.data.registry import CardRegistry, get_card_registry
+
+_card_id = attrgetter('id')
+
+
+def determinize(state: GameState, observer_id: str, rng: random.Random) -> GameState:
+    """
+    Clone of `state` with every card the observer cannot see dealt again at random.
+
+    Hidden from the observer: the opponent's hand, deck and life, and its own deck
+    and life (life cards are face down). Each player's hidden cards are pooled and
+    re-dealt keeping the zone sizes, so the sample agrees with everything the
+    observer has seen: cards in play and in trash, zone sizes and the deck list
+    (deck lists are public, as in a tournament).
+    """
+    clone = state.clone()
+    for pid, player in clone.players.items():
+        zones = [player.deck, player.life] if pid == observer_id else [player.hand, player.deck, player.life]
+        # Sorted first, so the sample does not depend on where the hidden cards really are
+        pool = sorted((card for zone in zones for card in zone), key=_card_id)
+        rng.shuffle(pool)
+        start = 0
+        for zone in zones:
+            end = start + len(zone)
+            zone[:] = pool[start:end]
+            start = end
+    clone.invalidate_hash()
+    return clone
+
+
+def action_key(state: GameState, action: GameAction) -> tuple:
+    """
+    Identity of an action across determinizations: a hand index is replaced by the
+    card it points to, since the same index holds different cards in each sample.
+    """
+    fields = action.__dict__
+    index = fields.get('card_hand_index')
+    if index is None:
+        return tuple(fields.values())
+    card = state.players[action.player_id].hand[index]
+    return tuple(card.id if name == 'card_hand_index' else value for name, value in fields.items())
+
+
+class ISNode:
+    __slots__ = ('parent', 'mover', 'children', 'visits', 'value', 'available')
+
+    def __init__(self, parent: Optional["ISNode"], mover: Optional[str]):
+        self.parent = parent
+        self.mover = mover              # player who played the action leading here
+        self.children: Dict[tuple, "ISNode"] = {}
+        self.visits = 0
+        self.value = 0.0                # summed rewards from the mover's point of view
+        self.available = 1              # times this node's action was legal when its parent was selected from
+
+
+class ISMCTSAgent(MCTSAgent):
+    """
+    Single-observer Information Set MCTS (Cowling et al., 2012).
+
+    Every iteration samples a determinization of the hidden zones (see determinize)
+    and walks one shared tree restricted to the actions legal in that sample. Edges
+    are keyed by action_key, and selection uses the availability-corrected UCB, so
+    opponent moves that are only possible with some hands are not over-explored.
+    The agent never reads the opponent's hand, deck or life.
+
+    workers > 1 runs the search root-parallel: each worker process searches its own
+    tree with its share of the iteration budget (or the full time_limit), and the
+    root visit counts are summed. The pool is created on first use and kept until
+    close().
+
+    Rollouts, budget options and stats are those of MCTSAgent (no tree reuse).
+    """
+    def __init__(self, id: str, name: str = "ISMCTS Bot", iterations: Optional[int] = None,
+                 time_limit: Optional[float] = None, exploration: float = 1.4, rollout_depth: int = 40,
+                 value_scale: float = 2000.0, workers: int = 1, seed: Optional[int] = None,
+                 rng: Optional[random.Random] = None, registry: Optional[CardRegistry] = None):
+        super().__init__(id, name, iterations=iterations, time_limit=time_limit, exploration=exploration,
+                         rollout_depth=rollout_depth, value_scale=value_scale, reuse_tree=False,
+                         seed=seed, rng=rng)
+        self.workers = workers
+        self.registry = registry if registry is not None else get_card_registry()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._shipped = 0                # registry size the pool's workers were started with
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def take_action(self, game_state: GameState, valid_actions: List[GameAction]) -> GameAction:
+        if not valid_actions:
+            return None
+        if len(valid_actions) == 1:
+            return valid_actions[0]
+        ranked = self.search_stats(game_state, valid_actions)
+        return ranked[0][0]
+
+    def search_stats(self, game_state: GameState,
+                     valid_actions: List[GameAction]) -> List[Tuple[GameAction, int, float]]:
+        """
+        Search the position; returns (action, visits, mean reward) for each of
+        valid_actions, most visited first. Useful to inspect a single position.
+        """
+        start = time.perf_counter()
+        if self.workers > 1:
+            stats, iterations = self._search_parallel(game_state)
+        else:
+            root, iterations = self._search(game_state, self.iterations, self.time_limit)
+            stats = root_stats(root)
+
+        ranked = []
+        for action in valid_actions:
+            # Copies of one card in hand share a key: the first one carries the stats
+            visits, value = stats.pop(action_key(game_state, action), (0, 0.0))
+            ranked.append((action, visits, value / visits if visits else 0.0))
+        ranked.sort(key=lambda r: r[1], reverse=True)
+
+        seconds = time.perf_counter() - start
+        self.total_iterations += iterations
+        self.total_seconds += seconds
+        self.last_stats = {
+            "iterations": iterations,
+            "seconds": seconds,
+            "iterations_per_sec": iterations / seconds if seconds else 0.0,
+            "workers": self.workers,
+        }
+        return ranked
+
+    # --- Search ---
+
+    def _search(self, game_state: GameState, iterations: Optional[int],
+                time_limit: Optional[float]) -> Tuple[ISNode, int]:
+        root = ISNode(None, None)
+        deadline = time.perf_counter() + time_limit if time_limit is not None else None
+        done = 0
+        while True:
+            if iterations is not None and done >= iterations:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            self._iterate_determinized(root, game_state)
+            done += 1
+        return root, done
+
+    def _iterate_determinized(self, root: ISNode, game_state: GameState):
+        rng = self.rng
+        game = Game.from_state(determinize(game_state, self.id, rng), self.registry,
+                               seed=rng.getrandbits(64))
+        node = root
+        # Selection / expansion on the sampled position
+        while not game.state.winner_id:
+            actions = game.get_valid_actions()
+            state = game.state
+            legal = {}
+            for action in actions:
+                legal.setdefault(action_key(state, action), action)
+            # Every child legal in this determinization was available, whichever is picked
+            children = [(key, node.children[key]) for key in legal if key in node.children]
+            for _, child in children:
+                child.available += 1
+            if len(children) < len(legal):
+                untried = [key for key in legal if key not in node.children]
+                key = untried[rng.randrange(len(untried))]
+                game.process_action(legal[key])
+                node.children[key] = child = ISNode(node, actions[0].player_id)
+                node = child
+                break
+            exploration = self.exploration
+            key, node = max(children, key=lambda kc: kc[1].value / kc[1].visits
+                            + exploration * math.sqrt(math.log(kc[1].available) / kc[1].visits))
+            game.process_action(legal[key])
+
+        rewards = self._rollout(game)
+        while node is not None:
+            node.visits += 1
+            if node.mover is not None:
+                node.value += rewards[node.mover]
+            node = node.parent
+
+    def _search_parallel(self, game_state: GameState) -> Tuple[Dict[tuple, Tuple[int, float]], int]:
+        cards = self.registry.cards
+        if self._pool is None:
+            # The registry goes to each worker once; tasks only carry cards registered since
+            self._shipped = len(cards)
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_search_worker,
+                                             initargs=(cards,))
+        shipped = self._shipped
+        share = -(-self.iterations // self.workers) if self.iterations is not None else None
+        config = {"exploration": self.exploration, "rollout_depth": self.rollout_depth,
+                  "value_scale": self.value_scale}
+        futures = [self._pool.submit(_search_worker, game_state, self.id, shipped, cards[shipped:], config,
+                                     share, self.time_limit, self.rng.getrandbits(64))
+                   for _ in range(self.workers)]
+
+        merged: Dict[tuple, Tuple[int, float]] = {}
+        iterations = 0
+        for future in futures:
+            stats, done = future.result()
+            iterations += done
+            for key, (visits, value) in stats.items():
+                total_visits, total_value = merged.get(key, (0, 0.0))
+                merged[key] = (total_visits + visits, total_value + value)
+        return merged, iterations
+
+
+def root_stats(root: ISNode) -> Dict[tuple, Tuple[int, float]]:
+    return {key: (child.visits, child.value) for key, child in root.children.items()}
+
+
+# --- Worker side (root parallelism) ---
+# Card handles in the state refer to the parent's registry. Registries only grow by
+# appending: each worker gets a copy when the pool starts (initializer), and every
+# task carries the cards registered after that, from handle `start` on.
+
+_worker_registry: Optional[CardRegistry] = None
+
+
+def _init_search_worker(cards: list):
+    global _worker_registry
+    _worker_registry = CardRegistry()
+    _worker_registry.register_all(cards)
+
+
+def _search_worker(game_state: GameState, observer_id: str, start: int, tail: list, config: dict,
+                   iterations: Optional[int], time_limit: Optional[float], seed: int):
+    _worker_registry.register_all(tail[len(_worker_registry) - start:])
+    agent = ISMCTSAgent(observer_id, iterations=iterations, time_limit=time_limit, seed=seed,
+                        registry=_worker_registry, **config)
+    root, done = agent._search(game_state, iterations, time_limit)
+    return root_stats(root), done
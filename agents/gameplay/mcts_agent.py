@@ -0,0 +1,199 @@
+import math
+import random
+import time
+from typing import Dict, List, Optional
+from agents.interfaces.game_agent import BaseGameAgent
+from engine.core.game import Game
+from engine.state import GameState
+from engine.core.actions import GameAction
+from engine.core.action_space import acting_player_id as acting_player
+from engine.ai.evaluator import GameEvaluator
+from engine.utils.seeding import make_rng
+
+
+def _hand_order(state: GameState) -> tuple:
+    """Card ids of every hand, in order (what hand indices in actions refer to)."""
+    return tuple(tuple(card.id for card in player.hand) for player in state.players.values())
+
+
+class MCTSNode:
+    __slots__ = ('game', 'action', 'parent', 'mover', 'actor', 'children', 'untried',
+                 'visits', 'value', 'state_hash')
+
+    def __init__(self, game: Game, action: Optional[GameAction], parent: Optional["MCTSNode"],
+                 mover: Optional[str], rng: random.Random):
+        self.game = game
+        self.action = action            # action that led here from parent
+        self.parent = parent
+        self.mover = mover              # player who played `action`
+        self.actor = acting_player(game.state)
+        self.children: List["MCTSNode"] = []
+        self.untried: List[GameAction] = [] if game.state.winner_id else game.get_valid_actions()
+        rng.shuffle(self.untried)
+        self.visits = 0
+        self.value = 0.0                # summed rewards from the mover's point of view
+        self.state_hash = game.state.zobrist_hash
+
+    def uct_child(self, exploration: float) -> "MCTSNode":
+        log_n = math.log(self.visits)
+        return max(self.children,
+                   key=lambda c: c.value / c.visits + exploration * math.sqrt(log_n / c.visits))
+
+
+class MCTSAgent(BaseGameAgent):
+    """
+    UCT Monte Carlo Tree Search on the real engine (get_valid_actions / process_action).
+
+    - Budget per move: `iterations` and/or `time_limit` (seconds), whichever ends first
+      (at least one iteration is always run).
+    - Rollouts: uniformly random actions for up to `rollout_depth` steps, then the
+      GameEvaluator score squashed to [0, 1] (win = 1, loss = 0).
+    - Tree reuse: the subtree of the previous search whose position (zobrist_hash,
+      plus the hand orders the actions' hand indices refer to) matches the new
+      state becomes the new root.
+    - Stats: `last_stats` (per move) and `total_iterations` / `total_seconds` for iterations/sec.
+
+    Note: searches the full GameState, i.e. sees the opponent's hidden zones.
+    """
+    def __init__(self, id: str, name: str = "MCTS Bot", iterations: Optional[int] = None,
+                 time_limit: Optional[float] = None, exploration: float = 1.4, rollout_depth: int = 40,
+                 value_scale: float = 2000.0, reuse_tree: bool = True, seed: Optional[int] = None,
+                 rng: Optional[random.Random] = None):
+        super().__init__(id, name)
+        if iterations is None and time_limit is None:
+            iterations = 200
+        if iterations is not None and iterations < 1:
+            raise ValueError("MCTSAgent needs iterations >= 1")
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.rollout_depth = rollout_depth
+        self.value_scale = value_scale
+        self.reuse_tree = reuse_tree
+        self.rng = make_rng(seed, rng)
+        self.evaluator = GameEvaluator()
+        self.root: Optional[MCTSNode] = None
+        self.last_stats: Dict[str, float] = {}
+        self.total_iterations = 0
+        self.total_seconds = 0.0
+
+    def reset(self, seed: Optional[int] = None):
+        if seed is not None:
+            self.rng.seed(seed)
+        self.root = None
+
+    @property
+    def iterations_per_sec(self) -> float:
+        return self.total_iterations / self.total_seconds if self.total_seconds else 0.0
+
+    def take_action(self, game_state: GameState, valid_actions: List[GameAction]) -> GameAction:
+        if not valid_actions:
+            return None
+        if len(valid_actions) == 1:
+            return valid_actions[0]
+
+        start = time.perf_counter()
+        root = self._reuse_root(game_state, valid_actions)
+        reused_visits = root.visits if root else 0
+        if root is None:
+            game = Game.from_state(game_state.clone(), seed=self.rng.getrandbits(64))
+            root = MCTSNode(game, None, None, None, self.rng)
+        root.parent = None
+
+        iterations = 0
+        deadline = start + self.time_limit if self.time_limit is not None else None
+        while True:
+            self._iterate(root)
+            iterations += 1
+            if self.iterations is not None and iterations >= self.iterations:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        # No child if every expansion so far failed: fall back to the first legal action
+        best = max(root.children, key=lambda c: c.visits) if root.children else None
+        self.root = best if self.reuse_tree else None
+
+        seconds = time.perf_counter() - start
+        self.total_iterations += iterations
+        self.total_seconds += seconds
+        self.last_stats = {
+            "iterations": iterations,
+            "seconds": seconds,
+            "iterations_per_sec": iterations / seconds if seconds else 0.0,
+            "reused_visits": reused_visits,
+            "root_visits": root.visits,
+        }
+
+        if best is None:
+            return valid_actions[0]
+        # The tree may hold equal-but-distinct action objects; answer with the caller's.
+        for action in valid_actions:
+            if action == best.action:
+                return action
+        return valid_actions[0]
+
+    # --- Search ---
+
+    def _iterate(self, root: MCTSNode):
+        node = root
+        # 1. Selection
+        while not node.untried and node.children:
+            node = node.uct_child(self.exploration)
+        # 2. Expansion
+        if node.untried:
+            action = node.untried.pop()
+            game = node.game.fork()
+            if game.process_action(action):
+                child = MCTSNode(game, action, node, node.actor, self.rng)
+                node.children.append(child)
+                node = child
+        # 3. Rollout
+        rewards = self._rollout(node.game)
+        # 4. Backpropagation
+        while node is not None:
+            node.visits += 1
+            if node.mover is not None:
+                node.value += rewards[node.mover]
+            node = node.parent
+
+    def _rollout(self, game: Game) -> Dict[str, float]:
+        """Random playout; returns reward in [0, 1] per player id."""
+        if not game.state.winner_id:
+            game = game.fork()
+            rng = self.rng
+            for _ in range(self.rollout_depth):
+                if game.state.winner_id:
+                    break
+                actions = game.legal_actions()
+                if not game.process_action(actions[rng.randrange(len(actions))]):
+                    break
+
+        state = game.state
+        p1, p2 = state.players
+        if state.winner_id:
+            r1 = 1.0 if state.winner_id == p1 else 0.0
+        else:
+            score = self.evaluator.evaluate(state, p1) / self.value_scale
+            r1 = 1.0 / (1.0 + math.exp(-max(-50.0, min(50.0, score))))
+        return {p1: r1, p2: 1.0 - r1}
+
+    # --- Tree reuse ---
+
+    def _reuse_root(self, game_state: GameState, valid_actions: List[GameAction]) -> Optional[MCTSNode]:
+        """Find the node of the previous tree for this position (breadth-first)."""
+        if not self.reuse_tree or self.root is None:
+            return None
+        target = game_state.zobrist_hash
+        hands = _hand_order(game_state)
+        frontier = [self.root]
+        while frontier:
+            next_frontier = []
+            for node in frontier:
+                # The hash ignores hand order, but PLAY_CARD / COUNTER children address hand indices
+                if (node.state_hash == target and _hand_order(node.game.state) == hands
+                        and node.game.get_valid_actions() == valid_actions):
+                    return node
+                next_frontier.extend(node.children)
+            frontier = next_frontier
+        return None
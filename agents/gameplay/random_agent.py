@@ -1,5 +1,7 @@
 import random
+from typing import Optional
 from agents.interfaces.game_agent import BaseGameAgent
+from engine.utils.seeding import make_rng
 from engine.state import GameState
 from engine.core.actions import GameAction
 
@@ -8,10 +10,19 @@ class RandomAgent(BaseGameAgent):
     A basic agent that acts randomly from the list of valid actions.
     Useful for baseline testing and ensuring the Game Engine doesn't crash.
     """
+    def __init__(self, id: str, name: str = "Random Bot", seed: Optional[int] = None,
+                 rng: Optional[random.Random] = None):
+        super().__init__(id, name)
+        self.rng = make_rng(seed, rng)
+
+    def reset(self, seed: Optional[int] = None):
+        if seed is not None:
+            self.rng.seed(seed)
+
     def take_action(self, game_state: GameState, valid_actions: list[GameAction]) -> GameAction:
         if not valid_actions:
             raise ValueError("No valid actions available! (Should at least have EndPhase)")
             
         # Just pick one!
-        chosen_action = random.choice(valid_actions)
+        chosen_action = self.rng.choice(valid_actions)
         return chosen_action
@@ -26,25 +26,8 @@ class SimpleRuleAgent(BaseGameAgent):
             
             for action in attack_actions:
                 if isinstance(action, AttackAction):
-                    # Resolve Attacker
-                    attacker = None
-                    if active_player.leader and active_player.leader.instance_id == action.attacker_instance_id:
-                        attacker = active_player.leader
-                    else:
-                        for char in active_player.field.character_area:
-                            if char.instance_id == action.attacker_instance_id:
-                                attacker = char
-                                break
-                    
-                    # Resolve Target
-                    target = None
-                    if opponent.leader and opponent.leader.instance_id == action.target_instance_id:
-                        target = opponent.leader
-                    else:
-                        for char in opponent.field.character_area:
-                            if char.instance_id == action.target_instance_id:
-                                target = char
-                                break
+                    attacker = game_state.find_instance(action.attacker_instance_id, owner_id=active_player.id)
+                    target = game_state.find_instance(action.target_instance_id, owner_id=opponent.id)
                     
                     if attacker and target:
                         # Heuristic: Attack if Power >= Target
@@ -2,9 +2,8 @@ from typing import Optional, List
 from agents.interfaces.game_agent import BaseGameAgent
 from engine.core.game import Game
 from engine.state import GameState
-from engine.core.actions import GameAction
+from engine.core.actions import GameAction, ResolveBattleAction
 from engine.ai.evaluator import GameEvaluator
-import copy
 
 class StrategyAgent(BaseGameAgent):
     def __init__(self, id: str, name: str = "Strategy Bot"):
@@ -29,27 +28,10 @@ class StrategyAgent(BaseGameAgent):
         
         for action in valid_actions:
             try:
-                # 1. Clone State
-                simulated_state = copy.deepcopy(game_state)
-                # pid = list(simulated_state.players.keys())[1]
-                # print(f"[StrategyAgent Debug] Sim P2 Life: {len(simulated_state.players[pid].life)}")
+                # 1. Branch State (cheap structural clone, see GameState.clone)
+                sim_game = Game.from_state(game_state.clone())
                 
-                # 2. Setup Sim Engine
-                # We need to reconstruct players from state to init Game
-                # GameState doesn't have player_order, so we just grab values.
-                # Assuming 2 players.
-                players = list(simulated_state.players.values())
-                p1 = players[0]
-                p2 = players[1] if len(players) > 1 else players[0] # Fallback
-                
-                sim_game = Game(p1, p2)
-                sim_game.state = simulated_state
-                
-                pid = list(simulated_state.players.keys())[1]
-                p2_obj = simulated_state.players[pid]
-                print(f"[Sim Debug] P2 Life Before Action: {len(p2_obj.life)} | ID: {id(p2_obj)}")
-                
-                # 3. Process Action
+                # 2. Process Action
                 sim_game.process_action(action)
                 
                 # SPECIAL HANDLING: If Action caused a Battle, resolve it to see the outcome!
@@ -71,13 +53,12 @@ class StrategyAgent(BaseGameAgent):
                          
                          if actor_id:
                              # Force Pass (ResolveBattleAction)
-                             from engine.core.actions import ResolveBattleAction
                              sim_game.process_action(ResolveBattleAction(player_id=actor_id, action_type='RESOLVE_BATTLE'))
                          else:
                              break
                          limit += 1
                 
-                # 4. Evaluate
+                # 3. Evaluate
                 # We evaluate from OUR perspective (self.id)
                 score = self.evaluator.evaluate(sim_game.state, self.id)
                 
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 from engine.state import GameState
 from engine.core.actions import GameAction
 
@@ -9,6 +10,14 @@ class BaseGameAgent(ABC):
     def __init__(self, id: str, name: str):
         self.id = id
         self.name = name
+
+    def reset(self, seed: Optional[int] = None):
+        """
+        Called by runners at the start of each game.
+        Agents with internal randomness should reseed from `seed` here so every
+        game is reproducible on its own.
+        """
+        pass
         
     @abstractmethod
     def take_action(self, game_state: GameState, valid_actions: list[GameAction]) -> GameAction:
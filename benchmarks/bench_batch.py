@@ -0,0 +1,75 @@
+"""
+Throughput of the batched NumPy engine (engine.core.batch_game) against the
+object engine, both playing uniformly random legal actions on the dummy decks.
+
+The batch runs continuously: finished games are restarted in place, so every
+step advances all N games.
+
+Usage:
+    python benchmarks/bench_batch.py --batch 16384 --games 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.core.game import Game
+from engine.core.batch_game import BatchGame
+from engine.models.player import Player
+from scripts.simulation_runner import create_dummy_deck, create_dummy_leader
+
+SEED = 1234
+
+
+def object_games_per_sec(games: int) -> float:
+    start = time.perf_counter()
+    for i in range(games):
+        p1 = Player(id="p1", name="P1", deck=create_dummy_deck())
+        p2 = Player(id="p2", name="P2", deck=create_dummy_deck())
+        p1.leader = create_dummy_leader("p1", "Dummy Leader 1")
+        p2.leader = create_dummy_leader("p2", "Dummy Leader 2")
+        game = Game(p1, p2, seed=SEED + i)
+        game.start_game()
+        chooser = random.Random(SEED + i)
+        while not game.state.winner_id:
+            game.process_action(chooser.choice(game.get_valid_actions()))
+    return games / (time.perf_counter() - start)
+
+
+def batch_games_per_sec(batch_size: int, games: int) -> float:
+    batch = BatchGame(create_dummy_leader("p1", "Dummy Leader 1"), create_dummy_deck(),
+                      create_dummy_leader("p2", "Dummy Leader 2"), create_dummy_deck(), n=batch_size)
+    rng = np.random.default_rng(SEED)
+    start = time.perf_counter()
+    batch.reset(rng=rng)
+    finished = 0
+    while finished < games:
+        batch.step(batch.random_actions(rng))
+        done = np.nonzero(batch.done)[0]
+        if done.size:
+            finished += done.size
+            batch.reset(rng=rng, games=done)
+    return finished / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch", type=int, default=16384, help="Games held in the batch")
+    parser.add_argument("--games", type=int, default=100_000, help="Games to finish in batch mode")
+    parser.add_argument("--object-games", type=int, default=200, help="Games to play with Game")
+    args = parser.parse_args()
+
+    obj = object_games_per_sec(args.object_games)
+    print(f"Game (objects)         : {obj:>10,.0f} games/s")
+    vec = batch_games_per_sec(args.batch, args.games)
+    print(f"BatchGame (N={args.batch:<6})   : {vec:>10,.0f} games/s  (x{vec / obj:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""
+Engine micro-benchmark suite for the game hot paths.
+
+Fixed, seeded scenarios:
+- dummy : the 50-card dummy decks of scripts/simulation_runner.py
+- real  : OP11_luffy vs OP14_mihawk from engine/data/deck
+
+Each scenario is advanced to a mid-game position by a seeded RandomAgent, then
+these operations are measured on it:
+- get_valid_actions          Game.get_valid_actions()
+- process_action             replay of a recorded action trace on a fresh fork (per action)
+- resolve_effect             EffectManager.resolve_effect (BUFF_POWER on the leader)
+- evaluate                   GameEvaluator.evaluate
+- state.clone / game.fork    branching for lookahead
+
+Reports ops/sec (best of --repeat) and allocated bytes per op (tracemalloc peak),
+writes the results as JSON and compares them with a stored baseline.
+
+Usage:
+    python benchmarks/bench_engine.py                            # run, compare with baseline
+    python benchmarks/bench_engine.py --output results.json      # also write results
+    python benchmarks/bench_engine.py --save-baseline            # overwrite the baseline
+    python benchmarks/bench_engine.py --check                    # exit 1 on regression
+"""
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.core.game import Game
+from engine.core.effect_manager import EffectManager
+from engine.ai.evaluator import GameEvaluator
+from engine.models.player import Player
+from engine.models.effect import Effect, EffectType
+from engine.utils.deck_loader import load_card_db, load_deck_from_json
+from agents.gameplay.random_agent import RandomAgent
+from scripts.simulation_runner import create_dummy_deck, create_dummy_leader
+from scripts.tournament_runner import build_game
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(PROJECT_ROOT, "benchmarks", "baseline_engine.json")
+
+SEED = 1234
+WARMUP_TURNS = 4
+TRACE_ACTIONS = 60
+
+
+# --- Scenarios ---
+
+def dummy_game() -> Game:
+    p1 = Player(id="p1", name="P1", deck=create_dummy_deck())
+    p2 = Player(id="p2", name="P2", deck=create_dummy_deck())
+    p1.leader = create_dummy_leader("p1", "Dummy Leader 1")
+    p2.leader = create_dummy_leader("p2", "Dummy Leader 2")
+    game = Game(p1, p2, seed=SEED)
+    game.start_game()
+    return game
+
+
+def real_game() -> Game:
+    card_db = load_card_db(os.path.join(PROJECT_ROOT, "data/clean_json"))
+    l1, d1 = load_deck_from_json(os.path.join(PROJECT_ROOT, "engine/data/deck/OP11_luffy.json"), card_db)
+    l2, d2 = load_deck_from_json(os.path.join(PROJECT_ROOT, "engine/data/deck/OP14_mihawk.json"), card_db)
+    return build_game(l1, d1, l2, d2, SEED, auto_advance=False)
+
+
+SCENARIOS: Dict[str, Callable[[], Game]] = {"dummy": dummy_game, "real": real_game}
+
+
+def play(game: Game, agent: RandomAgent, max_actions: int, until_turn: int = None) -> list:
+    """
+    Advance game with agent; returns the actions taken.
+    until_turn: stop in the main phase of the first turn after it.
+    """
+    trace = []
+    while not game.state.winner_id and len(trace) < max_actions:
+        if (until_turn is not None and game.state.turn_count > until_turn
+                and game.state.current_phase == 'MAIN_PHASE'):
+            break
+        action = agent.take_action(game.state, game.get_valid_actions())
+        if not game.process_action(action):
+            break
+        trace.append(action)
+    return trace
+
+
+def build_scenario(name: str):
+    """Returns (mid-game Game, action trace that replays from it)."""
+    game = SCENARIOS[name]()
+    play(game, RandomAgent("bench", seed=SEED), max_actions=10_000, until_turn=WARMUP_TURNS)
+    trace = play(game.fork(), RandomAgent("bench", seed=SEED + 1), max_actions=TRACE_ACTIONS)
+    return game, trace
+
+
+# --- Measurement ---
+
+def best_time_per_op(run: Callable[[], Tuple[float, int]], repeat: int) -> float:
+    """
+    run() performs a batch and returns (seconds, ops) -> best seconds/op.
+    The cyclic GC is off while timing (as in timeit) so collections triggered
+    by earlier allocations do not land in random cases.
+    """
+    best = float("inf")
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            seconds, ops = run()
+            best = min(best, seconds / ops)
+    finally:
+        gc.enable()
+    return best
+
+
+def batch(fn: Callable[[], object], min_time: float = 0.1):
+    """Calls fn repeatedly for at least min_time. Returns a run() for best_time_per_op."""
+    def run():
+        ops = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time:
+            for _ in range(100):
+                fn()
+            ops += 100
+            elapsed = time.perf_counter() - start
+        return elapsed, ops
+    return run
+
+
+def alloc_per_op(fn: Callable[[], object], ops: int = 1, iterations: int = 50) -> float:
+    """Mean tracemalloc peak (bytes above the starting point) of one fn() call, per op."""
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(iterations):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            fn()
+            total += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return total / (iterations * ops)
+
+
+def bench_scenario(name: str, repeat: int) -> Dict[str, dict]:
+    game, trace = build_scenario(name)
+    state = game.state
+    evaluator = GameEvaluator()
+    effects = EffectManager(state.clone(), game.registry)
+    buff = Effect(type=EffectType.ON_PLAY, action_code=EffectType.BUFF_POWER, action_power=1000)
+    leader_id = state.players["p1"].leader.instance_id
+
+    def replay_run():
+        # Forking is excluded from the timing; only process_action is measured.
+        seconds = 0.0
+        for _ in range(5):
+            fork = game.fork()
+            start = time.perf_counter()
+            for action in trace:
+                fork.process_action(action)
+            seconds += time.perf_counter() - start
+        return seconds, 5 * len(trace)
+
+    def replay_once():
+        fork = game.fork()
+        for action in trace:
+            fork.process_action(action)
+
+    cases = {
+        "get_valid_actions": (batch(game.get_valid_actions), game.get_valid_actions, 1),
+        "process_action": (replay_run, replay_once, len(trace)),
+        "resolve_effect": (batch(lambda: effects.resolve_effect(buff, leader_id, leader_id)),
+                           lambda: effects.resolve_effect(buff, leader_id, leader_id), 1),
+        "evaluate": (batch(lambda: evaluator.evaluate(state, "p1")), lambda: evaluator.evaluate(state, "p1"), 1),
+        "state.clone": (batch(state.clone), state.clone, 1),
+        "game.fork": (batch(game.fork), game.fork, 1),
+    }
+
+    results = {}
+    for case, (run, once, ops) in cases.items():
+        seconds = best_time_per_op(run, repeat)
+        results[f"{name}/{case}"] = {
+            "ops_per_sec": round(1.0 / seconds, 1),
+            "us_per_op": round(seconds * 1e6, 3),
+            "alloc_bytes_per_op": round(alloc_per_op(once, ops)),
+        }
+    return results
+
+
+# --- Reporting ---
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """Print a table against the baseline; returns the names of regressed cases."""
+    regressions = []
+    print(f"{'case':<28} {'ops/sec':>12} {'us/op':>10} {'alloc B/op':>11} {'vs baseline':>12}")
+    for case, r in results.items():
+        base = baseline.get(case)
+        note = ""
+        if base:
+            ratio = r["ops_per_sec"] / base["ops_per_sec"]
+            note = f"x{ratio:5.2f}"
+            if ratio < 1.0 - tolerance:
+                note += "  REGRESSION"
+                regressions.append(case)
+        print(f"{case:<28} {r['ops_per_sec']:>12,.0f} {r['us_per_op']:>10.2f} {r['alloc_bytes_per_op']:>11,} {note:>12}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append",
+                        help="Scenario to run (repeatable, default: all)")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown before a case counts as a regression (fraction)")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 on any regression")
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.scenario or sorted(SCENARIOS):
+        results.update(bench_scenario(name, args.repeat))
+
+    report = {
+        "meta": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": SEED,
+        },
+        "results": results,
+    }
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.tolerance)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
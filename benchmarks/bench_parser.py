@@ -0,0 +1,77 @@
+"""
+Benchmark: EffectParser throughput over the full data/clean_json corpus.
+
+Reports cards/sec for
+- parse      : EffectParser without cache (precompiled patterns + tag tokenizer)
+- cold cache : parse and fill a ParseCache
+- warm cache : ParseCache loaded back from disk, every text a hit
+and the time to open the compiled card database (engine.data.card_db).
+
+Usage: python benchmarks/bench_parser.py [--repeat N]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.data.parser import EffectParser, ParseCache
+from engine.data.card_db import CompiledCardDB, compile_card_db
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLEAN_JSON = os.path.join(PROJECT_ROOT, "data/clean_json")
+
+
+def load_effect_texts():
+    texts = []
+    for filename in sorted(os.listdir(CLEAN_JSON)):
+        if filename.endswith(".json"):
+            with open(os.path.join(CLEAN_JSON, filename), 'r', encoding='utf-8') as f:
+                texts.extend(card.get("effect", "") for card in json.load(f) if 'id' in card)
+    return texts
+
+
+def cards_per_sec(parser: EffectParser, texts, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            parser.parse_effects(text)
+        best = min(best, time.perf_counter() - start)
+    return len(texts) / best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    texts = load_effect_texts()
+    print(f"Corpus: {len(texts)} cards, {len(set(texts))} distinct effect texts")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "effect_cache.json")
+        cold = ParseCache(cache_path)
+        results = {
+            "parse": cards_per_sec(EffectParser(), texts, args.repeat),
+            "cold cache": cards_per_sec(EffectParser(cold), texts, 1),
+        }
+        cold.save()
+        results["warm cache"] = cards_per_sec(EffectParser(ParseCache(cache_path)), texts, args.repeat)
+
+        db_path = compile_card_db(CLEAN_JSON, os.path.join(tmp, "card_db.bin"))
+        start = time.perf_counter()
+        CompiledCardDB(db_path)
+        open_ms = (time.perf_counter() - start) * 1000
+
+    for name, rate in results.items():
+        print(f"{name:<12} {rate:12,.0f} cards/sec")
+    print(f"{'compiled db':<12} {open_ms:12.1f} ms to open ({len(texts)} cards, effects pre-parsed)")
+
+
+if __name__ == "__main__":
+    main()
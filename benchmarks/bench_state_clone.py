@@ -0,0 +1,84 @@
+"""
+Benchmark: cost of branching a GameState for lookahead.
+
+Compares copy.deepcopy (old StrategyAgent path) against GameState.clone / Game.fork
+and the slot-based CompactGameState.clone (engine.compact_state)
+on a mid-game position built from the real decks in engine/data/deck.
+
+Usage: python benchmarks/bench_state_clone.py [--iterations N]
+"""
+import argparse
+import contextlib
+import copy
+import io
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.core.game import Game
+from engine.compact_state import to_compact
+from engine.models.player import Player
+from engine.models.card import CardInstance
+from engine.utils.deck_loader import load_card_db, load_deck_from_json
+from agents.gameplay.rule_based_agent import SimpleRuleAgent
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def build_midgame(turns: int = 6) -> Game:
+    """Play a few turns with SimpleRuleAgent so the board has characters on it."""
+    card_db = load_card_db(os.path.join(PROJECT_ROOT, "data/clean_json"))
+    l1, d1 = load_deck_from_json(os.path.join(PROJECT_ROOT, "engine/data/deck/OP11_luffy.json"), card_db)
+    l2, d2 = load_deck_from_json(os.path.join(PROJECT_ROOT, "engine/data/deck/OP14_mihawk.json"), card_db)
+
+    p1 = Player(id="p1", name="Player 1", deck=d1[:])
+    p1.leader = CardInstance(card_id=l1.id, instance_id="p1_leader", owner_id="p1", current_power=l1.power)
+    p2 = Player(id="p2", name="Player 2", deck=d2[:])
+    p2.leader = CardInstance(card_id=l2.id, instance_id="p2_leader", owner_id="p2", current_power=l2.power)
+
+    game = Game(p1, p2)
+    agents = {"p1": SimpleRuleAgent("p1", "P1"), "p2": SimpleRuleAgent("p2", "P2")}
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.start_game()
+        while game.state.turn_count <= turns and not game.state.winner_id:
+            actions = game.get_valid_actions()
+            agent = agents[actions[0].player_id]
+            game.process_action(agent.take_action(game.state, actions))
+    return game
+
+
+def time_per_call(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    game = build_midgame()
+    state = game.state
+    sizes = {pid: (len(p.deck), len(p.hand), len(p.field.character_area)) for pid, p in state.players.items()}
+    print(f"Position: turn {state.turn_count}, (deck, hand, field) = {sizes}")
+
+    compact = to_compact(state)
+    results = {
+        "copy.deepcopy(state)": time_per_call(lambda: copy.deepcopy(state), args.iterations),
+        "state.clone()": time_per_call(state.clone, args.iterations),
+        "game.fork()": time_per_call(game.fork, args.iterations),
+        "compact.clone()": time_per_call(compact.clone, args.iterations),
+    }
+
+    baseline = results["copy.deepcopy(state)"]
+    for name, seconds in results.items():
+        print(f"{name:<24} {seconds * 1e6:10.1f} us/branch   x{baseline / seconds:6.1f}")
+
+
+if __name__ == "__main__":
+    main()
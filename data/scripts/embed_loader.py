@@ -1,6 +1,4 @@
 import os
-import json
-import glob
 import sys
 import argparse
 from dotenv import load_dotenv
@@ -11,6 +9,7 @@ import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 from data.embedding_provider import get_embedding_settings
+from engine.data.card_db import read_raw_records
 
 # Load Environment Variables
 load_dotenv()
@@ -19,20 +18,11 @@ load_dotenv()
 DATA_DIR = "data/clean_json"
 
 def load_cards():
-    cards = []
-    pattern = os.path.join(DATA_DIR, "cards_*.json")
-    files = glob.glob(pattern)
-    print(f"Found {len(files)} JSON files in {DATA_DIR}.")
-    
-    for fpath in files:
-        try:
-            with open(fpath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    cards.extend(data)
-        except Exception as e:
-            print(f"Error reading {fpath}: {e}")
-            
+    """
+    All clean_json card records in source order, with their original display
+    strings (the compiled card DB normalizes type / color / attribute for the engine).
+    """
+    cards = read_raw_records(DATA_DIR)
     print(f"Total cards loaded: {len(cards)}")
     return cards
 
@@ -64,19 +54,22 @@ def clean_and_deduplicate(cards):
     
     return unique_cards
 
+def _or_default(value, default):
+    return value if value is not None else default
+
 def format_card_text(card):
     """
     Combines card fields into a single text for embedding.
     """
     name = card.get("name", "Unknown")
-    card_type = card.get("type", "Unknown")
-    color = card.get("color", "N/A")
+    card_type = _or_default(card.get("type"), "Unknown")
+    color = _or_default(card.get("color"), "N/A")
     effect = card.get("effect", "")
-    traits = "; ".join(card.get("subtypes", []))
-    power = card.get("power", "N/A")
-    counter = card.get("counter", "N/A")
-    cost = card.get("cost", "N/A")
-    attr = card.get("attribute", "N/A")
+    traits = "; ".join(card.get("subtypes") or [])
+    power = _or_default(card.get("power"), "N/A")
+    counter = _or_default(card.get("counter"), "N/A")
+    cost = _or_default(card.get("cost"), "N/A")
+    attr = _or_default(card.get("attribute"), "N/A")
     
     # New clean schema is already cleaner, but ensuring string parsing
     text = (
@@ -125,11 +118,11 @@ def process_and_index(dry_run=False, provider=None):
         metadata = {
             "id": card.get("id", "Unknown"), # Previously 'number' or 'productId'
             "name": card.get("name"),
-            "card_type": card.get("type", "Unknown"),
-            "color": card.get("color", "Unknown"),
-            "cost": str(card.get("cost", "0")), # Metadata values should be strings or simple types
-            "power": str(card.get("power", "0")),
-            "attribute": card.get("attribute", "Unknown"),
+            "card_type": _or_default(card.get("type"), "Unknown"),
+            "color": _or_default(card.get("color"), "Unknown"),
+            "cost": str(_or_default(card.get("cost"), 0)), # Metadata values should be strings or simple types
+            "power": str(_or_default(card.get("power"), 0)),
+            "attribute": _or_default(card.get("attribute"), "Unknown"),
             "number": card.get("id", "Unknown") # Keeping 'number' key for compatibility if search uses it
         }
         
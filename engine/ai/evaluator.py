@@ -1,5 +1,8 @@
 from engine.state import GameState
 from engine.models.player import Player
+from engine.models.card import KEYWORD_FLAGS
+
+_BLOCKER = KEYWORD_FLAGS['BLOCKER']
 
 class GameEvaluator:
     def evaluate(self, state: GameState, player_id: str) -> float:
@@ -41,8 +44,8 @@ class GameEvaluator:
         score += (len(player.field.character_area) - len(opponent.field.character_area)) * 100
         
         # 5. Key Keywords (Blocker)
-        my_blockers = sum(1 for c in player.field.character_area if "BLOCKER" in c.granted_keywords)
-        opp_blockers = sum(1 for c in opponent.field.character_area if "BLOCKER" in c.granted_keywords)
+        my_blockers = sum(1 for c in player.field.character_area if c.keyword_flags & _BLOCKER)
+        opp_blockers = sum(1 for c in opponent.field.character_area if c.keyword_flags & _BLOCKER)
         
         score += (my_blockers - opp_blockers) * 300
         
@@ -0,0 +1,155 @@
+"""
+Fixed-size observation encoder for GameState.
+
+Writes a state, seen by one player, into a flat vector of ObservationEncoder.size
+values. Fields (see ObservationEncoder.layout for the slices):
+
+- phase       one-hot over the 5 phases
+- my_turn     1 if the observer is the active player
+- turn        turn count
+- battle      in battle, BLOCK step, COUNTER step, observer defends,
+              attacker power, target power
+- me / opp    per side: leader (power, rested, attached DON!!); 5 character
+              slots (present, power, rested, cost, BLOCKER, RUSH, DOUBLE_ATTACK);
+              zone sizes (life, hand, deck, trash); DON!! (active, rested, attached)
+- hand        the observer's own hand only: cost histogram (0..10+), counter
+              histogram (0 / 1000 / 2000+), card types (character, event, stage)
+              and the number of characters playable with the active DON!!
+
+Powers are in thousands; everything else is a raw count or flag, so the vector
+fits float32 as well as int16. The opponent's hidden cards are only seen as zone
+sizes. encode()/encode_batch() fill caller-provided buffers (no array allocation).
+"""
+from array import array
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from engine.data.registry import CardRegistry, get_card_registry
+from engine.models.card import KEYWORD_FLAGS
+from engine.state import GameState
+
+PHASES = ('REFRESH_PHASE', 'DRAW_PHASE', 'DON_PHASE', 'MAIN_PHASE', 'END_PHASE')
+KEYWORDS = ('BLOCKER', 'RUSH', 'DOUBLE_ATTACK')
+HAND_TYPES = ('CHARACTER', 'EVENT', 'STAGE')
+FIELD_SLOTS = 5
+MAX_COST = 10
+SLOT_SIZE = 4 + len(KEYWORDS)
+
+SIDE_FIELDS = (("leader", 3), ("characters", FIELD_SLOTS * SLOT_SIZE), ("zones", 4), ("don", 3))
+FIELDS = (
+    ("phase", len(PHASES)), ("my_turn", 1), ("turn", 1), ("battle", 6),
+    *((f"me_{name}", size) for name, size in SIDE_FIELDS),
+    *((f"opp_{name}", size) for name, size in SIDE_FIELDS),
+    ("hand_cost", MAX_COST + 1), ("hand_counter", 3), ("hand_type", len(HAND_TYPES)), ("hand_playable", 1),
+)
+
+_PHASE_INDEX = {phase: i for i, phase in enumerate(PHASES)}
+_TYPE_INDEX = {card_type: i for i, card_type in enumerate(HAND_TYPES)}
+_KEYWORD_BITS = tuple(KEYWORD_FLAGS[keyword] for keyword in KEYWORDS)
+
+
+class ObservationEncoder:
+    def __init__(self, dtype=np.float32, registry: Optional[CardRegistry] = None):
+        self.dtype = np.dtype(dtype)
+        self.registry = registry if registry is not None else get_card_registry()
+        self.layout: Dict[str, slice] = {}
+        offset = 0
+        for name, size in FIELDS:
+            self.layout[name] = slice(offset, offset + size)
+            offset += size
+        self.size = offset
+        # Start offsets of (leader, characters, zones, don) per side
+        self._sides = {side: tuple(self.layout[f"{side}_{name}"].start for name, _ in SIDE_FIELDS)
+                       for side in ("me", "opp")}
+        self._zeros = array('f', bytes(4 * offset))
+        self._values = array('f', self._zeros)
+        self._view = np.frombuffer(self._values, dtype=np.float32)
+
+    def __call__(self, state: GameState, player_id: str) -> np.ndarray:
+        """New observation array (usable as GameEnv's observe)."""
+        return self.encode(state, player_id)
+
+    def encode(self, state: GameState, player_id: str, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Fill out (shape (size,)) with the observation of player_id; returns out."""
+        if out is None:
+            out = np.empty(self.size, dtype=self.dtype)
+        # Fields are written into a reused array('f') and copied into out in one call:
+        # per-element numpy stores cost several times more.
+        values = self._values
+        values[:] = self._zeros
+        layout = self.layout
+        player = state.players[player_id]
+        opponent = state.get_opponent(player_id)
+
+        values[layout["phase"].start + _PHASE_INDEX[state.current_phase]] = 1
+        values[layout["my_turn"].start] = state.active_player_id == player_id
+        values[layout["turn"].start] = state.turn_count
+
+        battle = state.current_battle
+        if battle is not None:
+            base = layout["battle"].start
+            values[base] = 1
+            values[base + 1] = battle.current_step == 'BLOCK'
+            values[base + 2] = battle.current_step == 'COUNTER'
+            values[base + 3] = battle.attacker_id != player_id
+            values[base + 4] = battle.attacker_power / 1000
+            values[base + 5] = battle.target_power / 1000
+
+        self._encode_side(player, "me", values)
+        self._encode_side(opponent, "opp", values)
+
+        cost_base = layout["hand_cost"].start
+        counter_base = layout["hand_counter"].start
+        type_base = layout["hand_type"].start
+        playable = 0
+        for card in player.hand:
+            values[cost_base + min(card.cost, MAX_COST)] += 1
+            values[counter_base + min(card.counter // 1000, 2)] += 1
+            type_index = _TYPE_INDEX.get(card.type)
+            if type_index is not None:
+                values[type_base + type_index] += 1
+            if card.type == 'CHARACTER' and card.cost <= player.active_don:
+                playable += 1
+        values[layout["hand_playable"].start] = playable
+        out[:] = self._view
+        return out
+
+    def encode_batch(self, states: Sequence[GameState], player_ids: Sequence[str],
+                     out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Fill out (shape (N, size)) with one observation per (state, player_id); returns out."""
+        if out is None:
+            out = np.zeros((len(states), self.size), dtype=self.dtype)
+        for row, state, player_id in zip(out, states, player_ids):
+            self.encode(state, player_id, row)
+        return out
+
+    def _encode_side(self, player, side: str, values: array):
+        leader_base, base, zones_base, don_base = self._sides[side]
+        leader = player.leader
+        if leader is not None:
+            values[leader_base] = leader.total_power / 1000
+            values[leader_base + 1] = leader.is_rested
+            values[leader_base + 2] = leader.attached_don
+
+        card_for = self.registry.card_for
+        for char in player.field.character_area[:FIELD_SLOTS]:
+            values[base] = 1
+            values[base + 1] = char.total_power / 1000
+            values[base + 2] = char.is_rested
+            card = card_for(char)
+            values[base + 3] = (card.cost if card is not None else 0) + char.cost_modifier
+            flags = char.keyword_flags
+            if flags:
+                for k, bit in enumerate(_KEYWORD_BITS):
+                    values[base + 4 + k] = (flags & bit) != 0
+            base += SLOT_SIZE
+
+        values[zones_base] = len(player.life)
+        values[zones_base + 1] = len(player.hand)
+        values[zones_base + 2] = len(player.deck)
+        values[zones_base + 3] = len(player.trash)
+
+        values[don_base] = player.active_don
+        values[don_base + 1] = player.rested_don
+        values[don_base + 2] = player.attached_don
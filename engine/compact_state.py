@@ -0,0 +1,287 @@
+"""
+Compact, slot-based representation of GameState for the simulation hot path.
+
+The pydantic models in engine.state / engine.models are convenient for the API
+and tests but pay validation and per-instance dict overhead on every write.
+The classes here use __slots__, CardRegistry handles for cards
+(hand / deck / life / trash are array('H') of handles) and a fixed 5-slot
+character array per player.
+
+to_compact() / from_compact() convert losslessly between the two forms.
+"""
+from array import array
+from typing import Dict, List, Optional
+from engine.state import GameState
+from engine.core.battle import BattlePhase
+from engine.models.card import Card, CardInstance
+from engine.models.field import FieldArea
+from engine.models.player import Player
+from engine.data.registry import CardRegistry, get_card_registry
+
+PHASES = ('REFRESH_PHASE', 'DRAW_PHASE', 'DON_PHASE', 'MAIN_PHASE', 'END_PHASE')
+PHASE_INDEX = {name: i for i, name in enumerate(PHASES)}
+
+MAX_CHARACTERS = 5
+NO_PLAYER = -1
+
+
+class CompactInstance:
+    """A card on the field (leader, character or stage)."""
+    __slots__ = ('card_id', 'card_handle', 'instance_id', 'owner_id', 'is_rested', 'current_power',
+                 'attached_don', 'power_modifier', 'cost_modifier', 'keywords', 'keyword_flags')
+
+    def __init__(self, card_id: str, card_handle: int, instance_id: str, owner_id: str, is_rested: bool = False,
+                 current_power: int = 0, attached_don: int = 0, power_modifier: int = 0,
+                 cost_modifier: int = 0, keywords: Optional[List[str]] = None, keyword_flags: int = 0):
+        self.card_id = card_id
+        self.card_handle = card_handle
+        self.instance_id = instance_id
+        self.owner_id = owner_id
+        self.is_rested = is_rested
+        self.current_power = current_power
+        self.attached_don = attached_don
+        self.power_modifier = power_modifier
+        self.cost_modifier = cost_modifier
+        self.keywords = keywords if keywords is not None else []
+        self.keyword_flags = keyword_flags
+
+    @property
+    def total_power(self) -> int:
+        return self.current_power + self.power_modifier + (self.attached_don * 1000)
+
+    def clone(self) -> "CompactInstance":
+        return CompactInstance(self.card_id, self.card_handle, self.instance_id, self.owner_id, self.is_rested,
+                               self.current_power, self.attached_don, self.power_modifier,
+                               self.cost_modifier, self.keywords.copy(), self.keyword_flags)
+
+
+class CompactPlayer:
+    """
+    Player zones as arrays of card handles.
+    characters is always MAX_CHARACTERS long; occupied slots come first (same order
+    as FieldArea.character_area), empty slots are None.
+    """
+    __slots__ = ('id', 'name', 'life', 'hand', 'deck', 'trash', 'characters', 'stage', 'leader',
+                 'cost_area', 'active_don', 'rested_don', 'attached_don')
+
+    def __init__(self, id: str, name: str):
+        self.id = id
+        self.name = name
+        self.life = array('H')
+        self.hand = array('H')
+        self.deck = array('H')
+        self.trash = array('H')
+        self.characters: List[Optional[CompactInstance]] = [None] * MAX_CHARACTERS
+        self.stage: Optional[CompactInstance] = None
+        self.leader: Optional[CompactInstance] = None
+        self.cost_area: List[str] = []
+        self.active_don = 0
+        self.rested_don = 0
+        self.attached_don = 0
+
+    def character_count(self) -> int:
+        count = 0
+        for char in self.characters:
+            if char is None:
+                break
+            count += 1
+        return count
+
+    def clone(self) -> "CompactPlayer":
+        copied = CompactPlayer(self.id, self.name)
+        copied.life = array('H', self.life)
+        copied.hand = array('H', self.hand)
+        copied.deck = array('H', self.deck)
+        copied.trash = array('H', self.trash)
+        copied.characters = [c.clone() if c is not None else None for c in self.characters]
+        copied.stage = self.stage.clone() if self.stage else None
+        copied.leader = self.leader.clone() if self.leader else None
+        copied.cost_area = self.cost_area.copy()
+        copied.active_don = self.active_don
+        copied.rested_don = self.rested_don
+        copied.attached_don = self.attached_don
+        return copied
+
+
+class CompactBattle:
+    __slots__ = ('attacker', 'attacker_instance_id', 'target_instance_id', 'current_step',
+                 'attacker_power', 'target_power', 'blocker_instance_id', 'counter_cards',
+                 'counter_power_bonus')
+
+    def __init__(self, attacker: int, attacker_instance_id: str, target_instance_id: str,
+                 current_step: str = "DECLARE", attacker_power: int = 0, target_power: int = 0,
+                 blocker_instance_id: Optional[str] = None, counter_cards: Optional[List[str]] = None,
+                 counter_power_bonus: int = 0):
+        self.attacker = attacker
+        self.attacker_instance_id = attacker_instance_id
+        self.target_instance_id = target_instance_id
+        self.current_step = current_step
+        self.attacker_power = attacker_power
+        self.target_power = target_power
+        self.blocker_instance_id = blocker_instance_id
+        self.counter_cards = counter_cards if counter_cards is not None else []
+        self.counter_power_bonus = counter_power_bonus
+
+    def clone(self) -> "CompactBattle":
+        return CompactBattle(self.attacker, self.attacker_instance_id, self.target_instance_id,
+                             self.current_step, self.attacker_power, self.target_power,
+                             self.blocker_instance_id, self.counter_cards.copy(),
+                             self.counter_power_bonus)
+
+
+class CompactGameState:
+    """
+    Players are addressed by index (0, 1) instead of by id; `cards` is the
+    CardRegistry table the zone handles point into, shared between clones.
+    """
+    __slots__ = ('turn_count', 'phase', 'active', 'winner', 'battle', 'players', 'cards')
+
+    def __init__(self, players: List[CompactPlayer], cards: List[Card]):
+        self.turn_count = 1
+        self.phase = 0
+        self.active = 0
+        self.winner = NO_PLAYER
+        self.battle: Optional[CompactBattle] = None
+        self.players = players
+        self.cards = cards
+
+    def player_index(self, player_id: str) -> int:
+        for i, player in enumerate(self.players):
+            if player.id == player_id:
+                return i
+        raise ValueError(f"Unknown player: {player_id}")
+
+    def clone(self) -> "CompactGameState":
+        copied = CompactGameState([p.clone() for p in self.players], self.cards)
+        copied.turn_count = self.turn_count
+        copied.phase = self.phase
+        copied.active = self.active
+        copied.winner = self.winner
+        copied.battle = self.battle.clone() if self.battle else None
+        return copied
+
+
+# --- Converters ---
+
+def _instance_to_compact(instance: Optional[CardInstance]) -> Optional[CompactInstance]:
+    if instance is None:
+        return None
+    return CompactInstance(instance.card_id, instance.card_handle, instance.instance_id, instance.owner_id, instance.is_rested,
+                           instance.current_power, instance.attached_don, instance.power_modifier,
+                           instance.cost_modifier, list(instance.granted_keywords), instance.keyword_flags)
+
+
+def _instance_from_compact(instance: Optional[CompactInstance]) -> Optional[CardInstance]:
+    if instance is None:
+        return None
+    return CardInstance(
+        card_id=instance.card_id,
+        card_handle=instance.card_handle,
+        instance_id=instance.instance_id,
+        owner_id=instance.owner_id,
+        is_rested=instance.is_rested,
+        current_power=instance.current_power,
+        attached_don=instance.attached_don,
+        power_modifier=instance.power_modifier,
+        cost_modifier=instance.cost_modifier,
+        granted_keywords=list(instance.keywords),
+        keyword_flags=instance.keyword_flags
+    )
+
+
+def to_compact(state: GameState, registry: Optional[CardRegistry] = None) -> CompactGameState:
+    """
+    Convert a pydantic GameState into its compact form.
+    Zone cards are stored as CardRegistry handles (unseen cards get registered).
+    """
+    registry = registry if registry is not None else get_card_registry()
+    register = registry.register
+
+    def intern(zone: List[Card]) -> array:
+        return array('H', [register(card) for card in zone])
+
+    player_ids = list(state.players.keys())
+    players = []
+    for pid in player_ids:
+        p = state.players[pid]
+        if len(p.field.character_area) > MAX_CHARACTERS:
+            raise ValueError(f"Character area of {pid} exceeds {MAX_CHARACTERS} slots")
+        cp = CompactPlayer(p.id, p.name)
+        cp.life = intern(p.life)
+        cp.hand = intern(p.hand)
+        cp.deck = intern(p.deck)
+        cp.trash = intern(p.trash)
+        for slot, char in enumerate(p.field.character_area):
+            cp.characters[slot] = _instance_to_compact(char)
+        cp.stage = _instance_to_compact(p.field.stage_area)
+        cp.leader = _instance_to_compact(p.leader)
+        cp.cost_area = list(p.cost_area)
+        cp.active_don = p.active_don
+        cp.rested_don = p.rested_don
+        cp.attached_don = p.attached_don
+        players.append(cp)
+
+    compact = CompactGameState(players, registry.cards)
+    compact.turn_count = state.turn_count
+    compact.phase = PHASE_INDEX[state.current_phase]
+    compact.active = player_ids.index(state.active_player_id)
+    compact.winner = player_ids.index(state.winner_id) if state.winner_id is not None else NO_PLAYER
+
+    battle = state.current_battle
+    if battle:
+        compact.battle = CompactBattle(
+            player_ids.index(battle.attacker_id), battle.attacker_instance_id, battle.target_instance_id,
+            battle.current_step, battle.attacker_power, battle.target_power,
+            battle.blocker_instance_id, list(battle.counter_cards), battle.counter_power_bonus
+        )
+    return compact
+
+
+def from_compact(compact: CompactGameState) -> GameState:
+    """
+    Rebuild the pydantic GameState (for the API, agents and tests).
+    """
+    cards = compact.cards
+    players: Dict[str, Player] = {}
+    for cp in compact.players:
+        players[cp.id] = Player(
+            id=cp.id,
+            name=cp.name,
+            life=[cards[i] for i in cp.life],
+            hand=[cards[i] for i in cp.hand],
+            deck=[cards[i] for i in cp.deck],
+            trash=[cards[i] for i in cp.trash],
+            field=FieldArea(
+                character_area=[_instance_from_compact(c) for c in cp.characters if c is not None],
+                stage_area=_instance_from_compact(cp.stage)
+            ),
+            leader=_instance_from_compact(cp.leader),
+            cost_area=list(cp.cost_area),
+            active_don=cp.active_don,
+            rested_don=cp.rested_don,
+            attached_don=cp.attached_don
+        )
+
+    battle = None
+    if compact.battle:
+        b = compact.battle
+        battle = BattlePhase(
+            attacker_id=compact.players[b.attacker].id,
+            attacker_instance_id=b.attacker_instance_id,
+            target_instance_id=b.target_instance_id,
+            current_step=b.current_step,
+            attacker_power=b.attacker_power,
+            target_power=b.target_power,
+            blocker_instance_id=b.blocker_instance_id,
+            counter_cards=list(b.counter_cards),
+            counter_power_bonus=b.counter_power_bonus
+        )
+
+    return GameState(
+        turn_count=compact.turn_count,
+        current_phase=PHASES[compact.phase],
+        active_player_id=compact.players[compact.active].id,
+        winner_id=compact.players[compact.winner].id if compact.winner != NO_PLAYER else None,
+        current_battle=battle,
+        players=players
+    )
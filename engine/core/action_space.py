@@ -0,0 +1,139 @@
+"""
+Canonical integer action space of the engine.
+
+Every decision is one index in [0, NUM_ACTIONS):
+
+    END_PHASE               end the current phase
+    PASS                    RESOLVE_BATTLE: skip the block / counter step
+    PLAY + i                play hand card i
+    ATTACK + a * 6 + t      attack with a (0 = leader, 1..5 = character slot + 1)
+                            on t (0 = opponent leader, 1..5 = opponent character slot + 1)
+    BLOCK + b               block with character slot b
+    COUNTER + c             counter with hand card c
+
+Game.legal_actions() / Game.legal_action_mask() give the legal indices of a
+position and Game.process_action() accepts an index directly; BatchGame uses the
+same layout. The pydantic GameAction classes are only needed at API boundaries
+(agents, logs): encode_action() / decode_action() convert between the two.
+"""
+from typing import Iterable, Optional
+
+import numpy as np
+
+from engine.core.actions import (
+    GameAction, PlayCardAction, AttackAction, BlockAction, CounterAction, ResolveBattleAction, EndTurnAction
+)
+from engine.state import GameState
+
+MAX_CARDS = 64          # hand slots; also bounds deck and trash in the batch engine
+FIELD_SLOTS = 5
+
+END_PHASE = 0
+PASS = 1
+PLAY = 2                                    # + hand slot
+ATTACK = PLAY + MAX_CARDS                   # + attacker * 6 + target (0 = leader, 1..5 = character slot)
+BLOCK = ATTACK + (FIELD_SLOTS + 1) ** 2     # + character slot
+COUNTER = BLOCK + FIELD_SLOTS               # + hand slot
+NUM_ACTIONS = COUNTER + MAX_CARDS
+
+
+def action_type(index: int) -> str:
+    """GameAction.action_type of an index ('PLAY_CARD', 'ATTACK', ...)."""
+    if index == END_PHASE:
+        return 'END_PHASE'
+    if index == PASS:
+        return 'RESOLVE_BATTLE'
+    if index < ATTACK:
+        return 'PLAY_CARD'
+    if index < BLOCK:
+        return 'ATTACK'
+    if index < COUNTER:
+        return 'BLOCK'
+    return 'COUNTER'
+
+
+def attack_index(attacker: int, target: int) -> int:
+    """ATTACK index for board positions (0 = leader, k = character slot k - 1)."""
+    return ATTACK + attacker * (FIELD_SLOTS + 1) + target
+
+
+def acting_player_id(state: GameState) -> str:
+    """Player whose decision it is (the defender during the BLOCK / COUNTER steps)."""
+    battle = state.current_battle
+    if battle is not None and battle.current_step in ('BLOCK', 'COUNTER'):
+        return state.get_opponent(battle.attacker_id).id
+    return state.active_player_id
+
+
+def encode_action(state: GameState, action: GameAction) -> int:
+    """Index of a GameAction in the action space."""
+    kind = action.action_type
+    if kind == 'END_PHASE':
+        return END_PHASE
+    if kind == 'RESOLVE_BATTLE':
+        return PASS
+    if kind == 'PLAY_CARD':
+        return PLAY + action.card_hand_index
+    if kind == 'COUNTER':
+        return COUNTER + action.card_hand_index
+    if kind == 'BLOCK':
+        return BLOCK + state.locate_instance(action.blocker_instance_id).slot
+
+    def position(instance_id):
+        location = state.locate_instance(instance_id)
+        return 0 if location.zone == 'leader' else location.slot + 1
+
+    if kind == 'ATTACK':
+        return attack_index(position(action.attacker_instance_id), position(action.target_instance_id))
+    raise ValueError(f"Cannot encode action type {kind}")
+
+
+def decode_action(state: GameState, index: int) -> GameAction:
+    """
+    GameAction for an index in this position (the acting player's).
+    Raises ValueError if the index names a hand slot or board position that is empty.
+    """
+    player_id = acting_player_id(state)
+    try:
+        if index == END_PHASE:
+            return EndTurnAction(player_id=player_id)
+        if index == PASS:
+            return ResolveBattleAction(player_id=player_id)
+        if PLAY <= index < ATTACK:
+            slot = index - PLAY
+            if slot >= len(state.players[player_id].hand):
+                raise IndexError(slot)
+            return PlayCardAction(player_id=player_id, card_hand_index=slot)
+        if ATTACK <= index < BLOCK:
+            attacker, target = divmod(index - ATTACK, FIELD_SLOTS + 1)
+            opponent = state.get_opponent(player_id)
+            return AttackAction(player_id=player_id,
+                                attacker_instance_id=_board_instance(state.players[player_id], attacker),
+                                target_instance_id=_board_instance(opponent, target))
+        if BLOCK <= index < COUNTER:
+            blocker = state.players[player_id].field.character_area[index - BLOCK]
+            return BlockAction(player_id=player_id, blocker_instance_id=blocker.instance_id)
+        if COUNTER <= index < NUM_ACTIONS:
+            slot = index - COUNTER
+            if slot >= len(state.players[player_id].hand):
+                raise IndexError(slot)
+            return CounterAction(player_id=player_id, card_hand_index=slot)
+    except (IndexError, AttributeError):
+        raise ValueError(f"Action {index} does not exist in this position") from None
+    raise ValueError(f"Action index {index} out of range [0, {NUM_ACTIONS})")
+
+
+def _board_instance(player, position: int) -> str:
+    if position == 0:
+        return player.leader.instance_id
+    return player.field.character_area[position - 1].instance_id
+
+
+def action_mask(indices: Iterable[int], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """(NUM_ACTIONS,) bool mask with the given indices set (written into out if given)."""
+    if out is None:
+        out = np.zeros(NUM_ACTIONS, dtype=bool)
+    else:
+        out[:] = False
+    out[list(indices)] = True
+    return out
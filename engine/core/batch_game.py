@@ -0,0 +1,504 @@
+"""
+Batched game engine: N games of one matchup held as NumPy arrays and advanced in lockstep.
+
+Implements the same rules as engine.core.game.Game (phase flow, turn-start refresh /
+draw / DON!!, PLAY_CARD with its ON_PLAY effects, ATTACK -> BLOCK -> COUNTER ->
+resolve, life damage and KO) as array operations over the whole batch, so a step
+costs a handful of NumPy calls no matter how many games are running.
+
+Layout (g = game, p = player index 0/1, cards are CardRegistry handles):
+- deck / hand / trash      (N, 2, MAX_CARDS) int16 with deck_top / hand_len / trash_len
+- life                     (N, 2, LIFE) int16 with life_top (life is lost from the front)
+- character slots          (N, 2, 5): card, power, rested, keywords (bit flags)
+- leader_power / rested, don_active / don_rested, and per game turn, phase,
+  active player, winner and the pending battle.
+
+Actions are the integers of engine.core.action_space, as for Game; legal_mask()
+gives the (N, NUM_ACTIONS) boolean mask. With reset(seeds=...) every game shuffles
+exactly like Game(seed=...), so a batch row replays the same game action for action.
+"""
+import random
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from engine.core.phases import Phase
+from engine.data.registry import CardRegistry, get_card_registry
+from engine.models.card import Card, CardInstance, KEYWORD_FLAGS
+from engine.models.effect import EffectType
+from engine.core.action_space import (
+    MAX_CARDS, FIELD_SLOTS, END_PHASE, PASS, PLAY, ATTACK, BLOCK, COUNTER, NUM_ACTIONS
+)
+
+LIFE = 5
+MAX_DON = 10
+UNPLAYABLE = MAX_DON + 1
+
+PHASES = [phase.value for phase in Phase]
+REFRESH, DRAW, DON, MAIN, END = range(5)
+
+# Battle steps
+NO_BATTLE, STEP_BLOCK, STEP_COUNTER = 0, 1, 2
+LEADER = -1                                 # slot value for the leader in battle fields
+
+# Keyword bit flags of characters in play (CardInstance.keyword_flags)
+KEYWORDS = KEYWORD_FLAGS
+
+# Compiled on-play operations: ON_PLAY effects and printed keywords, which Game applies
+# when a character enters play (effects Game resolves without a target are no-ops there too)
+OP_NONE, OP_DRAW, OP_TRASH, OP_KEYWORD = 0, 1, 2, 3
+
+
+class CardTable:
+    """Per-handle card columns (cost, power, counter, ON_PLAY program) for the batch engine."""
+    def __init__(self, cards: Sequence[Card]):
+        count = len(cards)
+        self.cost = np.array([card.cost for card in cards], dtype=np.int16)
+        self.power = np.array([card.power for card in cards], dtype=np.int32)
+        self.counter = np.array([card.counter for card in cards], dtype=np.int32)
+        self.is_character = np.array([card.type == 'CHARACTER' for card in cards], dtype=bool)
+        # Cost to play from hand; never affordable for non-characters and for the
+        # trailing sentinel that empty hand slots (-1) index
+        self.play_cost = np.append(np.where(self.is_character, self.cost, UNPLAYABLE), UNPLAYABLE).astype(np.int16)
+        # Can be played as a counter (a counter value); never for the empty-slot sentinel
+        self.can_counter = np.append(self.counter > 0, False)
+
+        programs = [self._compile(card) for card in cards]
+        width = max([len(program) for program in programs] + [1])
+        self.op = np.zeros((count, width), dtype=np.int8)
+        self.value = np.zeros((count, width), dtype=np.int16)
+        for handle, program in enumerate(programs):
+            for k, (op, value) in enumerate(program):
+                self.op[handle, k] = op
+                self.value[handle, k] = value
+
+    @staticmethod
+    def _compile(card: Card) -> list:
+        program = []
+        for effect in card.effect_list:
+            if effect.type != EffectType.ON_PLAY and effect.type.value not in KEYWORDS:
+                continue
+            code = effect.action_code
+            if code == EffectType.DRAW_CARD:
+                program.append((OP_DRAW, effect.action_value))
+            elif code == EffectType.TRASH_CARD:
+                program.append((OP_TRASH, effect.action_value))
+            elif code.value in KEYWORDS:
+                program.append((OP_KEYWORD, KEYWORDS[code.value]))
+        return program
+
+
+class BatchGame:
+    """
+    N games of deck1 (first player) vs deck2, stepped together.
+
+    Usage:
+        batch = BatchGame(leader1, deck1, leader2, deck2, n=4096)
+        batch.reset(seeds=range(4096))          # or reset(rng=np.random.default_rng(0))
+        while not batch.done.all():
+            batch.step(batch.random_actions(rng))
+
+    For long runs, restart finished games instead of waiting for the slowest one:
+        finished = np.nonzero(batch.done)[0]
+        record(batch.winner[finished]); batch.reset(rng=rng, games=finished)
+    """
+    def __init__(self, leader1: CardInstance, deck1: List[Card], leader2: CardInstance, deck2: List[Card],
+                 n: int, registry: Optional[CardRegistry] = None, max_turns: Optional[int] = None):
+        if len(deck1) > MAX_CARDS or len(deck2) > MAX_CARDS:
+            raise ValueError(f"Decks are limited to {MAX_CARDS} cards")
+        self.registry = registry if registry is not None else get_card_registry()
+        self.player_ids = (leader1.owner_id, leader2.owner_id)
+        self.decks = [np.array(self.registry.register_all(deck), dtype=np.int16) for deck in (deck1, deck2)]
+        self.leader_base_power = np.array([leader1.total_power, leader2.total_power], dtype=np.int32)
+        self.cards = CardTable(self.registry.cards)
+        self.n = n
+        self.max_turns = max_turns
+        self._rows = np.arange(n)
+
+        shape = (n, 2)
+        self.deck = np.full(shape + (MAX_CARDS,), -1, dtype=np.int16)
+        self.deck_len = np.zeros(shape, dtype=np.int16)
+        self.deck_top = np.zeros(shape, dtype=np.int16)
+        self.hand = np.full(shape + (MAX_CARDS,), -1, dtype=np.int16)
+        self.hand_len = np.zeros(shape, dtype=np.int16)
+        self.trash = np.full(shape + (MAX_CARDS,), -1, dtype=np.int16)
+        self.trash_len = np.zeros(shape, dtype=np.int16)
+        self.life = np.full(shape + (LIFE,), -1, dtype=np.int16)
+        self.life_len = np.zeros(shape, dtype=np.int16)
+        self.life_top = np.zeros(shape, dtype=np.int16)
+
+        self.char_card = np.full(shape + (FIELD_SLOTS,), -1, dtype=np.int16)
+        self.char_power = np.zeros(shape + (FIELD_SLOTS,), dtype=np.int32)
+        self.char_rested = np.zeros(shape + (FIELD_SLOTS,), dtype=bool)
+        self.char_keywords = np.zeros(shape + (FIELD_SLOTS,), dtype=np.uint8)
+        self.field_len = np.zeros(shape, dtype=np.int8)
+
+        self.leader_power = np.zeros(shape, dtype=np.int32)
+        self.leader_rested = np.zeros(shape, dtype=bool)
+        self.don_active = np.zeros(shape, dtype=np.int8)
+        self.don_rested = np.zeros(shape, dtype=np.int8)
+
+        self.turn = np.ones(n, dtype=np.int32)
+        self.phase = np.zeros(n, dtype=np.int8)
+        self.active = np.zeros(n, dtype=np.int8)
+        self.winner = np.full(n, -1, dtype=np.int8)
+
+        self.battle_step = np.zeros(n, dtype=np.int8)
+        self.battle_attacker = np.zeros(n, dtype=np.int8)     # LEADER or character slot of the attacker
+        self.battle_target = np.zeros(n, dtype=np.int8)       # LEADER or character slot of the defender
+        self.battle_attacker_power = np.zeros(n, dtype=np.int32)
+        self.battle_target_power = np.zeros(n, dtype=np.int32)
+
+    @classmethod
+    def from_cards(cls, leader1: Card, deck1: List[Card], leader2: Card, deck2: List[Card], n: int,
+                   **kwargs) -> "BatchGame":
+        """Batch for leader / deck Cards as returned by load_deck_from_json (players p1 / p2)."""
+        leaders = [CardInstance(card_id=leader.id, instance_id=f"{pid}_leader", owner_id=pid,
+                                current_power=leader.power)
+                   for pid, leader in (("p1", leader1), ("p2", leader2))]
+        return cls(leaders[0], deck1, leaders[1], deck2, n, **kwargs)
+
+    # --- Setup ---
+
+    def reset(self, seeds: Optional[Sequence[int]] = None, rng: Optional[np.random.Generator] = None,
+              games: Optional[np.ndarray] = None):
+        """
+        Start games (Game.start_game rules).
+        seeds: one seed per game; game i shuffles exactly like Game(seed=seeds[i]).
+        rng: otherwise decks are shuffled in one vectorized call from this generator.
+        games: indices of the games to restart (default: all). Restarting the
+               finished games after each step keeps the whole batch busy.
+        """
+        g = self._rows if games is None else np.asarray(games, dtype=np.intp)
+        n = len(g)
+        if seeds is not None:
+            seeds = list(seeds)
+            if len(seeds) != n:
+                raise ValueError(f"Expected {n} seeds, got {len(seeds)}")
+        elif rng is None:
+            rng = np.random.default_rng()
+
+        for p, deck in enumerate(self.decks):
+            size = len(deck)
+            if seeds is None:
+                self.deck[g, p, :size] = rng.permuted(np.broadcast_to(deck, (n, size)), axis=1)
+            self.deck[g, p, size:] = -1
+            self.deck_len[g, p] = size
+        if seeds is not None:
+            for row, seed in zip(g, seeds):
+                shuffler = random.Random(seed)
+                for p, deck in enumerate(self.decks):
+                    order = deck.tolist()
+                    shuffler.shuffle(order)
+                    self.deck[row, p, :len(order)] = order
+
+        # Life: the first LIFE cards of the deck; hand: the next 5
+        self.life[g] = self.deck[g, :, :LIFE]
+        self.life_len[g] = np.minimum(self.deck_len[g], LIFE)
+        self.life_top[g] = 0
+        self.deck_top[g] = self.life_len[g]
+        self.hand[g] = -1
+        self.hand_len[g] = 0
+        self.trash[g] = -1
+        self.trash_len[g] = 0
+        for p in (0, 1):
+            self._draw(g, np.full(n, p), 5)
+
+        self.char_card[g] = -1
+        self.char_power[g] = 0
+        self.char_rested[g] = False
+        self.char_keywords[g] = 0
+        self.field_len[g] = 0
+        self.leader_power[g] = self.leader_base_power
+        self.leader_rested[g] = False
+        self.don_active[g] = 0
+        self.don_rested[g] = 0
+        self.turn[g] = 1
+        self.phase[g] = REFRESH
+        self.active[g] = 0
+        self.winner[g] = -1
+        self.battle_step[g] = NO_BATTLE
+
+    # --- Queries ---
+
+    @property
+    def done(self) -> np.ndarray:
+        finished = self.winner >= 0
+        if self.max_turns is not None:
+            finished |= self.turn > self.max_turns
+        return finished
+
+    def acting_player(self) -> np.ndarray:
+        """Player index deciding next in every game (the defender during BLOCK / COUNTER)."""
+        return np.where(self.battle_step != NO_BATTLE, 1 - self.active, self.active)
+
+    def legal_mask(self) -> np.ndarray:
+        """(N, NUM_ACTIONS) bool: the actions Game.get_valid_actions would offer."""
+        n = self.n
+        rows = self._rows
+        mask = np.zeros((n, NUM_ACTIONS), dtype=bool)
+        live = ~self.done
+        free = live & (self.battle_step == NO_BATTLE)
+        me = self.active
+        opp = 1 - me
+
+        mask[:, END_PHASE] = free
+        mask[:, PASS] = live & (self.battle_step != NO_BATTLE)
+
+        main = free & (self.phase == MAIN)
+
+        # Play: character card, a free slot and enough active DON!!
+        g = np.nonzero(main & (self.field_len[rows, me] < FIELD_SLOTS))[0]
+        p = me[g]
+        mask[g, PLAY:PLAY + MAX_CARDS] = self.cards.play_cost[self.hand[g, p]] <= self.don_active[g, p][:, None]
+
+        # Attack the opponent leader with any active leader / character
+        mask[:, ATTACK] = main & ~self.leader_rested[rows, me]
+        chars = np.arange(FIELD_SLOTS) < self.field_len[rows, me][:, None]
+        ready = chars & ~self.char_rested[rows, me] & main[:, None]
+        mask[:, ATTACK + (FIELD_SLOTS + 1) * np.arange(1, FIELD_SLOTS + 1)] = ready
+
+        # Block with an active BLOCKER of the defender
+        defender_chars = np.arange(FIELD_SLOTS) < self.field_len[rows, opp][:, None]
+        blockers = (defender_chars & ~self.char_rested[rows, opp]
+                    & (self.char_keywords[rows, opp] & KEYWORDS["BLOCKER"] != 0))
+        mask[:, BLOCK:BLOCK + FIELD_SLOTS] = blockers & (live & (self.battle_step == STEP_BLOCK))[:, None]
+
+        # Counter with any defender hand card that has a counter value
+        g = np.nonzero(live & (self.battle_step == STEP_COUNTER))[0]
+        mask[g, COUNTER:COUNTER + MAX_CARDS] = self.cards.can_counter[self.hand[g, opp[g]]]
+        return mask
+
+    def random_actions(self, rng: np.random.Generator, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """One uniformly random legal action per game (PASS for finished games, which ignore it)."""
+        mask = self.legal_mask() if mask is None else mask
+        counts = mask.sum(axis=1)
+        legal = np.flatnonzero(mask)            # row-major: each game's legal actions are contiguous
+        if not legal.size:
+            return np.full(self.n, PASS)
+        starts = np.cumsum(counts) - counts
+        picks = starts + (rng.random(self.n) * counts).astype(np.intp)
+        actions = legal[np.minimum(picks, len(legal) - 1)] - self._rows * NUM_ACTIONS
+        return np.where(counts > 0, actions, PASS)
+
+    # --- Stepping ---
+
+    def step(self, actions: np.ndarray, validate: bool = False):
+        """
+        Apply one action per game (finished games are skipped).
+        validate: raise ValueError if an action is not in legal_mask().
+        """
+        actions = np.asarray(actions)
+        live = ~self.done
+        if validate:
+            legal = self.legal_mask()[self._rows, actions]
+            if not legal[live].all():
+                raise ValueError(f"Illegal actions in games {np.nonzero(live & ~legal)[0].tolist()}")
+
+        groups = (
+            (actions == END_PHASE, self._end_phase),
+            (actions == PASS, self._pass),
+            ((actions >= PLAY) & (actions < ATTACK), self._play),
+            ((actions >= ATTACK) & (actions < BLOCK), self._attack),
+            ((actions >= BLOCK) & (actions < COUNTER), self._block),
+            (actions >= COUNTER, self._counter),
+        )
+        for selected, handler in groups:
+            g = np.nonzero(selected & live)[0]
+            if g.size:
+                handler(g, actions[g])
+
+    def _end_phase(self, g: np.ndarray, actions: np.ndarray):
+        phase = (self.phase[g] + 1) % len(PHASES)
+        self.phase[g] = phase
+        g = g[phase == REFRESH]
+        if not g.size:
+            return
+        # New turn for the other player: refresh, draw 1, DON!! +2 (max 10)
+        p = 1 - self.active[g]
+        self.active[g] = p
+        self.turn[g] += 1
+        self.leader_rested[g, p] = False
+        self.char_rested[g, p] = False
+        self.don_active[g, p] += self.don_rested[g, p]
+        self.don_rested[g, p] = 0
+        self._draw(g, p, 1)
+        self.don_active[g, p] += np.clip(MAX_DON - self.don_active[g, p], 0, 2).astype(np.int8)
+
+    def _play(self, g: np.ndarray, actions: np.ndarray):
+        p = self.active[g]
+        index = actions - PLAY
+        card = self.hand[g, p, index]
+        cost = self.cards.cost[card].astype(np.int8)
+        self.don_active[g, p] -= cost
+        self.don_rested[g, p] += cost
+        self._remove_from_hand(g, p, index)
+
+        slot = self.field_len[g, p].astype(np.intp)
+        self.char_card[g, p, slot] = card
+        self.char_power[g, p, slot] = self.cards.power[card]
+        self.char_rested[g, p, slot] = False
+        self.char_keywords[g, p, slot] = 0
+        self.field_len[g, p] += 1
+
+        # ON_PLAY program, one operation column at a time
+        for k in range(self.cards.op.shape[1]):
+            op = self.cards.op[card, k]
+            value = self.cards.value[card, k]
+            sel = op == OP_DRAW
+            if sel.any():
+                self._draw_each(g[sel], p[sel], value[sel])
+            sel = op == OP_TRASH
+            if sel.any():
+                self._trash_from_hand(g[sel], p[sel], value[sel])
+            sel = op == OP_KEYWORD
+            if sel.any():
+                self.char_keywords[g[sel], p[sel], slot[sel]] |= value[sel].astype(np.uint8)
+
+    def _attack(self, g: np.ndarray, actions: np.ndarray):
+        p = self.active[g]
+        attacker, target = np.divmod(actions - ATTACK, FIELD_SLOTS + 1)
+        attacker = attacker - 1
+        target = target - 1
+        by_leader = attacker == LEADER
+        chars = np.maximum(attacker, 0)
+
+        self.leader_rested[g[by_leader], p[by_leader]] = True
+        self.char_rested[g[~by_leader], p[~by_leader], attacker[~by_leader]] = True
+        self.battle_attacker_power[g] = np.where(by_leader, self.leader_power[g, p], self.char_power[g, p, chars])
+
+        opp = 1 - p
+        self.battle_target_power[g] = np.where(target == LEADER, self.leader_power[g, opp],
+                                               self.char_power[g, opp, np.maximum(target, 0)])
+        self.battle_attacker[g] = attacker
+        self.battle_target[g] = target
+        self.battle_step[g] = STEP_BLOCK
+
+    def _block(self, g: np.ndarray, actions: np.ndarray):
+        slot = actions - BLOCK
+        defender = 1 - self.active[g]
+        self.battle_target[g] = slot
+        self.battle_target_power[g] = self.char_power[g, defender, slot]
+        self.char_rested[g, defender, slot] = True
+        self.battle_step[g] = STEP_COUNTER
+
+    def _counter(self, g: np.ndarray, actions: np.ndarray):
+        index = actions - COUNTER
+        defender = 1 - self.active[g]
+        card = self.hand[g, defender, index]
+        self._remove_from_hand(g, defender, index)
+        bonus = self.cards.counter[card]
+        # The counter power stays on the target, as in Game (power_modifier)
+        target = self.battle_target[g]
+        on_leader = target == LEADER
+        self.leader_power[g[on_leader], defender[on_leader]] += bonus[on_leader]
+        self.char_power[g[~on_leader], defender[~on_leader], target[~on_leader]] += bonus[~on_leader]
+        self.battle_target_power[g] += bonus
+        self._trash(g, defender, card)
+
+    def _pass(self, g: np.ndarray, actions: np.ndarray):
+        blocking = self.battle_step[g] == STEP_BLOCK
+        self.battle_step[g[blocking]] = STEP_COUNTER
+        self._resolve(g[~blocking])
+
+    def _resolve(self, g: np.ndarray):
+        hit = self.battle_attacker_power[g] >= self.battle_target_power[g]
+        attacker = self.active[g]
+        defender = 1 - attacker
+        on_leader = self.battle_target[g] == LEADER
+
+        # Leader hit: top life card to hand, or the attacker wins at 0 life
+        sel = hit & on_leader
+        lg, ld = g[sel], defender[sel]
+        has_life = self.life_top[lg, ld] < self.life_len[lg, ld]
+        self._move_life_to_hand(lg[has_life], ld[has_life])
+        self.winner[lg[~has_life]] = attacker[sel][~has_life]
+
+        # Character hit: KO to trash
+        sel = hit & ~on_leader
+        if sel.any():
+            kg, kd, slot = g[sel], defender[sel], self.battle_target[g[sel]].astype(np.intp)
+            self._trash(kg, kd, self.char_card[kg, kd, slot])
+            for column in (self.char_card, self.char_power, self.char_rested, self.char_keywords):
+                self._remove_at(column, kg, kd, slot)
+            self.field_len[kg, kd] -= 1
+            self.char_card[kg, kd, self.field_len[kg, kd]] = -1
+
+        self.battle_step[g] = NO_BATTLE
+
+    # --- Zone helpers ---
+
+    def _draw(self, g: np.ndarray, p: np.ndarray, amount: int):
+        for _ in range(amount):
+            has = self.deck_top[g, p] < self.deck_len[g, p]
+            dg, dp = g[has], p[has]
+            self.hand[dg, dp, self.hand_len[dg, dp]] = self.deck[dg, dp, self.deck_top[dg, dp]]
+            self.hand_len[dg, dp] += 1
+            self.deck_top[dg, dp] += 1
+
+    def _draw_each(self, g: np.ndarray, p: np.ndarray, amounts: np.ndarray):
+        for k in range(int(amounts.max(initial=0))):
+            sel = amounts > k
+            self._draw(g[sel], p[sel], 1)
+
+    def _trash_from_hand(self, g: np.ndarray, p: np.ndarray, amounts: np.ndarray):
+        # Last cards of the hand, as EffectManager._action_trash_card
+        for k in range(int(amounts.max(initial=0))):
+            sel = (amounts > k) & (self.hand_len[g, p] > 0)
+            tg, tp = g[sel], p[sel]
+            self.hand_len[tg, tp] -= 1
+            last = self.hand_len[tg, tp]
+            self._trash(tg, tp, self.hand[tg, tp, last])
+            self.hand[tg, tp, last] = -1
+
+    def _remove_from_hand(self, g: np.ndarray, p: np.ndarray, index: np.ndarray):
+        self._remove_at(self.hand, g, p, index)
+        self.hand_len[g, p] -= 1
+        # Slots past the hand length stay -1 (legal_mask relies on it)
+        self.hand[g, p, self.hand_len[g, p]] = -1
+
+    def _trash(self, g: np.ndarray, p: np.ndarray, cards: np.ndarray):
+        self.trash[g, p, self.trash_len[g, p]] = cards
+        self.trash_len[g, p] += 1
+
+    def _move_life_to_hand(self, g: np.ndarray, p: np.ndarray):
+        self.hand[g, p, self.hand_len[g, p]] = self.life[g, p, self.life_top[g, p]]
+        self.hand_len[g, p] += 1
+        self.life_top[g, p] += 1
+
+    @staticmethod
+    def _remove_at(column: np.ndarray, g: np.ndarray, p: np.ndarray, index: np.ndarray):
+        """Delete entry `index` of column[g, p] shifting the rest left (list.pop(index))."""
+        rows = column[g, p]
+        width = rows.shape[1]
+        positions = np.arange(width)
+        source = np.minimum(positions + (positions >= index[:, None]), width - 1)
+        column[g, p] = np.take_along_axis(rows, source, axis=1)
+
+    # --- Inspection ---
+
+    def snapshot(self, g: int) -> Dict:
+        """Plain-Python view of game g (card ids per zone), for debugging and parity checks."""
+        card_id = lambda handle: self.registry.get(int(handle)).id
+        players = {}
+        for p, pid in enumerate(self.player_ids):
+            slots = range(self.field_len[g, p])
+            players[pid] = {
+                "hand": [card_id(c) for c in self.hand[g, p, :self.hand_len[g, p]]],
+                "deck": [card_id(c) for c in self.deck[g, p, self.deck_top[g, p]:self.deck_len[g, p]]],
+                "life": [card_id(c) for c in self.life[g, p, self.life_top[g, p]:self.life_len[g, p]]],
+                "trash": [card_id(c) for c in self.trash[g, p, :self.trash_len[g, p]]],
+                "characters": [(card_id(self.char_card[g, p, s]), int(self.char_power[g, p, s]),
+                                bool(self.char_rested[g, p, s]), int(self.char_keywords[g, p, s])) for s in slots],
+                "leader": (int(self.leader_power[g, p]), bool(self.leader_rested[g, p])),
+                "don": (int(self.don_active[g, p]), int(self.don_rested[g, p])),
+            }
+        battle = None
+        if self.battle_step[g] != NO_BATTLE:
+            battle = ("BLOCK" if self.battle_step[g] == STEP_BLOCK else "COUNTER",
+                      int(self.battle_attacker[g]), int(self.battle_target[g]),
+                      int(self.battle_attacker_power[g]), int(self.battle_target_power[g]))
+        winner = self.player_ids[self.winner[g]] if self.winner[g] >= 0 else None
+        return {"turn": int(self.turn[g]), "phase": PHASES[self.phase[g]],
+                "active": self.player_ids[self.active[g]], "winner": winner,
+                "battle": battle, "players": players}
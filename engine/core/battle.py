@@ -1,5 +1,6 @@
 from typing import Optional, List
 from pydantic import BaseModel
+from engine.utils.fast_copy import shallow_copy
 from engine.models.card import CardInstance
 
 class BattlePhase(BaseModel):
@@ -21,3 +22,6 @@ class BattlePhase(BaseModel):
     blocker_instance_id: Optional[str] = None
     counter_cards: List[str] = [] # Cards discarded for counter
     counter_power_bonus: int = 0
+
+    def clone(self) -> "BattlePhase":
+        return shallow_copy(self, counter_cards=self.counter_cards.copy())
@@ -1,160 +1,261 @@
+from typing import List, Optional, Tuple
+from time import perf_counter_ns
 from engine.state import GameState
-from engine.models.effect import Effect, EffectType
-from engine.models.card import CardInstance
+from engine.models.effect import Effect
+from engine.models.card import Card, CardInstance, KEYWORD_FLAGS
+from engine.core.effect_program import EffectProgram
+from engine.core.targeting import compile_filter
+from engine.core.triggers import TriggerIndex, STATIC_KEYWORDS
+from engine.data.registry import CardRegistry, get_card_registry, NO_HANDLE
+from engine.core.events import (
+    EventBus, CharacterKO, PowerBuffed, CardsDrawn, CardsTrashed, CardReturned, CostChanged, KeywordGranted,
+    EffectTriggered
+)
 
 class EffectManager:
     """
     Handles resolving effects against the Game State.
+    Effects run as compiled EffectPrograms (engine.core.effect_program): one
+    indexed call into the dispatch table below, with the target checked against
+    the compiled target_filter.
+
+    Cards in play are subscribed by trigger (engine.core.triggers): Game calls
+    enter_play / leave_play as instances come and go, and fire() for events.
     """
-    def __init__(self, game_state: GameState):
+    def __init__(self, game_state: GameState, registry: CardRegistry = None, events: EventBus = None):
         self.state = game_state
+        self.registry = registry if registry is not None else get_card_registry()
+        self.events = events if events is not None else EventBus()
+        # Indexed by EffectProgram.op; handler(program, player, source_id, target_id) -> bool
+        self._dispatch = (
+            self._action_none,
+            self._action_ko_character,
+            self._action_buff_power,
+            self._action_draw_card,
+            self._action_trash_card,
+            self._action_return_to_hand,
+            self._action_return_to_bottom_deck,
+            self._action_cost_change,
+            self._action_grant_keyword,
+        )
+        # Built from the cards in play on first use, so forks that never fire pay nothing
+        self._triggers: Optional[TriggerIndex] = None
+        # Profiling counters (engine.core.profiling), set by Game.enable_stats
+        self.stats = None
         
     def resolve_effect(self, effect: Effect, source_id: str, target_id: str = None) -> bool:
         """
         Execute an effect.
         Returns True if successful.
         """
-        # 1. Condition Check
-        player = self.state.players[self.state.active_player_id] # Assuming source is active player for now
-        
-        # Check Don condition
-        # (This logic assumes we pass the instance that has the effect, 
-        # but for simplicity we skip intricate condition checking for this POC)
-        
-        # 2. Execute Action
-        if effect.action_code == EffectType.KO_CHARACTER:
-            return self._action_ko_character(target_id)
-            
-        elif effect.action_code == EffectType.BUFF_POWER:
-            return self._action_buff_power(target_id, effect.action_power)
+        return self.run(self.registry.program_for(effect), source_id, target_id)
 
-        elif effect.action_code == EffectType.DRAW_CARD:
-            return self._action_draw_card(player, effect.action_value)
-            
-        elif effect.action_code == EffectType.TRASH_CARD:
-            return self._action_trash_card(player, effect.action_value)
-            
-        elif effect.action_code == EffectType.RETURN_TO_HAND:
-            return self._action_return_to_hand(target_id)
-            
-        elif effect.action_code == EffectType.RETURN_TO_BOTTOM_DECK:
-            return self._action_return_to_bottom_deck(target_id)
+    def run(self, program: EffectProgram, source_id: str, target_id: str = None,
+            controller_id: str = None) -> bool:
+        """
+        Execute a compiled effect. A target_id that does not satisfy the effect's
+        target_filter is rejected. Returns True if successful.
+        controller_id: player the effect belongs to (default: the active player).
+        """
+        # Condition checks (DON!! requirements) are not modelled yet
+        player = self.state.players[controller_id or self.state.active_player_id]
+        if target_id and program.target is not None and not self._is_target(program, player.id, source_id, target_id):
+            return False
+        stats = self.stats
+        if stats is None:
+            return self._dispatch[program.op](program, player, source_id, target_id)
+        start = perf_counter_ns()
+        done = self._dispatch[program.op](program, player, source_id, target_id)
+        stats.add_effect(program.effect.action_code.value, perf_counter_ns() - start)
+        return done
 
-        elif effect.action_code == EffectType.COST_CHANGE:
-            return self._action_cost_change(target_id, effect.action_value)
-            
-        elif effect.action_code == EffectType.RUSH:
-             # Apply to SELF (source_id) if target not specified, usually source
-             target = target_id if target_id else source_id
-             return self._action_grant_keyword(target, "RUSH")
-             
-        elif effect.action_code == EffectType.DOUBLE_ATTACK:
-             target = target_id if target_id else source_id
-             return self._action_grant_keyword(target, "DOUBLE_ATTACK")
-             
-        elif effect.action_code == EffectType.BLOCKER:
-             target = target_id if target_id else source_id
-             return self._action_grant_keyword(target, "BLOCKER")
-            
+    def valid_targets(self, program: EffectProgram, source_id: str = None) -> List[CardInstance]:
+        """Cards in play the effect may target (everything in play if it has no target_filter)."""
+        target = program.target if program.target is not None else compile_filter("")
+        return target.targets(self.state, self.registry, self.state.active_player_id, source_id)
+
+    def _is_target(self, program: EffectProgram, controller_id: str, source_id: str, target_id: str) -> bool:
+        location = self.state.locate_instance(target_id)
+        if location is None:
+            return False
+        instance = self.state.find_instance(target_id)
+        return program.target.matches(self.registry, controller_id, source_id, instance, location.zone)
+
+    # --- Trigger subscriptions ---
+
+    @property
+    def triggers(self) -> TriggerIndex:
+        if self._triggers is None:
+            self._triggers = TriggerIndex()
+            for player in self.state.players.values():
+                if player.leader:
+                    self._triggers.add(player.leader.instance_id, self._programs_of(player.leader))
+                for char in player.field.character_area:
+                    self._triggers.add(char.instance_id, self._programs_of(char))
+        return self._triggers
+
+    def _programs_of(self, instance: CardInstance) -> Tuple[EffectProgram, ...]:
+        handle = instance.card_handle
+        if handle == NO_HANDLE:
+            handle = self.registry.handle_of(instance.card_id)
+            if handle is None:
+                return ()
+        return self.registry.programs[handle]
+
+    def enter_play(self, instance: CardInstance):
+        """
+        Subscribe a card that just entered play, and give it its printed keywords
+        ([Blocker], [Rush], ...) as keyword_flags.
+        """
+        programs = self._programs_of(instance)
+        for program in programs:
+            if program.trigger in STATIC_KEYWORDS:
+                self._action_grant_keyword(program, None, instance.instance_id, None)
+        if self._triggers is not None:
+            self._triggers.add(instance.instance_id, programs)
+
+    def leave_play(self, instance_id: str):
+        if self._triggers is not None:
+            self._triggers.remove(instance_id)
+
+    def fire(self, trigger: str, instance_id: str, controller_id: str = None) -> int:
+        """
+        Resolve the programs the card in play instance_id has for trigger
+        (e.g. 'WHEN_ATTACKING' for the attacker). Returns how many ran.
+        """
+        triggers = self.triggers
+        if instance_id not in triggers:
+            # Put into play by direct zone edits: subscribe it now
+            instance = self.state.find_instance(instance_id)
+            if instance is None:
+                return 0
+            triggers.add(instance_id, self._programs_of(instance))
+        programs = triggers.programs(trigger, instance_id)
+        for program in programs:
+            if self.events.enabled:
+                instance = self.state.find_instance(instance_id)
+                card = self.registry.card_for(instance) if instance else None
+                self.events.emit(EffectTriggered(trigger, card.name if card else instance_id, instance_id))
+            self.run(program, instance_id, controller_id=controller_id)
+        return len(programs)
+
+    def fire_all(self, trigger: str, controller_id: str = None) -> int:
+        """Resolve trigger for every card in play listening for it. Returns how many programs ran."""
+        ran = 0
+        for instance_id in list(self.triggers.subscribed(trigger)):
+            ran += self.fire(trigger, instance_id, controller_id)
+        return ran
+
+    def fire_card(self, trigger: str, card: Card, controller_id: str) -> int:
+        """Resolve trigger for a card that is not in play (e.g. [Trigger] of a life card)."""
+        ran = 0
+        for program in self.registry.programs[self.registry.register(card)]:
+            if program.trigger == trigger:
+                if self.events.enabled:
+                    self.events.emit(EffectTriggered(trigger, card.name, card.id))
+                self.run(program, None, controller_id=controller_id)
+                ran += 1
+        return ran
+
+    # --- Handlers (dispatch table) ---
+    # All take (program, player, source_id, target_id); player is the controller.
+
+    def _action_none(self, program, player, source_id, target_id) -> bool:
         return False
 
-    def _action_ko_character(self, target_id: str) -> bool:
+    def _action_ko_character(self, program, player, source_id, target_id) -> bool:
         if not target_id: 
             return False
             
-        # Find who owns the target
-        # Simplified: scan both players
-        for pid, player in self.state.players.items():
-            removed = player.field.remove_character(target_id)
-            if removed:
-                # In a real implementation, we'd convert Instance back to Card or keeping Instance in trash?
-                # For now let's just assume we store the base Card definition in trash
-                # But wait, Player.trash expects List[Card]. CardInstance has .card_id.
-                # We need to lookup the card definition or just store instance if Trash supports it.
-                # Player model says 'trash: List[Card]'. 
-                # Let's find the card definition from a global registry or similar?
-                # ERROR: We don't have easy access to Card DB here. 
-                # HACK: Create a dummy card or just append to list if python allows mixed types (it does but bad practice)
-                # BETTER: Player.trash should store CardInstances or we need a way to get Card.
-                # For this step, I will just append the removed instance and fix types later if needed, 
-                # OR assumes player.trash accepts instances.
-                # Checking Player model: trash: List[Card].
-                # Let's just do nothing with trash for now to avoid Type Error, just remove from field.
-                print(f"  [Effect] KO {target_id}")
-                return True
+        removed = self.state.remove_character(target_id)
+        if removed:
+            self.leave_play(target_id)
+            card = self.registry.card_for(removed)
+            if card:
+                self.state.add_card(removed.owner_id, 'trash', card)
+            if self.events.enabled:
+                self.events.emit(CharacterKO(removed.owner_id, target_id, 'effect'))
+            return True
         return False
 
-    def _action_buff_power(self, target_id: str, power: int) -> bool:
+    def _action_buff_power(self, program, player, source_id, target_id) -> bool:
         if not target_id:
             return False
+        power = program.power
             
-        # Find target
-        for pid, player in self.state.players.items():
-            if player.leader and player.leader.instance_id == target_id:
-                player.leader.power_modifier += power
-                print(f"  [Effect] Buff {target_id} +{power}")
-                return True
-            for char in player.field.character_area:
-                if char.instance_id == target_id:
-                    char.power_modifier += power
-                    print(f"  [Effect] Buff {target_id} +{power}")
-                    return True
+        target = self.state.find_instance(target_id)
+        if target:
+            self.state.update_instance(target, power_modifier=target.power_modifier + power)
+            if self.events.enabled:
+                self.events.emit(PowerBuffed(target_id, power))
+            return True
         return False
 
-    def _action_draw_card(self, player, amount: int) -> bool:
-        player.draw_card(amount)
-        print(f"  [Effect] Player {player.id} drew {amount} cards")
+    def _action_draw_card(self, program, player, source_id, target_id) -> bool:
+        amount = program.value
+        self.state.draw_cards(player.id, amount)
+        if self.events.enabled:
+            self.events.emit(CardsDrawn(player.id, amount))
         return True
 
-    def _action_trash_card(self, player, amount: int) -> bool:
+    def _action_trash_card(self, program, player, source_id, target_id) -> bool:
+        amount = program.value
         # Simplified: Trash random or last cards? Usually player chooses.
         # For AI/Sim, let's trash from end of hand list.
         for _ in range(amount):
             if player.hand:
-                card = player.hand.pop()
-                player.trash.append(card)
-        print(f"  [Effect] Player {player.id} trashed {amount} cards")
+                card = self.state.pop_card(player.id, 'hand')
+                self.state.add_card(player.id, 'trash', card)
+        if self.events.enabled:
+            self.events.emit(CardsTrashed(player.id, amount))
         return True
 
-    def _action_return_to_hand(self, target_id: str) -> bool:
+    def _action_return_to_hand(self, program, player, source_id, target_id) -> bool:
         if not target_id: return False
-        for pid, player in self.state.players.items():
-            removed = player.field.remove_character(target_id)
-            if removed:
-                # We need the Card object to return to hand. 
-                # CardInstance.card_id -> We need a lookup or store Card object in Instance.
-                # Currently CardInstance doesn't allow easy reverse lookup without the DB.
-                # BIG GLUE ISSUE: CardInstance only has card_id string.
-                # FIX: Temporarily we can't put it back in Hand as 'Card' object without DB.
-                # We will log it. In real game, we need Instance -> Card mapping.
-                print(f"  [Effect] Return {target_id} to hand (Logic incomplete due to Instance-Card gap)")
-                return True
+        removed = self.state.remove_character(target_id)
+        if removed:
+            self.leave_play(target_id)
+            card = self.registry.card_for(removed)
+            if card:
+                self.state.add_card(removed.owner_id, 'hand', card)
+            if self.events.enabled:
+                self.events.emit(CardReturned(target_id, 'hand'))
+            return True
         return False
         
-    def _action_return_to_bottom_deck(self, target_id: str) -> bool:
+    def _action_return_to_bottom_deck(self, program, player, source_id, target_id) -> bool:
         if not target_id: return False
-        for pid, player in self.state.players.items():
-            removed = player.field.remove_character(target_id)
-            if removed:
-                print(f"  [Effect] Return {target_id} to bottom deck")
-                return True
+        removed = self.state.remove_character(target_id)
+        if removed:
+            self.leave_play(target_id)
+            card = self.registry.card_for(removed)
+            if card:
+                self.state.add_card(removed.owner_id, 'deck', card)
+            if self.events.enabled:
+                self.events.emit(CardReturned(target_id, 'bottom_deck'))
+            return True
         return False
 
-    def _action_cost_change(self, target_id: str, amount: int) -> bool:
-        for pid, player in self.state.players.items():
-            for char in player.field.character_area:
-                if char.instance_id == target_id:
-                    char.cost_modifier += amount
-                    print(f"  [Effect] Cost Change {target_id} by {amount} -> New Mod: {char.cost_modifier}")
-                    return True
+    def _action_cost_change(self, program, player, source_id, target_id) -> bool:
+        amount = program.value
+        char = self.state.find_instance(target_id, zone='character')
+        if char:
+            self.state.update_instance(char, cost_modifier=char.cost_modifier + amount)
+            if self.events.enabled:
+                self.events.emit(CostChanged(target_id, amount, char.cost_modifier))
+            return True
         return False
         
-    def _action_grant_keyword(self, target_id: str, keyword: str) -> bool:
-        for pid, player in self.state.players.items():
-            for char in player.field.character_area:
-                if char.instance_id == target_id:
-                    if keyword not in char.granted_keywords:
-                       char.granted_keywords.append(keyword)
-                    print(f"  [Effect] Granted {keyword} to {target_id}")
-                    return True
+    def _action_grant_keyword(self, program, player, source_id, target_id) -> bool:
+        # Apply to SELF (source_id) if target not specified, usually source
+        target_id = target_id if target_id else source_id
+        keyword = program.keyword
+        char = self.state.find_instance(target_id, zone='character')
+        if char:
+            if keyword not in char.granted_keywords:
+               self.state.update_instance(char, granted_keywords=char.granted_keywords + [keyword],
+                                          keyword_flags=char.keyword_flags | KEYWORD_FLAGS.get(keyword, 0))
+            if self.events.enabled:
+                self.events.emit(KeywordGranted(target_id, keyword))
+            return True
         return False
@@ -0,0 +1,86 @@
+"""
+Effects compiled into small executable programs.
+
+compile_effect() turns an Effect into an EffectProgram once: the handler slot
+(an index into EffectManager's dispatch table), the compiled target predicate
+(engine.core.targeting) and the resolved parameters. EffectManager.run() is then
+one indexed call; nothing re-reads the Effect model during play.
+
+CardRegistry compiles the effects of every definition it registers, so cards
+loaded through the registry carry their programs from load time on
+(CardRegistry.programs[handle]). Effects resolved on their own are compiled once
+per distinct value (CardRegistry.program_for).
+"""
+from typing import Optional, Tuple
+
+from engine.models.effect import Effect, EffectType
+from engine.core.targeting import TargetFilter, compile_filter
+
+# Handler slots of EffectManager's dispatch table
+(OP_NONE, OP_KO, OP_BUFF_POWER, OP_DRAW, OP_TRASH, OP_RETURN_TO_HAND, OP_RETURN_TO_BOTTOM_DECK,
+ OP_COST_CHANGE, OP_GRANT_KEYWORD) = range(9)
+
+_OPS = {
+    EffectType.KO_CHARACTER: OP_KO,
+    EffectType.BUFF_POWER: OP_BUFF_POWER,
+    EffectType.DRAW_CARD: OP_DRAW,
+    EffectType.TRASH_CARD: OP_TRASH,
+    EffectType.RETURN_TO_HAND: OP_RETURN_TO_HAND,
+    EffectType.RETURN_TO_BOTTOM_DECK: OP_RETURN_TO_BOTTOM_DECK,
+    EffectType.COST_CHANGE: OP_COST_CHANGE,
+    EffectType.RUSH: OP_GRANT_KEYWORD,
+    EffectType.DOUBLE_ATTACK: OP_GRANT_KEYWORD,
+    EffectType.BLOCKER: OP_GRANT_KEYWORD,
+    EffectType.BANISH: OP_GRANT_KEYWORD,
+}
+
+
+class EffectProgram:
+    """
+    op:        handler slot (OP_*); OP_NONE for actions the engine does not implement
+    trigger:   when the effect fires (Effect.type, e.g. 'ON_PLAY')
+    target:    compiled target_filter, or None
+    power / value / keyword: resolved parameters
+    effect:    the source Effect (descriptions, events)
+    """
+    __slots__ = ('op', 'trigger', 'target', 'power', 'value', 'keyword', 'effect')
+
+    def __init__(self, op: int, trigger: str, target: Optional[TargetFilter], power: int, value: int,
+                 keyword: Optional[str], effect: Effect):
+        self.op = op
+        self.trigger = trigger
+        self.target = target
+        self.power = power
+        self.value = value
+        self.keyword = keyword
+        self.effect = effect
+
+    def __reduce__(self):
+        return compile_effect, (self.effect,)
+
+    def __repr__(self) -> str:
+        return f"EffectProgram(op={self.op}, trigger={self.trigger}, target={self.target})"
+
+
+def compile_effect(effect: Effect) -> EffectProgram:
+    code = effect.action_code
+    op = _OPS.get(code, OP_NONE)
+    return EffectProgram(
+        op=op,
+        trigger=effect.type.value,
+        target=compile_filter(effect.target_filter),
+        power=effect.action_power,
+        value=effect.action_value,
+        keyword=code.value if op == OP_GRANT_KEYWORD else None,
+        effect=effect,
+    )
+
+
+def compile_card(card) -> Tuple[EffectProgram, ...]:
+    """Programs of a Card's effect_list, in order."""
+    return tuple(compile_effect(effect) for effect in card.effect_list)
+
+
+def effect_key(effect: Effect) -> tuple:
+    """Hashable value of an Effect (Effect models are mutable, so not hashable themselves)."""
+    return tuple(effect.__dict__.values())
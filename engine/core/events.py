@@ -0,0 +1,289 @@
+"""
+Structured engine events.
+
+Game and EffectManager report what happens through an EventBus instead of
+print(). Sinks decide what to do with the events:
+
+- no sink attached : nothing is built or formatted (call sites check bus.enabled)
+- ConsoleSink      : the human-readable log the engine used to print
+- JsonlSink        : one JSON object per line, for tools / log analysis
+- RecordingSink    : keeps the events in a list (tests, replays)
+
+Usage:
+    game = Game(p1, p2, events=EventBus([ConsoleSink()]))
+"""
+import json
+import sys
+from dataclasses import dataclass, asdict
+from typing import IO, List, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class GameEvent:
+    def message(self) -> str:
+        return type(self).__name__
+
+
+# --- Turn / Resources ---
+
+@dataclass(frozen=True, slots=True)
+class TurnStarted(GameEvent):
+    turn: int
+    player_id: str
+
+    def message(self) -> str:
+        return f"    [Turn Start] Turn {self.turn}: {self.player_id}"
+
+
+@dataclass(frozen=True, slots=True)
+class DonGained(GameEvent):
+    player_id: str
+    amount: int
+    total: int
+
+    def message(self) -> str:
+        return f"    [Turn Start] {self.player_id} gains {self.amount} DON!! (Total: {self.total})"
+
+
+@dataclass(frozen=True, slots=True)
+class ActionFailed(GameEvent):
+    player_id: str
+    reason: str
+
+    def message(self) -> str:
+        return f"    [Action Failed] {self.reason}"
+
+
+# --- Main Phase ---
+
+@dataclass(frozen=True, slots=True)
+class CardPlayed(GameEvent):
+    player_id: str
+    card_id: str
+    card_name: str
+    cost: int
+    instance_id: str
+
+    def message(self) -> str:
+        return f"    [Play] {self.card_name} (Cost: {self.cost})"
+
+
+@dataclass(frozen=True, slots=True)
+class EffectTriggered(GameEvent):
+    trigger: str
+    card_name: str
+    instance_id: str
+
+    def message(self) -> str:
+        return f"    [Effect] Triggering {self.trigger} for {self.card_name}"
+
+
+# --- Battle ---
+
+@dataclass(frozen=True, slots=True)
+class AttackDeclared(GameEvent):
+    player_id: str
+    attacker_instance_id: str
+    target_instance_id: str
+    attacker_power: int
+    target_power: int
+
+    def message(self) -> str:
+        return f"    [Engine] {self.attacker_instance_id} attacks {self.target_instance_id}! (Battle Started)"
+
+
+@dataclass(frozen=True, slots=True)
+class BlockDeclared(GameEvent):
+    player_id: str
+    blocker_instance_id: str
+    target_power: int
+
+    def message(self) -> str:
+        return f"    [Battle] Blocked by {self.blocker_instance_id}! New Target: {self.blocker_instance_id}"
+
+
+@dataclass(frozen=True, slots=True)
+class CounterPlayed(GameEvent):
+    player_id: str
+    card_name: str
+    counter_power: int
+    target_power: int
+
+    def message(self) -> str:
+        return f"    [Battle] Counter by {self.card_name} (+{self.counter_power}) -> Target Power: {self.target_power}"
+
+
+@dataclass(frozen=True, slots=True)
+class BattleResolved(GameEvent):
+    attacker_power: int
+    target_power: int
+    hit: bool
+
+    def message(self) -> str:
+        text = f"    [Battle] Resolve: {self.attacker_power} vs {self.target_power}"
+        if not self.hit:
+            text += "\n    [Battle] Attack Failed (Not enough power)"
+        return text
+
+
+@dataclass(frozen=True, slots=True)
+class LifeLost(GameEvent):
+    player_id: str
+    card_name: str
+    remaining: int
+
+    def message(self) -> str:
+        return f"    [Battle] Hit Leader! Life -> Hand: {self.card_name}"
+
+
+@dataclass(frozen=True, slots=True)
+class GameWon(GameEvent):
+    winner_id: str
+
+    def message(self) -> str:
+        return f"    [Battle] WINNER: {self.winner_id}"
+
+
+@dataclass(frozen=True, slots=True)
+class CharacterKO(GameEvent):
+    owner_id: str
+    instance_id: str
+    source: str  # 'battle' or 'effect'
+
+    def message(self) -> str:
+        if self.source == 'battle':
+            return f"    [Battle] KO Character: {self.instance_id}"
+        return f"  [Effect] KO {self.instance_id}"
+
+
+# --- Effects ---
+
+@dataclass(frozen=True, slots=True)
+class PowerBuffed(GameEvent):
+    instance_id: str
+    amount: int
+
+    def message(self) -> str:
+        return f"  [Effect] Buff {self.instance_id} +{self.amount}"
+
+
+@dataclass(frozen=True, slots=True)
+class CardsDrawn(GameEvent):
+    player_id: str
+    amount: int
+
+    def message(self) -> str:
+        return f"  [Effect] Player {self.player_id} drew {self.amount} cards"
+
+
+@dataclass(frozen=True, slots=True)
+class CardsTrashed(GameEvent):
+    player_id: str
+    amount: int
+
+    def message(self) -> str:
+        return f"  [Effect] Player {self.player_id} trashed {self.amount} cards"
+
+
+@dataclass(frozen=True, slots=True)
+class CardReturned(GameEvent):
+    instance_id: str
+    destination: str  # 'hand' or 'bottom_deck'
+
+    def message(self) -> str:
+        if self.destination == 'hand':
+            return f"  [Effect] Return {self.instance_id} to hand"
+        return f"  [Effect] Return {self.instance_id} to bottom deck"
+
+
+@dataclass(frozen=True, slots=True)
+class CostChanged(GameEvent):
+    instance_id: str
+    amount: int
+    cost_modifier: int
+
+    def message(self) -> str:
+        return f"  [Effect] Cost Change {self.instance_id} by {self.amount} -> New Mod: {self.cost_modifier}"
+
+
+@dataclass(frozen=True, slots=True)
+class KeywordGranted(GameEvent):
+    instance_id: str
+    keyword: str
+
+    def message(self) -> str:
+        return f"  [Effect] Granted {self.keyword} to {self.instance_id}"
+
+
+# --- Sinks ---
+
+class EventSink:
+    def handle(self, event: GameEvent):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class ConsoleSink(EventSink):
+    """
+    Human-readable log (the format the engine used to print).
+    """
+    def __init__(self, stream: Optional[IO[str]] = None):
+        self.stream = stream
+
+    def handle(self, event: GameEvent):
+        print(event.message(), file=self.stream or sys.stdout)
+
+
+class JsonlSink(EventSink):
+    """
+    Writes one JSON object per event: {"event": "CardPlayed", ...fields}.
+    """
+    def __init__(self, path: str):
+        self.file = open(path, 'a', encoding='utf-8')
+
+    def handle(self, event: GameEvent):
+        record = {"event": type(event).__name__}
+        record.update(asdict(event))
+        self.file.write(json.dumps(record) + "\n")
+
+    def close(self):
+        self.file.close()
+
+
+class RecordingSink(EventSink):
+    def __init__(self):
+        self.events: List[GameEvent] = []
+
+    def handle(self, event: GameEvent):
+        self.events.append(event)
+
+
+class EventBus:
+    """
+    Fans events out to the attached sinks.
+    Emitters must guard with `if bus.enabled:` so that, with no sink attached,
+    no event object is ever created.
+    """
+    __slots__ = ('sinks', 'enabled')
+
+    def __init__(self, sinks: Optional[List[EventSink]] = None):
+        self.sinks: List[EventSink] = list(sinks) if sinks else []
+        self.enabled = bool(self.sinks)
+
+    def attach(self, sink: EventSink):
+        self.sinks.append(sink)
+        self.enabled = True
+
+    def detach(self, sink: EventSink):
+        self.sinks.remove(sink)
+        self.enabled = bool(self.sinks)
+
+    def emit(self, event: GameEvent):
+        for sink in self.sinks:
+            sink.handle(event)
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
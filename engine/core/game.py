@@ -1,19 +1,43 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 import random
+from time import perf_counter_ns
+import numpy as np
 from engine.state import GameState, PhaseType
 from engine.core.phases import PhaseManager, Phase
-from engine.core.actions import GameAction, PlayCardAction, AttackAction, EndTurnAction, BlockAction, CounterAction, ResolveBattleAction
+from engine.core.actions import GameAction
+from engine.core.action_space import (
+    FIELD_SLOTS, MAX_CARDS, END_PHASE, PASS, PLAY, ATTACK, BLOCK, COUNTER, NUM_ACTIONS,
+    acting_player_id, action_type, attack_index, action_mask, decode_action
+)
 from engine.models.player import Player
-from engine.models.card import CardInstance
+from engine.models.card import CardInstance, KEYWORD_FLAGS
 from engine.core.battle import BattlePhase
 from engine.core.effect_manager import EffectManager
+from engine.data.registry import CardRegistry, get_card_registry
+from engine.utils.seeding import make_rng
+from engine.snapshot import snapshot, restore
+from engine.core.profiling import GameStats
+from engine.core.events import (
+    EventBus, TurnStarted, DonGained, ActionFailed, CardPlayed, AttackDeclared,
+    BlockDeclared, CounterPlayed, BattleResolved, LifeLost, GameWon, CharacterKO
+)
+
+_BLOCKER = KEYWORD_FLAGS['BLOCKER']
 
 class Game:
     """
     The main controller for the One Piece Card Game engine.
     Manages state transitions and rule enforcement.
     """
-    def __init__(self, player1: Player, player2: Player):
+    def __init__(self, player1: Player, player2: Player, registry: Optional[CardRegistry] = None,
+                 events: Optional[EventBus] = None, seed: Optional[int] = None,
+                 rng: Optional[random.Random] = None, auto_advance: bool = False):
+        """
+        seed / rng: source of randomness for this game only (deck shuffles).
+        The same seed always produces the same game for the same actions.
+        auto_advance: play forced decisions internally (see advance_forced), so
+        callers only see positions with a real choice.
+        """
         self.state = GameState(
             active_player_id=player1.id,
             players={
@@ -21,19 +45,94 @@ class Game:
                 player2.id: player2
             }
         )
+        self.registry = registry if registry is not None else get_card_registry()
+        # Silent unless a sink is attached (see engine.core.events)
+        self.events = events if events is not None else EventBus()
+        self._rng = make_rng(seed, rng)
+        self._rng_seed = None
         self.phase_manager = PhaseManager()
-        self.effect_manager = EffectManager(self.state)
-        
-    def start_game(self):
+        self.effect_manager = EffectManager(self.state, self.registry, self.events)
+        self.auto_advance = auto_advance
+        self.forced_actions = 0
+        # Profiling counters (see enable_stats); None = off
+        self.stats: Optional[GameStats] = None
+
+    @classmethod
+    def from_state(cls, state: GameState, registry: Optional[CardRegistry] = None,
+                   events: Optional[EventBus] = None, seed: Optional[int] = None,
+                   rng: Optional[random.Random] = None, auto_advance: bool = False) -> "Game":
+        """
+        Build a Game controller around an existing state (no setup is performed).
+        """
+        game = cls.__new__(cls)
+        game.state = state
+        game.registry = registry if registry is not None else get_card_registry()
+        game.events = events if events is not None else EventBus()
+        # The generator is created on first use: forks rarely need one.
+        game._rng = rng
+        game._rng_seed = seed
+        game.phase_manager = PhaseManager()
+        game.effect_manager = EffectManager(state, game.registry, game.events)
+        game.auto_advance = auto_advance
+        game.forced_actions = 0
+        game.stats = None
+        return game
+
+    def fork(self) -> "Game":
+        """
+        Branch the game: returns an independent Game on a cloned state.
+        Actions processed on the fork never affect this game.
+        Forks get a silent event bus so lookahead does not pollute the game log.
+        """
+        # The fork's stream is seeded from ours, so search stays reproducible.
+        return Game.from_state(self.state.clone(), self.registry, seed=self.rng.getrandbits(64),
+                               auto_advance=self.auto_advance)
+
+    def enable_stats(self, stats: Optional[GameStats] = None) -> GameStats:
+        """
+        Collect profiling counters (engine.core.profiling) for this game, into stats
+        if given (share one GameStats to aggregate games). Forks are not profiled.
+        """
+        self.stats = stats if stats is not None else GameStats()
+        self.effect_manager.stats = self.stats
+        return self.stats
+
+    def snapshot(self) -> bytes:
+        """Binary checkpoint of the game state (engine.snapshot); see Game.restore()."""
+        return snapshot(self.state, self.registry)
+
+    @classmethod
+    def restore(cls, blob: bytes, registry: Optional[CardRegistry] = None, events: Optional[EventBus] = None,
+                seed: Optional[int] = None, auto_advance: bool = False) -> "Game":
+        """
+        Game around the state of a snapshot(). The RNG is not part of a snapshot:
+        pass seed to make what follows reproducible.
+        """
+        registry = registry if registry is not None else get_card_registry()
+        return cls.from_state(restore(blob, registry), registry, events, seed, auto_advance=auto_advance)
+
+    @property
+    def rng(self) -> random.Random:
+        if self._rng is None:
+            self._rng = make_rng(self._rng_seed)
+        return self._rng
+
+    def start_game(self, deck_seeds: Optional[Dict[str, int]] = None):
         """
         Initial setup: 
         1. Shuffle Decks (Standard 50 cards)
         2. Set Life (Take top cards from deck to life area) - Default 5 or based on Leader
         3. Draw Hand (5 cards)
+        deck_seeds: player id -> seed of that deck's own shuffle, independent of the
+        seat it plays from (common random numbers, see tournament_runner.run_paired_game).
+        Decks without one are shuffled by the game rng.
         """
         for player in self.state.players.values():
             # 1. Shuffle
-            random.shuffle(player.deck)
+            if deck_seeds and player.id in deck_seeds:
+                random.Random(deck_seeds[player.id]).shuffle(player.deck)
+            else:
+                self.rng.shuffle(player.deck)
             
             # 2. Set Life (Default 5 for now)
             # In real game, life depends on Leader. We assume 5 if not specified.
@@ -47,52 +146,126 @@ class Game:
             
             # 3. Draw Hand (5 Cards)
             player.draw_card(amount=5)
+        # Bulk setup edits zones directly
+        self.state.invalidate_hash()
+        if self.auto_advance:
+            self.advance_forced()
         
-    def process_action(self, action: GameAction) -> bool:
+    def process_action(self, action: Union[GameAction, int]) -> bool:
         """
         Process a player's action. Returns True if valid and executed.
+        action: a GameAction, or its index in the integer action space
+        (engine.core.action_space), which skips building the pydantic object.
         """
-        # 1. Validate Player
-        expected_player = self.state.active_player_id
-        
-        # Exception: Battle Steps (Block/Counter)
-        if self.state.current_battle:
-            battle = self.state.current_battle
-            if battle.current_step in ['BLOCK', 'COUNTER']:
-                expected_player = self.state.get_opponent(battle.attacker_id).id
-                
-        if action.player_id != expected_player:
+        stats = self.stats
+        if stats is not None:
+            phase = self.state.current_phase
+            start = perf_counter_ns()
+        if isinstance(action, GameAction):
+            done = self._process(action)
+            if stats is not None:
+                stats.add_action(action.action_type, phase, perf_counter_ns() - start)
+        else:
+            index = int(action)
+            done = self._process_index(index)
+            if stats is not None:
+                stats.add_action(action_type(index), phase, perf_counter_ns() - start)
+        if done and self.auto_advance:
+            self.advance_forced()
+        return done
+
+    def advance_forced(self) -> int:
+        """
+        Play the forced decisions ahead: END_PHASE of the REFRESH / DRAW / DON / END
+        phases and RESOLVE_BATTLE of battle steps with nothing to block or counter
+        with. Stops at the first position with more than one legal action, or in
+        MAIN_PHASE (ending it is a choice). Returns the number of actions played;
+        forced_actions keeps the total.
+        """
+        state = self.state
+        stats = self.stats
+        played = 0
+        while not state.winner_id and (state.current_battle or state.current_phase != 'MAIN_PHASE'):
+            if stats is None:
+                actions = self.legal_actions()
+                if len(actions) != 1:
+                    break
+                self._process_index(actions[0])
+            else:
+                start = perf_counter_ns()
+                actions = self.legal_actions()
+                stats.legal_actions.add(perf_counter_ns() - start)
+                if len(actions) != 1:
+                    break
+                phase = state.current_phase
+                start = perf_counter_ns()
+                self._process_index(actions[0])
+                stats.add_action(action_type(actions[0]), phase, perf_counter_ns() - start)
+            played += 1
+        self.forced_actions += played
+        return played
+
+    def _process(self, action: GameAction) -> bool:
+        # 1. Validate Player (the defender answers BLOCK / COUNTER)
+        if action.player_id != acting_player_id(self.state):
             return False
             
         # 2. Handle Action based on Type
-        if action.action_type == 'END_PHASE':
+        kind = action.action_type
+        if kind == 'END_PHASE':
             return self._handle_end_phase()
-            
-        elif action.action_type == 'PLAY_CARD':
-            if isinstance(action, PlayCardAction):
-                return self._handle_play_card(action)
-                
-        elif action.action_type == 'ATTACK':
-            if isinstance(action, AttackAction):
-                return self._handle_attack(action)
-        
-        elif action.action_type == 'BLOCK':
-            # TODO: Implement Block Logic
-            return self._handle_block(action)
-            
-        elif action.action_type == 'COUNTER':
-             # TODO: Implement Counter Logic
-             return self._handle_counter(action)
-             
-        elif action.action_type == 'RESOLVE_BATTLE':
-             # If in BLOCK step, passing means going to COUNTER step
-             if self.state.current_battle and self.state.current_battle.current_step == 'BLOCK':
-                 self.state.current_battle.current_step = 'COUNTER'
-                 return True
-             # If in COUNTER step, passing means finishing battle
-             return self._resolve_battle()
-                
+        elif kind == 'PLAY_CARD':
+            return self._handle_play_card(action.card_hand_index)
+        elif kind == 'ATTACK':
+            return self._handle_attack(action.attacker_instance_id, action.target_instance_id)
+        elif kind == 'BLOCK':
+            return self._handle_block(action.player_id, action.blocker_instance_id)
+        elif kind == 'COUNTER':
+            return self._handle_counter(action.player_id, action.card_hand_index)
+        elif kind == 'RESOLVE_BATTLE':
+            return self._handle_pass()
         return False
+
+    def _process_index(self, index: int) -> bool:
+        state = self.state
+        if index == END_PHASE:
+            return self._handle_end_phase()
+        if index == PASS:
+            return self._handle_pass()
+        player_id = acting_player_id(state)
+        if PLAY <= index < ATTACK:
+            return self._handle_play_card(index - PLAY)
+        if ATTACK <= index < BLOCK:
+            if state.current_battle:
+                return False
+            attacker, target = divmod(index - ATTACK, FIELD_SLOTS + 1)
+            attacker_id = self._board_instance_id(state.players[player_id], attacker)
+            target_id = self._board_instance_id(state.get_opponent(player_id), target)
+            if attacker_id is None or target_id is None:
+                return False
+            return self._handle_attack(attacker_id, target_id)
+        if BLOCK <= index < COUNTER:
+            area = state.players[player_id].field.character_area
+            slot = index - BLOCK
+            return slot < len(area) and self._handle_block(player_id, area[slot].instance_id)
+        if COUNTER <= index < NUM_ACTIONS:
+            return self._handle_counter(player_id, index - COUNTER)
+        return False
+
+    @staticmethod
+    def _board_instance_id(player: Player, position: int) -> Optional[str]:
+        if position == 0:
+            return player.leader.instance_id if player.leader else None
+        area = player.field.character_area
+        return area[position - 1].instance_id if position <= len(area) else None
+
+    def _handle_pass(self) -> bool:
+        # If in BLOCK step, passing means going to COUNTER step
+        if self.state.current_battle and self.state.current_battle.current_step == 'BLOCK':
+            self.state.current_battle.current_step = 'COUNTER'
+            return True
+        # If in COUNTER step, passing means finishing battle
+        return self._resolve_battle()
         
     def _handle_end_phase(self) -> bool:
         if self.state.current_battle:
@@ -115,8 +288,10 @@ class Game:
             
             # Start of Turn: Draw and Don Phase
             active_player = self.state.get_active_player()
+            if self.events.enabled:
+                self.events.emit(TurnStarted(self.state.turn_count, active_player.id))
             # 1. Draw Phase
-            active_player.draw_card()
+            self.state.draw_cards(active_player.id)
             
             # 2. Don Phase
             # Add 2 Don per turn, max 10
@@ -128,23 +303,25 @@ class Game:
             
             if don_to_add > 0:
                 active_player.active_don += don_to_add
-                print(f"    [Turn Start] {active_player.id} gains {don_to_add} DON!! (Total: {current_total + don_to_add})")
+                if self.events.enabled:
+                    self.events.emit(DonGained(active_player.id, don_to_add, current_total + don_to_add))
             
         return True
         
-    def _handle_play_card(self, action: PlayCardAction) -> bool:
+    def _handle_play_card(self, hand_index: int) -> bool:
         if self.state.current_battle:
              return False # Cannot play character during battle
              
         player = self.state.get_active_player()
-        if action.card_hand_index >= len(player.hand):
+        if hand_index >= len(player.hand):
             return False
             
-        card = player.hand[action.card_hand_index] # Peek first
+        card = player.hand[hand_index] # Peek first
         
         # Check Cost
         if player.active_don < card.cost:
-            print(f"    [Action Failed] Not enough DON!! ({player.active_don}/{card.cost})")
+            if self.events.enabled:
+                self.events.emit(ActionFailed(player.id, f"Not enough DON!! ({player.active_don}/{card.cost})"))
             return False
             
         # Deduct Cost
@@ -152,93 +329,74 @@ class Game:
         player.rested_don += card.cost
         
         # Remove from Hand
-        player.hand.pop(action.card_hand_index)
+        self.state.pop_card(player.id, 'hand', hand_index)
         
         # Create Instance
         instance = CardInstance(
             card_id=card.id,
+            card_handle=self.registry.register(card),
             instance_id=f"{card.id}_{self.state.turn_count}_{len(player.field.character_area)}",
             owner_id=player.id,
             current_power=card.power
         )
         
         try:
-            player.field.add_character(instance)
-            # CHECK ON PLAY EFFECTS
-            # Simplified: Check if card has ON_PLAY effect in list
-            # We need to lookup the original Card definition for effects
-            # ideally CardInstance should trigger this via ID lookup
-            # For now, let's assume we can get effects from the card object we popped
-            for effect in card.effect_list:
-                if effect.type == 'ON_PLAY':
-                     print(f"    [Effect] Triggering ON_PLAY for {card.name}")
-                     self.effect_manager.resolve_effect(effect, instance.instance_id)
+            self.state.add_character(player.id, instance)
+            # Subscribe its effects by trigger (printed keywords apply now), then ON PLAY
+            self.effect_manager.enter_play(instance)
+            self.effect_manager.fire('ON_PLAY', instance.instance_id)
 
-            print(f"    [Play] {card.name} (Cost: {card.cost})")
+            if self.events.enabled:
+                self.events.emit(CardPlayed(player.id, card.id, card.name, card.cost, instance.instance_id))
             return True
         except ValueError:
             # Field full
-            player.hand.insert(action.card_hand_index, card) # Return to hand
+            self.state.add_card(player.id, 'hand', card, hand_index) # Return to hand
             player.active_don += card.cost # Refund cost
             player.rested_don -= card.cost
             return False
 
-    def _handle_attack(self, action: AttackAction) -> bool:
+    def _handle_attack(self, attacker_instance_id: str, target_instance_id: str) -> bool:
         player = self.state.get_active_player()
         
-        # 1. Find Attacker
-        attacker = None
-        if player.leader and player.leader.instance_id == action.attacker_instance_id:
-            attacker = player.leader
-        else:
-            for char in player.field.character_area:
-                if char.instance_id == action.attacker_instance_id:
-                    attacker = char
-                    break
+        # 1. Find Attacker (Leader or Character of the active player)
+        attacker = self.state.find_instance(attacker_instance_id, owner_id=player.id)
         
         if not attacker:
             return False
             
         # 2. Rest Attacker
-        attacker.is_rested = True
+        self.state.update_instance(attacker, is_rested=True)
         
         # 3. Start Battle Phase (Transient State)
         self.state.current_battle = BattlePhase(
             attacker_id=player.id,
-            attacker_instance_id=action.attacker_instance_id,
-            target_instance_id=action.target_instance_id,
+            attacker_instance_id=attacker_instance_id,
+            target_instance_id=target_instance_id,
             current_step="BLOCK", # Next step is BLOCK
             attacker_power=attacker.total_power
         )
         
         # Determine Target Power for snapshot
         opponent = self.state.get_opponent(player.id)
-        target = None
-        if opponent.leader and opponent.leader.instance_id == action.target_instance_id:
-            target = opponent.leader
-        else:
-             for char in opponent.field.character_area:
-                if char.instance_id == action.target_instance_id:
-                    target = char
-                    break
+        target = self.state.find_instance(target_instance_id, owner_id=opponent.id)
         
         if target:
             self.state.current_battle.target_power = target.total_power
 
-        print(f"    [Engine] {attacker.instance_id} attacks {action.target_instance_id}! (Battle Started)")
+        if self.events.enabled:
+            battle = self.state.current_battle
+            self.events.emit(AttackDeclared(player.id, attacker.instance_id, target_instance_id,
+                                            battle.attacker_power, battle.target_power))
+        self.effect_manager.fire('WHEN_ATTACKING', attacker_instance_id)
         return True
 
-    def _handle_block(self, action: BlockAction) -> bool:
+    def _handle_block(self, player_id: str, blocker_instance_id: str) -> bool:
         battle = self.state.current_battle
         if not battle: return False
         
         # Validate Blocker
-        player = self.state.players.get(action.player_id)
-        blocker = None
-        for char in player.field.character_area:
-            if char.instance_id == action.blocker_instance_id:
-                blocker = char
-                break
+        blocker = self.state.find_instance(blocker_instance_id, owner_id=player_id, zone='character')
         
         if not blocker: return False
         if blocker.is_rested: return False # Cannot block if rested
@@ -252,50 +410,40 @@ class Game:
              # For now, rely on granted_keywords.
              pass 
 
-        if action.action_type == 'BLOCK':
-             battle.blocker_instance_id = action.blocker_instance_id
-             # Change target to blocker
-             battle.target_instance_id = action.blocker_instance_id
-             battle.target_power = blocker.total_power
-             
-             battle.current_step = "COUNTER"
-             print(f"    [Battle] Blocked by {action.blocker_instance_id}! New Target: {action.blocker_instance_id}")
-             
-             # Rest the blocker
-             blocker.is_rested = True
-             return True
-        return False
+        battle.blocker_instance_id = blocker_instance_id
+        # Change target to blocker
+        battle.target_instance_id = blocker_instance_id
+        battle.target_power = blocker.total_power
         
-    def _handle_counter(self, action: CounterAction) -> bool:
+        battle.current_step = "COUNTER"
+        if self.events.enabled:
+            self.events.emit(BlockDeclared(player_id, blocker_instance_id, battle.target_power))
+        
+        # Rest the blocker
+        self.state.update_instance(blocker, is_rested=True)
+        return True
+        
+    def _handle_counter(self, player_id: str, hand_index: int) -> bool:
         battle = self.state.current_battle
-        if not battle: return False
+        if not battle or battle.current_step != 'COUNTER': return False
         
-        # Validate Counter Card (simplified: assumed from hand)
-        player = self.state.players.get(action.player_id)
-        if action.card_hand_index >= len(player.hand): return False
+        # Validate Counter Card: a hand card with a counter value
+        player = self.state.players.get(player_id)
+        if hand_index >= len(player.hand): return False
+        if player.hand[hand_index].counter <= 0: return False
         
-        card = player.hand.pop(action.card_hand_index)
-        # Use card counter power (default 1000 if not set)
+        card = self.state.pop_card(player.id, 'hand', hand_index)
         counter_power = card.counter
         
         # Apply to current target (could be Leader or Blocker)
-        target = None
-        # Check Leader
-        target_owner = self.state.players.get(battle.target_instance_id.split('_')[0]) # HACK to get owner?
-        # Better: Search current target instance
-        if battle.target_instance_id == player.leader.instance_id:
-            target = player.leader
-        else:
-            for char in player.field.character_area:
-                if char.instance_id == battle.target_instance_id:
-                    target = char
-                    break
+        target = self.state.find_instance(battle.target_instance_id, owner_id=player.id)
         
         if target:
-            target.power_modifier += counter_power
+            self.state.update_instance(target, power_modifier=target.power_modifier + counter_power)
             battle.target_power = target.total_power # Update snapshot
-            print(f"    [Battle] Counter by {card.name} (+{counter_power}) -> Target Power: {battle.target_power}")
-            player.trash.append(card)
+            if self.events.enabled:
+                self.events.emit(CounterPlayed(player.id, card.name, counter_power, battle.target_power))
+            self.state.add_card(player.id, 'trash', card)
             return True
             
         return False
@@ -309,17 +457,21 @@ class Game:
         attacker_power = battle.attacker_power
         target_power = battle.target_power
         
-        print(f"    [Battle] Resolve: {attacker_power} vs {target_power}")
+        if self.events.enabled:
+            self.events.emit(BattleResolved(attacker_power, target_power, attacker_power >= target_power))
         
         if attacker_power >= target_power:
             # Hit!
             # If Target is Leader -> Take Life
             opponent = self.state.get_opponent(battle.attacker_id)
-            if opponent.leader and opponent.leader.instance_id == battle.target_instance_id:
+            target_location = self.state.locate_instance(battle.target_instance_id)
+            if target_location and target_location.zone == 'leader':
                 if opponent.life:
-                    lost_life = opponent.life.pop(0)
-                    opponent.hand.append(lost_life) # Life to Hand
-                    print(f"    [Battle] Hit Leader! Life -> Hand: {lost_life.name}")
+                    lost_life = self.state.pop_card(opponent.id, 'life', 0)
+                    self.state.add_card(opponent.id, 'hand', lost_life) # Life to Hand
+                    if self.events.enabled:
+                        self.events.emit(LifeLost(opponent.id, lost_life.name, len(opponent.life)))
+                    self.effect_manager.fire_card('TRIGGER', lost_life, opponent.id)
                     if not opponent.life:
                          # Check win condition? (Usually only when taking hit at 0 life)
                          # Assuming hitting at 0 life = Win
@@ -327,16 +479,19 @@ class Game:
                 else:
                     # No life left
                     self.state.winner_id = battle.attacker_id
-                    print(f"    [Battle] WINNER: {battle.attacker_id}")
+                    if self.events.enabled:
+                        self.events.emit(GameWon(battle.attacker_id))
 
             # If Target is Character -> KO
             else:
-                 removed = opponent.field.remove_character(battle.target_instance_id)
+                 removed = self.state.remove_character(battle.target_instance_id)
                  if removed:
-                     print(f"    [Battle] KO Character: {removed.instance_id}")
-
-        else:
-            print("    [Battle] Attack Failed (Not enough power)")
+                     self.effect_manager.leave_play(removed.instance_id)
+                     card = self.registry.card_for(removed)
+                     if card:
+                         self.state.add_card(opponent.id, 'trash', card)
+                     if self.events.enabled:
+                         self.events.emit(CharacterKO(opponent.id, removed.instance_id, 'battle'))
 
         # End Battle
         self.state.current_battle = None
@@ -348,11 +503,12 @@ class Game:
         """
         player = self.state.get_active_player()
         # Unrest all characters
-        if player.leader:
-             player.leader.is_rested = False
+        if player.leader and player.leader.is_rested:
+             self.state.update_instance(player.leader, is_rested=False)
              
         for char in player.field.character_area:
-            char.is_rested = False
+            if char.is_rested:
+                self.state.update_instance(char, is_rested=False)
         
         # Unrest Don
         player.active_don += player.rested_don
@@ -360,96 +516,71 @@ class Game:
 
     def get_valid_actions(self) -> List[GameAction]:
         """
-        Returns a list of all valid actions for the active player.
+        Returns a list of all valid actions for the player to act, as GameActions
+        (same order as legal_actions()).
         """
-        actions: List[GameAction] = []
+        state = self.state
+        stats = self.stats
+        if stats is None:
+            return [decode_action(state, index) for index in self.legal_actions()]
+        start = perf_counter_ns()
+        actions = [decode_action(state, index) for index in self.legal_actions()]
+        stats.legal_actions.add(perf_counter_ns() - start)
+        return actions
+
+    def legal_action_mask(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """(NUM_ACTIONS,) bool mask of legal_actions() (written into out if given)."""
+        stats = self.stats
+        if stats is None:
+            return action_mask(self.legal_actions(), out)
+        start = perf_counter_ns()
+        mask = action_mask(self.legal_actions(), out)
+        stats.legal_actions.add(perf_counter_ns() - start)
+        return mask
+
+    def legal_actions(self) -> List[int]:
+        """
+        Indices (engine.core.action_space) of the valid actions for the player to act.
+        """
+        state = self.state
         
         # If Battle is active, restrict actions based on Step
-        if self.state.current_battle:
-            battle = self.state.current_battle
-            # Who is acting?
-            # BLOCK/COUNTER are Opponent's actions
-            opponent_id = self.state.get_opponent(battle.attacker_id).id
-            
-            # Who is acting?
-            # BLOCK/COUNTER are Opponent's actions
-            opponent_id = self.state.get_opponent(battle.attacker_id).id
-            
-            # If we are in BLOCK step
+        battle = state.current_battle
+        if battle:
+            # Passing (RESOLVE_BATTLE) moves BLOCK -> COUNTER -> damage; the defender acts
+            actions = [PASS]
+            defender = state.get_opponent(battle.attacker_id)
             if battle.current_step == 'BLOCK':
-                # Add 'No Block' (Pass) which moves to Counter/Damage
-                # In real game, this is skipping block.
-                # We reuse ResolveBattleAction for "Skip/Done" signal for now or define a new "SkipBlockAction"
-                # To keep it simple, let's use RESOLVE_BATTLE as "Pass priority"
-                actions.append(ResolveBattleAction(player_id=opponent_id, action_type='RESOLVE_BATTLE'))
-                
-                # Check for Blockers
-                opponent = self.state.get_opponent(battle.attacker_id)
-                for char in opponent.field.character_area:
-                    # Valid Blocker: Not Rested + Has BLOCKER keyword
-                    if not char.is_rested and "BLOCKER" in char.granted_keywords:
-                         actions.append(BlockAction(
-                             player_id=opponent.id,
-                             action_type='BLOCK',
-                             blocker_instance_id=char.instance_id
-                         ))
-            
-            elif battle.current_step == 'COUNTER':
-                 # Add 'No Counter' (Pass)
-                 actions.append(ResolveBattleAction(player_id=opponent_id, action_type='RESOLVE_BATTLE'))
-            
+                # Valid Blocker: Not Rested + Has BLOCKER keyword
+                for slot, char in enumerate(defender.field.character_area):
+                    if not char.is_rested and char.keyword_flags & _BLOCKER:
+                        actions.append(BLOCK + slot)
             else:
-                 # Should not happen if auto-transitioned, but safely return resolve
-                 actions.append(ResolveBattleAction(player_id=battle.attacker_id, action_type='RESOLVE_BATTLE'))
-                 
+                # Counter with any hand card that has a counter value
+                for i, card in enumerate(defender.hand[:MAX_CARDS]):
+                    if card.counter > 0:
+                        actions.append(COUNTER + i)
             return actions
 
-        player = self.state.get_active_player()
-        
         # Always allow Ending Phase
-        actions.append(EndTurnAction(player_id=player.id, action_type='END_PHASE'))
-        
-        if self.state.current_phase == 'MAIN_PHASE':
-            # 1. Play Cards from Hand
-            # Simplified: Check if cost <= active don (Assuming infinite don for now or 10)
-            # Todo: Implement real Don checks
-            for i, card in enumerate(player.hand):
-                # Check target limits etc (Simplified)
-                if card.type == 'CHARACTER':
-                    if len(player.field.character_area) < 5:
-                        # Check Cost
-                        if player.active_don >= card.cost:
-                            actions.append(PlayCardAction(
-                                player_id=player.id, 
-                                action_type='PLAY_CARD', 
-                                card_hand_index=i
-                            ))
-            
-            # 2. Attack (Simplified)
-            # Can attack with Active Characters/Leader
-            # Targets: Opponent Leader or Rested Characters
-            opponent = self.state.get_opponent(player.id)
-            
-            # Attacker: Leader
-            if player.leader and not player.leader.is_rested:
-               # Target: Opponent Leader
-               if opponent.leader:
-                   actions.append(AttackAction(
-                       player_id=player.id,
-                       action_type='ATTACK',
-                       attacker_instance_id=player.leader.instance_id,
-                       target_instance_id=opponent.leader.instance_id
-                   ))
+        actions = [END_PHASE]
+        if state.current_phase != 'MAIN_PHASE':
+            return actions
+        player = state.get_active_player()
+
+        # 1. Play characters: a free slot and enough active DON!!
+        if len(player.field.character_area) < FIELD_SLOTS:
+            don = player.active_don
+            for i, card in enumerate(player.hand[:MAX_CARDS]):
+                if card.type == 'CHARACTER' and card.cost <= don:
+                    actions.append(PLAY + i)
 
-            # Attacker: Characters
-            for char in player.field.character_area:
+        # 2. Attack (Simplified): active leader / characters attack the opponent leader
+        opponent = state.get_opponent(player.id)
+        if opponent.leader:
+            if player.leader and not player.leader.is_rested:
+                actions.append(attack_index(0, 0))
+            for slot, char in enumerate(player.field.character_area):
                 if not char.is_rested:
-                     if opponent.leader:
-                        actions.append(AttackAction(
-                            player_id=player.id,
-                            action_type='ATTACK',
-                            attacker_instance_id=char.instance_id,
-                            target_instance_id=opponent.leader.instance_id
-                        ))
-        
+                    actions.append(attack_index(slot + 1, 0))
         return actions
@@ -0,0 +1,46 @@
+from typing import Dict, NamedTuple, Optional
+
+Zone = str  # 'leader' | 'character' | 'stage'
+
+
+class InstanceLocation(NamedTuple):
+    owner_id: str
+    zone: Zone
+    slot: int  # index in character_area, 0 for leader / stage
+
+
+class InstanceIndex:
+    """
+    Cache of instance_id -> InstanceLocation for every CardInstance in play.
+
+    GameState keeps it up to date when cards move through its helpers
+    (add_character / remove_character). Code that edits zones directly (tests,
+    setup scripts) is tolerated: GameState validates every hit and rebuilds
+    the index on a miss.
+
+    The index is derived data, so all indexes compare equal; two states are
+    equal regardless of what their caches currently hold.
+    """
+    __slots__ = ('locations',)
+
+    def __init__(self, locations: Optional[Dict[str, InstanceLocation]] = None):
+        self.locations: Dict[str, InstanceLocation] = locations if locations is not None else {}
+
+    def rebuild(self, players: dict):
+        locations = {}
+        for pid, player in players.items():
+            if player.leader:
+                locations[player.leader.instance_id] = InstanceLocation(pid, 'leader', 0)
+            for slot, char in enumerate(player.field.character_area):
+                locations[char.instance_id] = InstanceLocation(pid, 'character', slot)
+            if player.field.stage_area:
+                locations[player.field.stage_area.instance_id] = InstanceLocation(pid, 'stage', 0)
+        self.locations = locations
+
+    def copy(self) -> "InstanceIndex":
+        return InstanceIndex(self.locations.copy())
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, InstanceIndex)
+
+    __hash__ = None
@@ -0,0 +1,120 @@
+"""
+Optional profiling counters for Game and the runners.
+
+A GameStats collects nanosecond timers and call counts:
+
+- actions        : per action type ('PLAY_CARD', 'ATTACK', ...), forced ones included
+- phases         : the same action time, per phase the action was taken in
+- effects        : per effect action_code run by EffectManager
+- legal_actions  : action generation behind get_valid_actions() / legal_action_mask()
+- think          : per agent, decision time (timer + log2 histogram), filled by the runner
+
+Off by default: Game / EffectManager only test `stats is not None` once per
+call. Turn it on per game, and share one GameStats across games to aggregate:
+
+    stats = GameStats()
+    game.enable_stats(stats)
+    ...
+    print(stats.summary()); stats.dump_json("profile.json")
+"""
+import json
+from collections import defaultdict
+from typing import Dict
+
+
+class Timer:
+    """Call count and total nanoseconds."""
+    __slots__ = ('calls', 'ns')
+
+    def __init__(self):
+        self.calls = 0
+        self.ns = 0
+
+    def add(self, ns: int):
+        self.calls += 1
+        self.ns += ns
+
+    def merge(self, other: "Timer"):
+        self.calls += other.calls
+        self.ns += other.ns
+
+    def to_dict(self) -> dict:
+        return {"calls": self.calls, "total_ns": self.ns, "mean_ns": self.ns // self.calls if self.calls else 0}
+
+
+class Histogram:
+    """
+    Durations in power-of-two microsecond buckets: bucket b counts durations
+    below 2**b us (bucket 0: below 1 us).
+    """
+    __slots__ = ('buckets',)
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = defaultdict(int)
+
+    def add(self, ns: int):
+        self.buckets[(ns // 1000).bit_length()] += 1
+
+    def merge(self, other: "Histogram"):
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] += count
+
+    def to_dict(self) -> dict:
+        return {f"<{1 << bucket}us": self.buckets[bucket] for bucket in sorted(self.buckets)}
+
+
+class GameStats:
+    def __init__(self):
+        self.actions: Dict[str, Timer] = defaultdict(Timer)
+        self.phases: Dict[str, Timer] = defaultdict(Timer)
+        self.effects: Dict[str, Timer] = defaultdict(Timer)
+        self.legal_actions = Timer()
+        self.think: Dict[str, Timer] = defaultdict(Timer)
+        self.think_histograms: Dict[str, Histogram] = defaultdict(Histogram)
+
+    def add_action(self, kind: str, phase: str, ns: int):
+        self.actions[kind].add(ns)
+        self.phases[phase].add(ns)
+
+    def add_effect(self, action_code: str, ns: int):
+        self.effects[action_code].add(ns)
+
+    def add_think(self, agent_id: str, ns: int):
+        self.think[agent_id].add(ns)
+        self.think_histograms[agent_id].add(ns)
+
+    def merge(self, other: "GameStats") -> "GameStats":
+        """Add the counters of other (e.g. a worker's) into this one."""
+        for mine, theirs in ((self.actions, other.actions), (self.phases, other.phases),
+                             (self.effects, other.effects), (self.think, other.think),
+                             (self.think_histograms, other.think_histograms)):
+            for key, counter in theirs.items():
+                mine[key].merge(counter)
+        self.legal_actions.merge(other.legal_actions)
+        return self
+
+    def to_dict(self) -> dict:
+        def timers(group):
+            return {key: group[key].to_dict() for key in sorted(group)}
+        return {
+            "actions": timers(self.actions),
+            "phases": timers(self.phases),
+            "effects": timers(self.effects),
+            "legal_actions": self.legal_actions.to_dict(),
+            "think": {agent: dict(self.think[agent].to_dict(), histogram=self.think_histograms[agent].to_dict())
+                      for agent in sorted(self.think)},
+        }
+
+    def dump_json(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def summary(self) -> str:
+        lines = []
+        for title, group in (("Action", self.actions), ("Phase", self.phases), ("Effect", self.effects),
+                             ("Legal", {"legal_actions": self.legal_actions}), ("Agent think", self.think)):
+            for key in sorted(group, key=lambda k: -group[k].ns):
+                timer = group[key]
+                lines.append(f"{title:<12} {key:<20} {timer.calls:>9} calls {timer.ns / 1e6:>10.1f} ms "
+                             f"{timer.ns / max(1, timer.calls) / 1e3:>9.1f} us/call")
+        return "\n".join(lines)
@@ -0,0 +1,119 @@
+"""
+Compiled Effect.target_filter predicates.
+
+The filter DSL is a '|'-separated list of terms, all of which must hold:
+
+    opponent / own          owner of the target, relative to the effect's controller
+    leader / character      zone of the target (default: both)
+    self                    the card the effect comes from
+    rested / active         rest state
+    cost<=4, power>=5000    comparisons (<, <=, =, ==, >=, >) on the current cost
+                            (printed cost + cost modifier) or total power
+
+e.g. "opponent|character|rested|cost<=4". compile_filter() parses a filter once
+into a TargetFilter; matches() / targets() then only run the compiled checks.
+"""
+import operator
+import re
+from typing import Callable, List, Optional
+
+from engine.models.card import CardInstance
+
+_COMPARISON = re.compile(r"^(cost|power)\s*(<=|>=|==|=|<|>)\s*(-?\d+)$")
+_OPERATORS = {"<": operator.lt, "<=": operator.le, "=": operator.eq, "==": operator.eq,
+              ">=": operator.ge, ">": operator.gt}
+
+
+class TargetFilter:
+    """
+    A parsed target_filter. Compile with compile_filter(); instances are immutable
+    and shared by every effect with the same filter text.
+    """
+    __slots__ = ('text', 'owner', 'zones', 'self_only', 'checks', 'needs_card')
+
+    def __init__(self, text: str):
+        self.text = text
+        self.owner: Optional[str] = None            # 'opponent' / 'own' / None (either)
+        self.self_only = False
+        zones = []
+        checks: List[Callable] = []
+        self.needs_card = False
+        for term in (t.strip().lower() for t in text.split('|')):
+            if not term:
+                continue
+            if term in ('opponent', 'own'):
+                self.owner = term
+            elif term in ('leader', 'character'):
+                zones.append(term)
+            elif term == 'self':
+                self.self_only = True
+            elif term == 'rested':
+                checks.append(lambda instance, card: instance.is_rested)
+            elif term == 'active':
+                checks.append(lambda instance, card: not instance.is_rested)
+            else:
+                match = _COMPARISON.match(term)
+                if match is None:
+                    raise ValueError(f"Unknown target filter term {term!r} in {text!r}")
+                checks.append(self._comparison(match.group(1), _OPERATORS[match.group(2)], int(match.group(3))))
+                self.needs_card |= match.group(1) == 'cost'
+        self.zones = tuple(zones) or ('leader', 'character')
+        self.checks = tuple(checks)
+
+    @staticmethod
+    def _comparison(field: str, compare, value: int) -> Callable:
+        if field == 'power':
+            return lambda instance, card: compare(instance.total_power, value)
+        return lambda instance, card: compare((card.cost if card is not None else 0) + instance.cost_modifier, value)
+
+    def __reduce__(self):
+        # The compiled checks are closures: pickle the text and compile again
+        return compile_filter, (self.text,)
+
+    def __repr__(self) -> str:
+        return f"TargetFilter({self.text!r})"
+
+    def matches(self, registry, controller_id: str, source_id: Optional[str],
+                instance: CardInstance, zone: str) -> bool:
+        """Does the card in play `instance` (in `zone`) satisfy the filter?"""
+        if self.self_only and instance.instance_id != source_id:
+            return False
+        if zone not in self.zones:
+            return False
+        owner = self.owner
+        if owner is not None and (instance.owner_id == controller_id) != (owner == 'own'):
+            return False
+        card = registry.card_for(instance) if self.needs_card else None
+        for check in self.checks:
+            if not check(instance, card):
+                return False
+        return True
+
+    def targets(self, state, registry, controller_id: str, source_id: Optional[str] = None) -> List[CardInstance]:
+        """Every card in play satisfying the filter (leaders first, then characters in slot order)."""
+        found = []
+        for pid, player in state.players.items():
+            if self.owner is not None and (pid == controller_id) != (self.owner == 'own'):
+                continue
+            candidates = []
+            if 'leader' in self.zones and player.leader is not None:
+                candidates.append((player.leader, 'leader'))
+            if 'character' in self.zones:
+                candidates.extend((char, 'character') for char in player.field.character_area)
+            for instance, zone in candidates:
+                if self.matches(registry, controller_id, source_id, instance, zone):
+                    found.append(instance)
+        return found
+
+
+_compiled = {}
+
+
+def compile_filter(text: Optional[str]) -> Optional[TargetFilter]:
+    """TargetFilter for a target_filter string (None for no filter). Cached per text."""
+    if text is None:
+        return None
+    target_filter = _compiled.get(text)
+    if target_filter is None:
+        target_filter = _compiled[text] = TargetFilter(text)
+    return target_filter
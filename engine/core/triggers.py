@@ -0,0 +1,53 @@
+"""
+Trigger-indexed effect subscriptions for the cards in play.
+
+When an instance enters play its compiled programs (CardRegistry.programs) are
+filed under their trigger, so firing an event (attack declaration, life damage,
+...) only touches the instances listening for it instead of scanning every
+card's effect_list:
+
+    listeners['WHEN_ATTACKING'] = {instance_id: (program, ...), ...}
+
+Keyword effects ([Blocker], [Rush], ...) are not listeners: they apply once, as
+keyword_flags, when the instance enters play (see EffectManager.enter_play).
+"""
+from typing import Dict, Iterable, Tuple
+
+from engine.core.effect_program import EffectProgram
+from engine.models.card import KEYWORD_FLAGS
+
+# Effect types that are printed keywords rather than triggered abilities
+STATIC_KEYWORDS = frozenset(KEYWORD_FLAGS)
+
+
+class TriggerIndex:
+    __slots__ = ('listeners', 'members')
+
+    def __init__(self):
+        self.listeners: Dict[str, Dict[str, Tuple[EffectProgram, ...]]] = {}
+        # instance_id -> triggers it is filed under (also marks it as indexed)
+        self.members: Dict[str, Tuple[str, ...]] = {}
+
+    def __contains__(self, instance_id: str) -> bool:
+        return instance_id in self.members
+
+    def add(self, instance_id: str, programs: Iterable[EffectProgram]):
+        by_trigger: Dict[str, list] = {}
+        for program in programs:
+            if program.trigger not in STATIC_KEYWORDS:
+                by_trigger.setdefault(program.trigger, []).append(program)
+        for trigger, listening in by_trigger.items():
+            self.listeners.setdefault(trigger, {})[instance_id] = tuple(listening)
+        self.members[instance_id] = tuple(by_trigger)
+
+    def remove(self, instance_id: str):
+        for trigger in self.members.pop(instance_id, ()):
+            del self.listeners[trigger][instance_id]
+
+    def programs(self, trigger: str, instance_id: str) -> Tuple[EffectProgram, ...]:
+        listening = self.listeners.get(trigger)
+        return listening.get(instance_id, ()) if listening else ()
+
+    def subscribed(self, trigger: str) -> Dict[str, Tuple[EffectProgram, ...]]:
+        """instance_id -> programs of every instance listening for trigger."""
+        return self.listeners.get(trigger, {})
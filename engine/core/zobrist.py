@@ -0,0 +1,103 @@
+"""
+Zobrist-style position hashing for GameState.
+
+Every feature of a position (a card in a zone, a state flag of a card in play,
+the phase, ...) maps to a fixed pseudo-random 64-bit key. The position hash is
+the sum of the keys of its features, mod 2**64. Sums are used instead of the
+classic XOR so that zones behave as multisets: two copies of a card in hand add
+two keys instead of cancelling out.
+
+The hash has two parts:
+- collection part: zone multisets (hand / deck / life / trash) and the cards in
+  play (leader, characters, stage) with their rested / power / cost / DON!! /
+  keyword state. Maintained incrementally by GameState's mutation helpers
+  (add_card, pop_card, add_character, remove_character, update_instance), so
+  each engine mutation costs O(1).
+- scalar part: turn, phase, active player, winner, DON!! counters and the
+  current battle. A handful of key lookups, computed when the hash is read.
+
+Keys are derived from the feature itself (blake2b), so hashes agree across
+processes and runs. Zone order and instance ids (except the ones a pending
+battle refers to) are deliberately not hashed: two positions that differ only
+in those are the same position for search.
+
+Limitation: PLAY_CARD / COUNTER actions address cards by hand index, and hand
+order is not hashed. Two positions with the same hand in a different order
+share a hash (and the same legal action indices), but an index names a
+different card in each. Anything that keys per-action data on the hash must
+also compare hand order (see MCTSAgent._reuse_root).
+"""
+import hashlib
+from typing import Dict, Hashable
+
+MASK = (1 << 64) - 1
+
+_keys: Dict[Hashable, int] = {}
+
+
+def key(feature: tuple) -> int:
+    """Deterministic 64-bit key of a feature tuple (strings / ints / bools)."""
+    k = _keys.get(feature)
+    if k is None:
+        digest = hashlib.blake2b(repr(feature).encode('utf-8'), digest_size=8).digest()
+        k = _keys[feature] = int.from_bytes(digest, 'little')
+    return k
+
+
+def card_key(owner_id: str, zone: str, card) -> int:
+    """A Card definition in one of a player's card zones."""
+    return key((owner_id, zone, card.id))
+
+
+def instance_key(instance) -> int:
+    """A card in play with its mutable state. Zone is implied by the card (leader / character / stage)."""
+    base = (instance.owner_id, instance.card_id)
+    h = key(base + ('in_play',))
+    if instance.is_rested:
+        h += key(base + ('rested',))
+    h += key(base + ('power', instance.current_power, instance.power_modifier))
+    if instance.cost_modifier:
+        h += key(base + ('cost', instance.cost_modifier))
+    if instance.attached_don:
+        h += key(base + ('don', instance.attached_don))
+    for keyword in instance.granted_keywords:
+        h += key(base + ('keyword', keyword))
+    return h & MASK
+
+
+ZONES = ('life', 'hand', 'deck', 'trash')
+
+
+def collection_hash(state) -> int:
+    """Full recomputation of the incrementally maintained part."""
+    h = 0
+    for pid, player in state.players.items():
+        for zone in ZONES:
+            for card in getattr(player, zone):
+                h += key((pid, zone, card.id))
+        if player.leader:
+            h += instance_key(player.leader)
+        for char in player.field.character_area:
+            h += instance_key(char)
+        if player.field.stage_area:
+            h += instance_key(player.field.stage_area)
+    return h & MASK
+
+
+def scalar_hash(state) -> int:
+    h = key(('turn', state.turn_count)) + key(('phase', state.current_phase)) + key(('active', state.active_player_id))
+    if state.winner_id is not None:
+        h += key(('winner', state.winner_id))
+    for pid, player in state.players.items():
+        h += key((pid, 'don', player.active_don, player.rested_don, player.attached_don))
+    battle = state.current_battle
+    if battle is not None:
+        h += key(('battle', battle.attacker_id, battle.attacker_instance_id, battle.target_instance_id,
+                  battle.current_step, battle.attacker_power, battle.target_power,
+                  battle.blocker_instance_id, tuple(battle.counter_cards), battle.counter_power_bonus))
+    return h & MASK
+
+
+def full_hash(state) -> int:
+    """Hash from scratch (reference for the incremental one)."""
+    return (collection_hash(state) + scalar_hash(state)) & MASK
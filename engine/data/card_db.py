@@ -0,0 +1,388 @@
+"""
+Compiled card database.
+
+data/clean_json is ~70 files / 5,000+ records; walking and json.load-ing it and
+running the EffectParser over every effect text on each start is slow, and the
+loaders used to normalize types / colors / attributes each in their own way.
+
+compile_card_db() turns the directory into one versioned binary artifact:
+
+    header     : magic, format version, record count, source fingerprint
+    int32[n]   : cost, power, counter, life        (ABSENT when the JSON has no value)
+    uint8[n]   : type code, attribute code, color bitmask
+    uint32[n]  : string refs for id, name, rarity, effect text, subtypes, effect_list
+    strings    : deduplicated UTF-8 string table (offsets + blob)
+
+effect_list is stored pre-parsed (JSON of the Effect models; rebuilds reuse the
+persistent ParseCache in data/effect_cache.json). open_card_db()
+memory-maps the file, rebuilding it first when the JSON sources, the parser or
+the format version changed. normalize_record() / card_from_record() are the
+single normalization shared by all loaders.
+
+Build by hand:
+    python -m engine.data.card_db [clean_json_dir] [out_path]
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, get_args
+from engine.models.card import Card, CardType, CardColor, CardAttribute
+from engine.data import parser as parser_module
+from engine.data.parser import EffectParser, ParseCache
+
+MAGIC = b"OPCD"
+FORMAT_VERSION = 1
+ABSENT = -(2 ** 31)
+NO_CODE = 0xFF
+
+TYPES = get_args(CardType)
+ATTRIBUTES = get_args(CardAttribute)
+COLORS = get_args(CardColor)
+TYPE_CODE = {name: i for i, name in enumerate(TYPES)}
+ATTRIBUTE_CODE = {name: i for i, name in enumerate(ATTRIBUTES)}
+COLOR_BIT = {name: 1 << i for i, name in enumerate(COLORS)}
+
+_HEADER = struct.Struct("<4sHHI32s")  # magic, version, reserved, count, fingerprint
+_INT_FIELDS = ('cost', 'power', 'counter', 'life')
+_STR_FIELDS = ('id', 'name', 'rarity', 'effect', 'subtypes', 'effect_list')
+_SUBTYPE_SEP = "\x1f"
+
+
+# --- Normalization ---
+
+def _split(raw: Optional[str]) -> List[str]:
+    if not raw:
+        return []
+    return [part.strip().upper() for part in raw.replace("/", ";").split(";") if part.strip()]
+
+
+def normalize_record(raw: dict) -> dict:
+    """
+    Canonical form of a clean_json record:
+    upper-case type, `colors` as a list of known colors, the first known attribute
+    (multi-attribute cards like "Slash;Special" keep the first), missing stats as None.
+    """
+    card_type = (raw.get("type") or "CHARACTER").upper()
+    attribute = next((a for a in _split(raw.get("attribute")) if a in ATTRIBUTE_CODE), None)
+    return {
+        "id": raw["id"],
+        "name": raw.get("name") or "",
+        "type": card_type if card_type in TYPE_CODE else "CHARACTER",
+        "colors": [c for c in _split(raw.get("color")) if c in COLOR_BIT],
+        "attribute": attribute,
+        "cost": raw.get("cost"),
+        "power": raw.get("power"),
+        "counter": raw.get("counter"),
+        "life": raw.get("life"),
+        "rarity": raw.get("rarity") or "",
+        "subtypes": list(raw.get("subtypes") or []),
+        "effect": raw.get("effect") or "",
+    }
+
+
+def card_from_record(record: dict) -> Card:
+    """
+    Build the engine Card for a normalized record (with or without a pre-parsed effect_list).
+    """
+    return Card(
+        id=record["id"],
+        name=record["name"],
+        type=record["type"],
+        colors=record["colors"],
+        attribute=record["attribute"],
+        cost=record["cost"] or 0,
+        power=record["power"] or 0,
+        counter=record["counter"] or 0,
+        effect_list=record.get("effect_list", []),
+        tags=record["subtypes"],
+    )
+
+
+# --- Build ---
+
+def default_db_path(clean_json_dir: str) -> str:
+    """data/clean_json -> data/card_db.bin"""
+    return os.path.join(os.path.dirname(os.path.abspath(clean_json_dir)), "card_db.bin")
+
+
+def default_cache_path(clean_json_dir: str) -> str:
+    """data/clean_json -> data/effect_cache.json (persistent EffectParser cache)"""
+    return os.path.join(os.path.dirname(os.path.abspath(clean_json_dir)), "effect_cache.json")
+
+
+def _source_files(clean_json_dir: str) -> List[str]:
+    return sorted(f for f in os.listdir(clean_json_dir) if f.endswith(".json"))
+
+
+def source_fingerprint(clean_json_dir: str) -> bytes:
+    """
+    Hash of the JSON file names / sizes / mtimes, the parser source and the format version.
+    Cheap (stat only), so it is checked on every open.
+    """
+    h = hashlib.blake2b(digest_size=32)
+    h.update(struct.pack("<H", FORMAT_VERSION))
+    with open(parser_module.__file__, "rb") as f:
+        h.update(f.read())
+    for filename in _source_files(clean_json_dir):
+        st = os.stat(os.path.join(clean_json_dir, filename))
+        h.update(f"{filename}:{st.st_size}:{st.st_mtime_ns};".encode())
+    return h.digest()
+
+
+def read_raw_records(clean_json_dir: str) -> List[dict]:
+    """
+    The clean_json records as written (display strings such as "Slash;Special"
+    kept), in source order. Consumers of the card text (embed_loader) read these;
+    the engine reads the compiled, normalized DB.
+    """
+    records = []
+    for filename in _source_files(clean_json_dir):
+        try:
+            with open(os.path.join(clean_json_dir, filename), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"Error loading {filename}: {e}")
+            continue
+        if isinstance(data, list):
+            records.extend(card for card in data if 'id' in card)
+    return records
+
+
+def _read_source_records(clean_json_dir: str) -> List[dict]:
+    return [normalize_record(card) for card in read_raw_records(clean_json_dir)]
+
+
+def _pad4(buf: bytearray):
+    buf.extend(b"\0" * (-len(buf) % 4))
+
+
+def compile_card_db(clean_json_dir: str, out_path: Optional[str] = None) -> str:
+    """
+    Compile clean_json into the binary artifact. Returns the artifact path.
+    The file is written to a temp name and renamed, so concurrent readers
+    (e.g. tournament worker processes) never see a partial file.
+    """
+    out_path = out_path or default_db_path(clean_json_dir)
+    fingerprint = source_fingerprint(clean_json_dir)
+    records = _read_source_records(clean_json_dir)
+    cache = ParseCache(default_cache_path(clean_json_dir))
+    parser = EffectParser(cache)
+
+    strings: List[str] = []
+    string_index: Dict[str, int] = {}
+
+    def ref(text: str) -> int:
+        i = string_index.get(text)
+        if i is None:
+            i = string_index[text] = len(strings)
+            strings.append(text)
+        return i
+
+    count = len(records)
+    ints = {name: [] for name in _INT_FIELDS}
+    types, attributes, colors = bytearray(), bytearray(), bytearray()
+    refs = {name: [] for name in _STR_FIELDS}
+    for record in records:
+        for name in _INT_FIELDS:
+            value = record[name]
+            ints[name].append(value if isinstance(value, int) else ABSENT)
+        types.append(TYPE_CODE[record["type"]])
+        attributes.append(ATTRIBUTE_CODE[record["attribute"]] if record["attribute"] else NO_CODE)
+        mask = 0
+        for color in record["colors"]:
+            mask |= COLOR_BIT[color]
+        colors.append(mask)
+        effects = [e.model_dump(mode='json') for e in parser.parse_effects(record["effect"])]
+        refs["id"].append(ref(record["id"]))
+        refs["name"].append(ref(record["name"]))
+        refs["rarity"].append(ref(record["rarity"]))
+        refs["effect"].append(ref(record["effect"]))
+        refs["subtypes"].append(ref(_SUBTYPE_SEP.join(record["subtypes"])))
+        refs["effect_list"].append(ref(json.dumps(effects, separators=(',', ':'))))
+
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+
+    buf = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, count, fingerprint))
+    for name in _INT_FIELDS:
+        buf += struct.pack(f"<{count}i", *ints[name])
+    buf += types + attributes + colors
+    _pad4(buf)
+    for name in _STR_FIELDS:
+        buf += struct.pack(f"<{count}I", *refs[name])
+    buf += struct.pack("<I", len(strings))
+    buf += struct.pack(f"<{len(offsets)}I", *offsets)
+    buf += b"".join(encoded)
+
+    tmp_path = f"{out_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(buf)
+    os.replace(tmp_path, out_path)
+    cache.save()
+    return out_path
+
+
+# --- Read ---
+
+class CompiledCardDB:
+    """
+    Read-only view of a compiled artifact. Numeric columns are memoryviews over the
+    mapped file (cost[i], power[i], ...); strings and Cards are decoded on demand.
+    When an id occurs more than once in the sources, the last record wins for
+    index_of() / by-id lookups (same as the old dict-based loader).
+    """
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mm)
+        magic, version, _, count, fingerprint = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a card database of format version {FORMAT_VERSION}")
+        if sys.byteorder != 'little':
+            raise ValueError("Compiled card database requires a little-endian host")
+        self.count = count
+        self.fingerprint = fingerprint
+
+        pos = _HEADER.size
+        columns = {}
+        for name in _INT_FIELDS:
+            columns[name] = view[pos:pos + 4 * count].cast('i')
+            pos += 4 * count
+        self.cost, self.power, self.counter, self.life = (columns[name] for name in _INT_FIELDS)
+        self.type_codes = view[pos:pos + count]
+        self.attribute_codes = view[pos + count:pos + 2 * count]
+        self.color_masks = view[pos + 2 * count:pos + 3 * count]
+        pos += 3 * count
+        pos += -pos % 4
+        self._refs = {}
+        for name in _STR_FIELDS:
+            self._refs[name] = view[pos:pos + 4 * count].cast('I')
+            pos += 4 * count
+        (num_strings,) = struct.unpack_from("<I", self._mm, pos)
+        pos += 4
+        self._offsets = view[pos:pos + 4 * (num_strings + 1)].cast('I')
+        self._blob_start = pos + 4 * (num_strings + 1)
+
+        self._index: Dict[str, int] = {}
+        for i in range(count):
+            self._index[self.string(self._refs["id"][i])] = i
+
+    def __len__(self) -> int:
+        return self.count
+
+    def string(self, ref: int) -> str:
+        start = self._blob_start + self._offsets[ref]
+        end = self._blob_start + self._offsets[ref + 1]
+        return self._mm[start:end].decode('utf-8')
+
+    def _field(self, name: str, i: int) -> str:
+        return self.string(self._refs[name][i])
+
+    def ids(self) -> List[str]:
+        """Unique card ids, in order of first occurrence."""
+        return list(self._index)
+
+    def index_of(self, card_id: str) -> Optional[int]:
+        return self._index.get(card_id)
+
+    def record(self, i: int) -> dict:
+        """
+        The normalized record (see normalize_record) plus the pre-parsed effect_list.
+        """
+        attribute = self.attribute_codes[i]
+        mask = self.color_masks[i]
+        subtypes = self._field("subtypes", i)
+        record = {
+            "id": self._field("id", i),
+            "name": self._field("name", i),
+            "type": TYPES[self.type_codes[i]],
+            "colors": [color for color in COLORS if mask & COLOR_BIT[color]],
+            "attribute": ATTRIBUTES[attribute] if attribute != NO_CODE else None,
+            "rarity": self._field("rarity", i),
+            "subtypes": subtypes.split(_SUBTYPE_SEP) if subtypes else [],
+            "effect": self._field("effect", i),
+            "effect_list": json.loads(self._field("effect_list", i)),
+        }
+        for name in _INT_FIELDS:
+            value = getattr(self, name)[i]
+            record[name] = value if value != ABSENT else None
+        return record
+
+    def records(self) -> Iterator[dict]:
+        """Every source record in file order (duplicates included)."""
+        for i in range(self.count):
+            yield self.record(i)
+
+    def card(self, i: int) -> Card:
+        return card_from_record(self.record(i))
+
+    def get_record(self, card_id: str) -> Optional[dict]:
+        i = self._index.get(card_id)
+        return self.record(i) if i is not None else None
+
+    def by_id(self) -> "RecordView":
+        """card id -> normalized record (last occurrence wins), decoded on access."""
+        return RecordView(self)
+
+
+class RecordView(Mapping):
+    """
+    Read-only dict-like view used where loaders expect `card id -> record`.
+    Each lookup decodes a fresh record, so callers may mutate what they get.
+    """
+    def __init__(self, db: CompiledCardDB):
+        self.db = db
+
+    def __getitem__(self, card_id: str) -> dict:
+        return self.db.record(self.db._index[card_id])
+
+    def __contains__(self, card_id) -> bool:
+        return card_id in self.db._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.db._index)
+
+    def __len__(self) -> int:
+        return len(self.db._index)
+
+
+_open_dbs: Dict[str, CompiledCardDB] = {}
+
+
+def open_card_db(clean_json_dir: str, path: Optional[str] = None) -> CompiledCardDB:
+    """
+    Open (and if needed build or rebuild) the compiled database for clean_json_dir.
+    Databases are cached per process; a stale one is rebuilt transparently.
+    """
+    path = path or default_db_path(clean_json_dir)
+    fingerprint = source_fingerprint(clean_json_dir)
+
+    db = _open_dbs.get(path)
+    if db is not None and db.fingerprint == fingerprint:
+        return db
+
+    db = None
+    if os.path.exists(path):
+        try:
+            db = CompiledCardDB(path)
+        except (ValueError, struct.error):
+            db = None
+    if db is None or db.fingerprint != fingerprint:
+        compile_card_db(clean_json_dir, path)
+        db = CompiledCardDB(path)
+    _open_dbs[path] = db
+    return db
+
+
+if __name__ == "__main__":
+    source_dir = sys.argv[1] if len(sys.argv) > 1 else "data/clean_json"
+    out = compile_card_db(source_dir, sys.argv[2] if len(sys.argv) > 2 else None)
+    db = CompiledCardDB(out)
+    print(f"Compiled {len(db)} records ({len(db.ids())} unique ids) -> {out} ({os.path.getsize(out)} bytes)")
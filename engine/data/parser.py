@@ -1,11 +1,86 @@
+import hashlib
+import json
+import os
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional
 from engine.models.effect import Effect, EffectType
 
+# Bump whenever parse output changes: it is part of every ParseCache key.
+PARSER_VERSION = 1
+
+# --- Precompiled Patterns ---
+_TAG = re.compile(r"\[[^\[\]]*\]")
+_DRAW = re.compile(r"draw (\d+) cards?")
+_TRASH = re.compile(r"trash (\d+) cards? from your hand")
+_RETURN_HAND = re.compile(r"return up to (\d+) .*? to the owner's hand")
+_RETURN_BOTTOM = re.compile(r"(?:place|return) up to (\d+) .*? (?:at|to) the bottom of the owner's deck")
+_GIVE_COST = re.compile(r"give .*? (-?\d+) cost")
+_DON_MINUS = re.compile(r"don!! -(\d+)")
+_PLUS_NUMBER = re.compile(r'\+(\d+)')
+_MINUS_NUMBER = re.compile(r'-(\d+)')
+_COST_OR_LESS = re.compile(r'cost of (\d+) or less')
+
+# Tags whose following text is parsed as one effect, in output order.
+_SECTION_TAGS = (
+    (EffectType.ON_PLAY, ("[On Play]",)),
+    (EffectType.WHEN_ATTACKING, ("[When Attacking]",)),
+    (EffectType.ACTIVATE_MAIN, ("[Activate:Main]", "[Activate: Main]")),
+)
+# Keyword tags, in output order.
+_KEYWORD_TAGS = (
+    ("[Blocker]", EffectType.BLOCKER),
+    ("[Rush]", EffectType.RUSH),
+    ("[Banish]", EffectType.BANISH),
+    ("[Double Attack]", EffectType.DOUBLE_ATTACK),
+)
+
+class ParseCache:
+    """
+    Persistent cache of parsed effect lists, keyed by a hash of
+    (PARSER_VERSION, effect text). Stored as JSON: {key: [effect dict, ...]}.
+    Entries of older parser versions simply never match again.
+    """
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.entries: Dict[str, list] = {}
+        self.dirty = False
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable parse cache {path}: {e}")
+
+    @staticmethod
+    def key(effect_text: str) -> str:
+        return hashlib.blake2b(f"{PARSER_VERSION}\0{effect_text}".encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, effect_text: str) -> Optional[List[Effect]]:
+        data = self.entries.get(self.key(effect_text))
+        if data is None:
+            return None
+        return [Effect(**e) for e in data]
+
+    def put(self, effect_text: str, effects: List[Effect]):
+        self.entries[self.key(effect_text)] = [e.model_dump(mode='json') for e in effects]
+        self.dirty = True
+
+    def save(self):
+        if not self.path or not self.dirty:
+            return
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
 class EffectParser:
     """
     Parses raw card text into structured Effect objects.
+    An optional ParseCache skips parsing for effect texts seen before.
     """
+    def __init__(self, cache: Optional[ParseCache] = None):
+        self.cache = cache
     
     def parse_effects(self, effect_text: str) -> List[Effect]:
         """
@@ -14,12 +89,28 @@ class EffectParser:
         """
         if not effect_text:
             return []
-            
+        if self.cache is None:
+            return self._parse(effect_text)
+
+        effects = self.cache.get(effect_text)
+        if effects is None:
+            effects = self._parse(effect_text)
+            self.cache.put(effect_text, effects)
+        return effects
+
+    def _parse(self, effect_text: str) -> List[Effect]:
         effects = []
         
         # Normalize
         text = effect_text.replace("\r\n", " ").replace("<br>", " ")
 
+        # --- Tokenize ---
+        # One pass over the bracketed tags: tag -> end offset of its first occurrence.
+        # Content of a section tag is the rest of the text after it.
+        tags: Dict[str, int] = {}
+        for match in _TAG.finditer(text):
+            tags.setdefault(match.group(), match.end())
+
         # --- Extract Global Costs/Conditions (Naive) ---
         # "DON!! -X" -> Cost
         # "DON!! xX" -> Condition
@@ -27,112 +118,63 @@ class EffectParser:
         # but for now, if found at start of text, we might apply to all? 
         # Better: _parse_single_effect should check for them in the specific effect chunk.
         
-        # Check for On Play
-        if "[On Play]" in text:
-            # Extract content after [On Play] until next tag or end
-            content = self._extract_content(text, "[On Play]")
-            effect = self._parse_single_effect(EffectType.ON_PLAY, content)
-            if effect:
-                effects.append(effect)
+        # On Play / When Attacking / Activate: Main
+        for effect_type, variants in _SECTION_TAGS:
+            for tag in variants:
+                if tag in tags:
+                    effect = self._parse_single_effect(effect_type, text[tags[tag]:].strip())
+                    if effect:
+                        effects.append(effect)
+                    break
 
-        # Check for When Attacking
-        if "[When Attacking]" in text:
-            content = self._extract_content(text, "[When Attacking]")
-            effect = self._parse_single_effect(EffectType.WHEN_ATTACKING, content)
-            if effect:
-                effects.append(effect)
-                
-        # Check for Activate: Main
-        if "[Activate: Main]" in text or "[Activate:Main]" in text:
-             # Normalize tag first?
-             tag = "[Activate:Main]" if "[Activate:Main]" in text else "[Activate: Main]"
-             content = self._extract_content(text, tag)
-             effect = self._parse_single_effect(EffectType.ACTIVATE_MAIN, content)
-             if effect:
-                 effects.append(effect)
-
-        # Check for Blocker
-        if "[Blocker]" in text:
-            effects.append(Effect(type=EffectType.BLOCKER, action_code=EffectType.BLOCKER, description="[Blocker]"))
-            
-        if "[Rush]" in text:
-            effects.append(Effect(type=EffectType.RUSH, action_code=EffectType.RUSH, description="[Rush]"))
-            
-        if "[Banish]" in text:
-            effects.append(Effect(type=EffectType.BANISH, action_code=EffectType.BANISH, description="[Banish]"))
-            
-        if "[Double Attack]" in text:
-            effects.append(Effect(type=EffectType.DOUBLE_ATTACK, action_code=EffectType.DOUBLE_ATTACK, description="[Double Attack]"))
+        # Keywords (Blocker, Rush, Banish, Double Attack)
+        for tag, effect_type in _KEYWORD_TAGS:
+            if tag in tags:
+                effects.append(Effect(type=effect_type, action_code=effect_type, description=tag))
 
         # --- General Text Parsing (regex) ---
+        # Each pattern is guarded by a literal it requires: a substring test is far
+        # cheaper than a failed search, and most texts match none of them.
         text_lower = text.lower()
         
-        # Check for Draw
-        if "draw" in text_lower:
-            draw_match = re.search(r"draw (\d+) cards?", text_lower)
-            if draw_match:
-                count = int(draw_match.group(1))
-                effects.append(Effect(type=EffectType.DRAW_CARD, action_code=EffectType.DRAW_CARD, value=count, description=f"Draw {count} cards"))
-
-        # Check for Trash
-        if "trash" in text_lower:
-            # "trash x cards from your hand"
-            trash_match = re.search(r"trash (\d+) cards? from your hand", text_lower)
-            if trash_match:
-                count = int(trash_match.group(1))
-                effects.append(Effect(type=EffectType.TRASH_CARD, action_code=EffectType.TRASH_CARD, value=count, description=f"Trash {count} cards from hand"))
-
-        # Check for Return to Hand
-        if "return" in text_lower and "hand" in text_lower:
-            return_match = re.search(r"return up to (\d+) .*? to the owner's hand", text_lower)
-            if return_match:
-                count = int(return_match.group(1))
-                effects.append(Effect(type=EffectType.RETURN_TO_HAND, action_code=EffectType.RETURN_TO_HAND, value=count, description="Return to hand"))
+        # Draw
+        draw_match = "draw" in text_lower and _DRAW.search(text_lower)
+        if draw_match:
+            count = int(draw_match.group(1))
+            effects.append(Effect(type=EffectType.DRAW_CARD, action_code=EffectType.DRAW_CARD, value=count, description=f"Draw {count} cards"))
+
+        # Trash: "trash x cards from your hand"
+        trash_match = "trash" in text_lower and _TRASH.search(text_lower)
+        if trash_match:
+            count = int(trash_match.group(1))
+            effects.append(Effect(type=EffectType.TRASH_CARD, action_code=EffectType.TRASH_CARD, value=count, description=f"Trash {count} cards from hand"))
+
+        # Return to Hand
+        return_match = "owner's hand" in text_lower and _RETURN_HAND.search(text_lower)
+        if return_match:
+            count = int(return_match.group(1))
+            effects.append(Effect(type=EffectType.RETURN_TO_HAND, action_code=EffectType.RETURN_TO_HAND, value=count, description="Return to hand"))
         
-        # Check for Return to Bottom of Deck
-        if "bottom" in text_lower and "deck" in text_lower and ("place" in text_lower or "return" in text_lower):
-             # "Place up to 1 ... at the bottom of the owner's deck"
-             deck_match = re.search(r"(?:place|return) up to (\d+) .*? (?:at|to) the bottom of the owner's deck", text_lower)
-             if deck_match:
-                 count = int(deck_match.group(1))
-                 effects.append(Effect(type=EffectType.RETURN_TO_BOTTOM_DECK, action_code=EffectType.RETURN_TO_BOTTOM_DECK, value=count, description="Return to bottom deck"))
-
-        # Check for Cost Change (Give -X cost)
-        if "cost" in text_lower and "give" in text_lower:
-             cost_match = re.search(r"give .*? (-?\d+) cost", text_lower)
-             if cost_match:
-                 val = int(cost_match.group(1))
-                 effects.append(Effect(type=EffectType.COST_CHANGE, action_code=EffectType.COST_CHANGE, value=val, description=f"Give {val} cost"))
-
-        # Check for Trigger
-        if "[Trigger]" in text:
-            content = self._extract_content(text, "[Trigger]")
-            effect = self._parse_single_effect(EffectType.TRIGGER, content)
+        # Return to Bottom of Deck: "Place up to 1 ... at the bottom of the owner's deck"
+        deck_match = "bottom of the owner's deck" in text_lower and _RETURN_BOTTOM.search(text_lower)
+        if deck_match:
+            count = int(deck_match.group(1))
+            effects.append(Effect(type=EffectType.RETURN_TO_BOTTOM_DECK, action_code=EffectType.RETURN_TO_BOTTOM_DECK, value=count, description="Return to bottom deck"))
+
+        # Cost Change (Give -X cost)
+        cost_match = " cost" in text_lower and _GIVE_COST.search(text_lower)
+        if cost_match:
+            val = int(cost_match.group(1))
+            effects.append(Effect(type=EffectType.COST_CHANGE, action_code=EffectType.COST_CHANGE, value=val, description=f"Give {val} cost"))
+
+        # Trigger
+        if "[Trigger]" in tags:
+            effect = self._parse_single_effect(EffectType.TRIGGER, text[tags["[Trigger]"]:].strip())
             if effect:
                 effects.append(effect)
                 
         return effects
 
-    def _extract_content(self, text: str, tag: str) -> str:
-        """
-        Extracts text immediately following a tag, up to the next tag or end of string.
-        """
-        start_idx = text.find(tag)
-        if start_idx == -1:
-            return ""
-        
-        start_content = start_idx + len(tag)
-        sub_text = text[start_content:].strip()
-        
-        # Find next tag to stop
-        # Potential tags: [On Play], [When Attacking], [Your Turn], [Blocker], etc.
-        # Simple heuristic: Look for next '[' that starts a known tag? 
-        # For now, let's just take the rest of the string or split by common delimiters if needed.
-        # But often multiple effects are separated clearly.
-        # Let's assume one main effect per tag for this POC or take until end of sentence if robust.
-        
-        return sub_text
-
     def _parse_single_effect(self, effect_type: EffectType, content: str) -> Optional[Effect]:
         """
         Analyzes the content text to determine the specific action (KO, Buff, etc.)
@@ -148,7 +190,7 @@ class EffectParser:
         
         # --- Extract Costs ---
         # DON!! -X (Return X Don to deck)
-        don_minus_match = re.search(r"don!! -(\d+)", content_lower)
+        don_minus_match = _DON_MINUS.search(content_lower)
         if don_minus_match:
             condition_cost = int(don_minus_match.group(1))
             
@@ -168,7 +210,7 @@ class EffectParser:
         if "+" in content and "power" in content_lower:
             action_code = EffectType.BUFF_POWER
             # Extract number
-            match = re.search(r'\+(\d+)', content)
+            match = _PLUS_NUMBER.search(content)
             if match:
                 action_power = int(match.group(1))
             
@@ -183,7 +225,7 @@ class EffectParser:
                  
             # Check for Debuff (Negative power)
             if "-" in content:
-                 match_neg = re.search(r'-(\d+)', content)
+                 match_neg = _MINUS_NUMBER.search(content)
                  if match_neg:
                      action_power = -int(match_neg.group(1))
                      
@@ -192,7 +234,7 @@ class EffectParser:
         elif "k.o." in content_lower:
             action_code = EffectType.KO_CHARACTER
             # Extract Cost Constraint
-            cost_match = re.search(r'cost of (\d+) or less', content_lower)
+            cost_match = _COST_OR_LESS.search(content_lower)
             if cost_match:
                 cost_val = int(cost_match.group(1))
                 target_filter = f"opponent|character|cost<={cost_val}"
@@ -0,0 +1,116 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from pydantic import BaseModel
+from engine.models.card import Card, CardInstance
+from engine.models.effect import Effect
+from engine.core.effect_program import EffectProgram, compile_card, compile_effect, effect_key
+
+NO_HANDLE = -1
+
+
+def card_key(card: Card) -> tuple:
+    """Hashable value of a Card definition (its list fields make Card itself unhashable)."""
+    return tuple(
+        tuple(effect_key(item) if isinstance(item, BaseModel) else item for item in value)
+        if isinstance(value, list) else value
+        for value in card.__dict__.values()
+    )
+
+
+class CardRegistry:
+    """
+    Interned, immutable Card definitions addressed by dense integer handles.
+
+    - register(card) -> handle: O(1) for a registered Card object (identity),
+      otherwise dedups against an equal definition (card_key), so registering
+      the same definitions again (e.g. reloading the card DB) adds no handles.
+    - get(handle) -> Card: a list index.
+    - programs[handle]: the card's effects compiled once, at registration
+      (see engine.core.effect_program).
+    - program_for(effect): the program of an Effect resolved outside a card,
+      compiled once per distinct effect value.
+
+    CardInstance.card_handle points back here, which lets the engine move a card
+    in play back to hand / trash / deck as its original definition.
+    """
+    def __init__(self):
+        self.cards: List[Card] = []
+        self.programs: List[Tuple[EffectProgram, ...]] = []
+        self._by_id: Dict[str, int] = {}
+        self._by_key: Dict[tuple, int] = {}
+        # id(card) -> handle of the canonical cards only: they live in `cards`, so
+        # the ids stay valid. Equal duplicates are found by value and not kept alive.
+        self._by_identity: Dict[int, int] = {}
+        self._effect_programs: Dict[tuple, EffectProgram] = {}
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def register(self, card: Card) -> int:
+        handle = self._by_identity.get(id(card))
+        if handle is not None:
+            return handle
+
+        key = card_key(card)
+        handle = self._by_key.get(key)
+        if handle is None:
+            # New definition (or a variant reusing an id, e.g. another printing)
+            handle = len(self.cards)
+            self.cards.append(card)
+            self.programs.append(compile_card(card))
+            self._by_key[key] = handle
+            self._by_id.setdefault(card.id, handle)
+            self._by_identity[id(card)] = handle
+        return handle
+
+    def program_for(self, effect: Effect) -> EffectProgram:
+        key = effect_key(effect)
+        program = self._effect_programs.get(key)
+        if program is None:
+            program = self._effect_programs[key] = compile_effect(effect)
+        return program
+
+    def register_all(self, cards: Iterable[Card]) -> List[int]:
+        return [self.register(card) for card in cards]
+
+    def handles(self, cards: List[Card]) -> List[int]:
+        """
+        register_all() for a zone: one C-level pass when every card object is a
+        registered canonical one (the common case: the loaders intern deck cards).
+        """
+        try:
+            return list(map(self._by_identity.__getitem__, map(id, cards)))
+        except KeyError:
+            return self.register_all(cards)
+
+    def intern(self, card: Card) -> Card:
+        """
+        Return the canonical Card object for this definition.
+        """
+        return self.cards[self.register(card)]
+
+    def get(self, handle: int) -> Card:
+        return self.cards[handle]
+
+    def handle_of(self, card_id: str) -> Optional[int]:
+        return self._by_id.get(card_id)
+
+    def get_by_id(self, card_id: str) -> Optional[Card]:
+        handle = self._by_id.get(card_id)
+        return self.cards[handle] if handle is not None else None
+
+    def card_for(self, instance: CardInstance) -> Optional[Card]:
+        """
+        Definition of a card in play. Falls back to the card_id for instances
+        created without a handle (e.g. leaders set up by hand).
+        """
+        if instance.card_handle != NO_HANDLE:
+            return self.cards[instance.card_handle]
+        return self.get_by_id(instance.card_id)
+
+
+# Process-wide registry shared by the loaders, the engine and effects.
+_default_registry = CardRegistry()
+
+
+def get_card_registry() -> CardRegistry:
+    return _default_registry
@@ -0,0 +1,236 @@
+"""
+Gym-style environment API over the Game engine.
+
+GameEnv wraps one Game:
+    obs, mask = env.reset(seed)
+    obs, mask, reward, done, info = env.step(action_index)
+
+- action_index: integer action (engine.core.action_space); mask is the
+  (NUM_ACTIONS,) bool array of legal indices for the player to act.
+- observation: observe(state, player_id) for the player to act next
+  (info["player"]); by default the GameState itself.
+- reward: +1 / -1 when the step ends the game, from the point of view of the
+  player who acted; 0 otherwise. done is also set when max_turns is exceeded
+  (info["truncated"]).
+- opponent: optional agent for one seat; its decisions are played inside
+  step/reset, so the caller only ever acts for the other seat.
+
+VecEnv steps many GameEnvs together, in-process (workers=0) or spread over
+subprocess workers, and resets finished games automatically.
+"""
+import multiprocessing as mp
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from engine.core.game import Game
+from engine.core.action_space import acting_player_id, action_mask
+from engine.data.registry import CardRegistry, get_card_registry
+from engine.models.card import Card, CardInstance
+from engine.models.player import Player
+from engine.state import GameState
+from engine.utils.seeding import derive_seed, new_master_seed
+
+
+def state_observation(state: GameState, player_id: str) -> GameState:
+    return state
+
+
+class DeckGameFactory:
+    """
+    Picklable Game factory for a leader / deck matchup (same setup as
+    tournament_runner.build_game), usable by subprocess workers.
+    """
+    def __init__(self, leader1: Card, deck1: List[Card], leader2: Card, deck2: List[Card],
+                 auto_advance: bool = False):
+        self.leader1, self.deck1, self.leader2, self.deck2 = leader1, deck1, leader2, deck2
+        self.auto_advance = auto_advance
+
+    def __call__(self, seed: int, registry: Optional[CardRegistry] = None,
+                 auto_advance: Optional[bool] = None) -> Game:
+        registry = registry if registry is not None else get_card_registry()
+        players = []
+        for pid, name, leader, deck in (("p1", "Player 1", self.leader1, self.deck1),
+                                        ("p2", "Player 2", self.leader2, self.deck2)):
+            player = Player(id=pid, name=name, deck=deck[:], life=[])
+            player.leader = CardInstance(card_id=leader.id, card_handle=registry.register(leader),
+                                         instance_id=f"{pid}_leader", owner_id=pid, current_power=leader.power)
+            players.append(player)
+        auto_advance = self.auto_advance if auto_advance is None else auto_advance
+        game = Game(players[0], players[1], registry=registry, seed=seed, auto_advance=auto_advance)
+        game.start_game()
+        return game
+
+
+class GameEnv:
+    def __init__(self, make_game: Callable[[int], Game], observe: Callable[[GameState, str], Any] = state_observation,
+                 opponent=None, opponent_id: str = "p2", max_turns: Optional[int] = 100):
+        """
+        make_game: seed -> started Game (e.g. DeckGameFactory).
+        opponent: agent (take_action / reset) playing seat opponent_id, or None for self-play.
+        """
+        self.make_game = make_game
+        self.observe = observe
+        self.opponent = opponent
+        self.opponent_id = opponent_id
+        self.max_turns = max_turns
+        self.game: Optional[Game] = None
+        self._player: Optional[str] = None
+        self._legal: List[int] = []
+
+    @classmethod
+    def from_decks(cls, leader1: Card, deck1: List[Card], leader2: Card, deck2: List[Card], **kwargs) -> "GameEnv":
+        return cls(DeckGameFactory(leader1, deck1, leader2, deck2), **kwargs)
+
+    @property
+    def player(self) -> str:
+        """Player to act next."""
+        return self._player
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[Any, np.ndarray]:
+        seed = seed if seed is not None else new_master_seed()
+        self.game = self.make_game(seed)
+        if self.opponent is not None:
+            self.opponent.reset(derive_seed(seed, self.opponent_id))
+        self._advance()
+        return self.observe(self.game.state, self._player), self.legal_mask()
+
+    def legal_mask(self) -> np.ndarray:
+        return action_mask(self._legal)
+
+    def step(self, action_index: int) -> Tuple[Any, np.ndarray, float, bool, Dict]:
+        action_index = int(action_index)
+        if action_index not in self._legal:
+            raise ValueError(f"Illegal action index {action_index} for {self._player}")
+        actor = self._player
+        self.game.process_action(action_index)
+        self._advance()
+
+        state = self.game.state
+        winner = state.winner_id
+        truncated = winner is None and self.max_turns is not None and state.turn_count > self.max_turns
+        reward = 0.0 if winner is None else (1.0 if winner == actor else -1.0)
+        info = {"player": self._player, "winner": winner, "truncated": truncated, "turn": state.turn_count}
+        return self.observe(state, self._player), self.legal_mask(), reward, winner is not None or truncated, info
+
+    def _advance(self):
+        """Collect the legal actions; play the opponent's decisions until the caller must act."""
+        game = self.game
+        while True:
+            if game.state.winner_id:
+                self._player, self._legal = None, []
+                return
+            self._player = acting_player_id(game.state)
+            if self.opponent is None or self._player != self.opponent_id:
+                self._legal = game.legal_actions()
+                return
+            # Agents take GameActions
+            action = self.opponent.take_action(game.state, game.get_valid_actions())
+            if action is None or not game.process_action(action):
+                raise RuntimeError(f"Opponent {type(self.opponent).__name__} ({self.opponent_id}) "
+                                   f"played an action the engine rejected: {action!r}")
+
+
+# --- Vectorized ---
+
+class _EnvGroup:
+    """A list of GameEnvs with auto-reset; runs in the caller or in a worker process."""
+    def __init__(self, env_fns: Sequence[Callable[[], GameEnv]], offset: int):
+        self.envs = [fn() for fn in env_fns]
+        self.offset = offset
+        self.episodes = [0] * len(self.envs)
+        self.seed = 0
+
+    def reset(self, seed: int):
+        self.seed = seed
+        self.episodes = [0] * len(self.envs)
+        return [env.reset(derive_seed(seed, self.offset + i, 0)) for i, env in enumerate(self.envs)]
+
+    def step(self, actions):
+        results = []
+        for i, (env, action) in enumerate(zip(self.envs, actions)):
+            obs, mask, reward, done, info = env.step(action)
+            if done:
+                self.episodes[i] += 1
+                info["final_observation"] = obs
+                obs, mask = env.reset(derive_seed(self.seed, self.offset + i, self.episodes[i]))
+            results.append((obs, mask, reward, done, info))
+        return results
+
+
+def _worker(conn, env_fns, offset):
+    group = _EnvGroup(env_fns, offset)
+    while True:
+        command, payload = conn.recv()
+        if command == "reset":
+            conn.send(group.reset(payload))
+        elif command == "step":
+            conn.send(group.step(payload))
+        elif command == "close":
+            conn.close()
+            return
+
+
+class VecEnv:
+    """
+    N GameEnvs stepped together.
+
+        venv = VecEnv([lambda: GameEnv.from_decks(l1, d1, l2, d2)] * 64, workers=4)
+        obs, masks = venv.reset(seed=0)                    # masks: (N, NUM_ACTIONS)
+        obs, masks, rewards, dones, infos = venv.step(actions)
+
+    Finished games are reset at once (info["final_observation"] keeps the last
+    observation). Env i's k-th game uses derive_seed(seed, i, k), so results do
+    not depend on the number of workers.
+    workers=0 steps in-process; otherwise the envs are split over that many
+    processes (env_fns must then be picklable, e.g. functools.partial).
+    """
+    def __init__(self, env_fns: Sequence[Callable[[], GameEnv]], workers: int = 0):
+        self.num_envs = len(env_fns)
+        self.workers = workers
+        if workers <= 0:
+            self._group = _EnvGroup(env_fns, 0)
+            return
+        bounds = np.linspace(0, self.num_envs, workers + 1).astype(int)
+        self._slices = [(start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+        self._conns = []
+        self._processes = []
+        for start, stop in self._slices:
+            parent, child = mp.Pipe()
+            process = mp.Process(target=_worker, args=(child, env_fns[start:stop], start), daemon=True)
+            process.start()
+            child.close()
+            self._conns.append(parent)
+            self._processes.append(process)
+
+    def reset(self, seed: Optional[int] = None):
+        seed = seed if seed is not None else new_master_seed()
+        if self.workers <= 0:
+            results = self._group.reset(seed)
+        else:
+            for conn in self._conns:
+                conn.send(("reset", seed))
+            results = [r for conn in self._conns for r in conn.recv()]
+        obs, masks = zip(*results)
+        return list(obs), np.stack(masks)
+
+    def step(self, actions: Sequence[int]):
+        actions = [int(a) for a in actions]
+        if self.workers <= 0:
+            results = self._group.step(actions)
+        else:
+            for conn, (start, stop) in zip(self._conns, self._slices):
+                conn.send(("step", actions[start:stop]))
+            results = [r for conn in self._conns for r in conn.recv()]
+        obs, masks, rewards, dones, infos = zip(*results)
+        return (list(obs), np.stack(masks), np.array(rewards, dtype=np.float32),
+                np.array(dones, dtype=bool), list(infos))
+
+    def close(self):
+        if self.workers > 0:
+            for conn in self._conns:
+                conn.send(("close", None))
+            for process in self._processes:
+                process.join()
+            self.workers = 0
+            self._group = None
@@ -1,5 +1,6 @@
 from typing import List, Optional, Literal
 from pydantic import BaseModel, Field
+from engine.utils.fast_copy import shallow_copy
 from engine.models.effect import Effect
 
 # Constants for Card Types and Attributes
@@ -7,6 +8,15 @@ CardType = Literal['LEADER', 'CHARACTER', 'EVENT', 'STAGE', 'DON']
 CardColor = Literal['RED', 'GREEN', 'BLUE', 'PURPLE', 'BLACK', 'YELLOW']
 CardAttribute = Literal['STRIKE', 'SLASH', 'SPECIAL', 'WISDOM', 'RANGED']
 
+# Bit flags of CardInstance.keyword_flags
+KEYWORD_FLAGS = {'BLOCKER': 1, 'RUSH': 2, 'DOUBLE_ATTACK': 4, 'BANISH': 8}
+
+def keyword_mask(keywords) -> int:
+    mask = 0
+    for keyword in keywords:
+        mask |= KEYWORD_FLAGS.get(keyword, 0)
+    return mask
+
 class CardEffect(BaseModel):
     """
     Represents a parsed effect of a card.
@@ -47,6 +57,7 @@ class CardInstance(BaseModel):
     Represents a specific card in play (on the field).
     """
     card_id: str = Field(..., description="Reference to the Card Definition ID")
+    card_handle: int = Field(-1, description="Handle into the CardRegistry (-1 if not registered)")
     instance_id: str = Field(..., description="Unique ID for this specific instance in the game")
     owner_id: str
     
@@ -59,7 +70,26 @@ class CardInstance(BaseModel):
     power_modifier: int = 0
     cost_modifier: int = 0
     granted_keywords: List[str] = Field(default_factory=list) # e.g. RUSH, BLOCKER
+    # granted_keywords as KEYWORD_FLAGS bits, for cheap checks (char.keyword_flags & BLOCKER).
+    # Derived on construction and kept in sync where keywords change: GameState.update_instance,
+    # entering the field (FieldArea.add_character), snapshot restore. After editing
+    # granted_keywords in place, call sync_keyword_flags().
+    keyword_flags: int = 0
+
+    def model_post_init(self, __context):
+        if self.granted_keywords and 'keyword_flags' not in self.model_fields_set:
+            self.__dict__['keyword_flags'] = keyword_mask(self.granted_keywords)
+
+    def sync_keyword_flags(self):
+        """Recompute keyword_flags from granted_keywords."""
+        self.__dict__['keyword_flags'] = keyword_mask(self.granted_keywords) if self.granted_keywords else 0
     
     @property
     def total_power(self) -> int:
         return self.current_power + self.power_modifier + (self.attached_don * 1000)
+
+    def clone(self) -> "CardInstance":
+        """
+        Cheap copy for state branching. Only the mutable keyword list is duplicated.
+        """
+        return shallow_copy(self, granted_keywords=self.granted_keywords.copy())
@@ -1,5 +1,6 @@
 from typing import List, Optional
 from pydantic import BaseModel, Field
+from engine.utils.fast_copy import shallow_copy
 from engine.models.card import CardInstance
 
 class FieldArea(BaseModel):
@@ -13,6 +14,7 @@ class FieldArea(BaseModel):
     def add_character(self, character: CardInstance):
         if len(self.character_area) >= 5:
             raise ValueError("Character area is full (Max 5)")
+        character.sync_keyword_flags()
         self.character_area.append(character)
         
     def remove_character(self, instance_id: str) -> Optional[CardInstance]:
@@ -20,3 +22,10 @@ class FieldArea(BaseModel):
             if char.instance_id == instance_id:
                 return self.character_area.pop(i)
         return None
+
+    def clone(self) -> "FieldArea":
+        return shallow_copy(
+            self,
+            character_area=[char.clone() for char in self.character_area],
+            stage_area=self.stage_area.clone() if self.stage_area else None,
+        )
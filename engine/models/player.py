@@ -1,5 +1,6 @@
 from typing import List, Optional
 from pydantic import BaseModel, Field
+from engine.utils.fast_copy import shallow_copy
 from engine.models.card import Card, CardInstance
 from engine.models.field import FieldArea
 
@@ -36,3 +37,20 @@ class Player(BaseModel):
             else:
                 # Deck out logic (Lose game?)
                 pass
+
+    def clone(self) -> "Player":
+        """
+        Structural copy used when branching the game state.
+        Card definitions are frozen, so zone lists are copied shallowly and the
+        Card objects themselves are shared between the original and the clone.
+        """
+        return shallow_copy(
+            self,
+            life=self.life.copy(),
+            hand=self.hand.copy(),
+            deck=self.deck.copy(),
+            trash=self.trash.copy(),
+            field=self.field.clone(),
+            leader=self.leader.clone() if self.leader else None,
+            cost_area=self.cost_area.copy(),
+        )
@@ -0,0 +1,191 @@
+"""
+Binary game records and a replayer.
+
+A game is fully determined by its seed, the two decks (in load order, before
+the shuffle) and the actions the players chose, so that is all a record keeps:
+
+    file header : magic, format version
+    record      : seed u64, deck hash u64 x2, flags u8, winner u8, action count u32
+                  + one byte per action (its index in engine.core.action_space)
+
+Actions played by the engine itself (auto_advance) are not stored; the AUTO_ADVANCE
+flag makes the replay skip them the same way. A typical tournament game is well
+under 100 bytes, so a million games fit in tens of megabytes.
+
+Replayer rebuilds any position of a record by re-executing it through
+Game.process_action on a silent event bus:
+
+    replayer = Replayer(leader1, deck1, leader2, deck2)
+    with ReplayFile("games.oprp") as replays:
+        game = replayer.replay(replays[17], stop=40)   # position after 40 actions
+"""
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+from typing import Iterator, List, NamedTuple, Optional, Sequence
+
+from engine.core.action_space import NUM_ACTIONS
+from engine.core.game import Game
+from engine.data.registry import CardRegistry
+from engine.env import DeckGameFactory
+from engine.models.card import Card
+
+MAGIC = b"OPRP"
+FORMAT_VERSION = 1
+
+AUTO_ADVANCE = 1    # flags bit
+
+_HEADER = struct.Struct("<4sHH")            # magic, version, reserved
+_RECORD = struct.Struct("<QQQBBI")          # seed, deck hash p1, deck hash p2, flags, winner, action count
+
+assert NUM_ACTIONS <= 256, "actions are stored as one byte each"
+
+
+def deck_hash(leader: Card, deck: Sequence[Card]) -> int:
+    """64-bit fingerprint of a leader and a deck list (order matters: it feeds the shuffle)."""
+    material = "\x1f".join([leader.id] + [card.id for card in deck]).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(material, digest_size=8).digest(), "little")
+
+
+class GameRecord(NamedTuple):
+    seed: int
+    deck_hashes: tuple          # (p1, p2), see deck_hash()
+    auto_advance: bool
+    winner: int                 # 0 = none (draw / unfinished), 1 = first player, 2 = second player
+    actions: bytes              # action indices, one byte each
+
+    def pack(self) -> bytes:
+        flags = AUTO_ADVANCE if self.auto_advance else 0
+        return _RECORD.pack(self.seed, self.deck_hashes[0], self.deck_hashes[1], flags, self.winner,
+                            len(self.actions)) + bytes(self.actions)
+
+    @classmethod
+    def unpack_from(cls, buf, offset: int = 0) -> "GameRecord":
+        seed, hash1, hash2, flags, winner, count = _RECORD.unpack_from(buf, offset)
+        start = offset + _RECORD.size
+        return cls(seed, (hash1, hash2), bool(flags & AUTO_ADVANCE), winner, bytes(buf[start:start + count]))
+
+
+def winner_code(game: Game) -> int:
+    winner = game.state.winner_id
+    if not winner:
+        return 0
+    return list(game.state.players).index(winner) + 1
+
+
+class ReplayWriter:
+    """Appends records to a replay file (created with its header if missing or empty)."""
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'ab')
+        if self._file.tell() == 0:
+            self._file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0))
+        else:
+            with open(path, 'rb') as f:
+                _check_header(f.read(_HEADER.size), path)
+        self.count = 0
+
+    def write(self, record: GameRecord):
+        self._file.write(record.pack())
+        self.count += 1
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _check_header(buf, path: str):
+    if len(buf) < _HEADER.size:
+        raise ValueError(f"{path} is not a replay file of format version {FORMAT_VERSION}")
+    magic, version, _ = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"{path} is not a replay file of format version {FORMAT_VERSION}")
+
+
+class ReplayFile:
+    """
+    Read-only, memory-mapped replay file. Records are indexed on open (one header
+    read per record), so replays[i] is random access.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            _check_header(f.read(_HEADER.size), path)
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._offsets = array('Q')
+        pos = _HEADER.size
+        count_at = _RECORD.size - 4
+        while pos + _RECORD.size <= size:
+            self._offsets.append(pos)
+            (count,) = struct.unpack_from("<I", self._mm, pos + count_at)
+            pos += _RECORD.size + count
+        if pos != size:
+            raise ValueError(f"{path} ends with a truncated record")
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> GameRecord:
+        return GameRecord.unpack_from(self._mm, self._offsets[index])
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        for offset in self._offsets:
+            yield GameRecord.unpack_from(self._mm, offset)
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_records(path: str) -> List[GameRecord]:
+    with ReplayFile(path) as replays:
+        return list(replays)
+
+
+class Replayer:
+    """Rebuilds positions of the recorded games of one matchup."""
+    def __init__(self, leader1: Card, deck1: List[Card], leader2: Card, deck2: List[Card],
+                 registry: Optional[CardRegistry] = None):
+        self.factory = DeckGameFactory(leader1, deck1, leader2, deck2)
+        self.registry = registry
+        self.deck_hashes = (deck_hash(leader1, deck1), deck_hash(leader2, deck2))
+
+    def new_game(self, record: GameRecord) -> Game:
+        """The started game of a record, before any recorded action."""
+        if tuple(record.deck_hashes) != self.deck_hashes:
+            raise ValueError("Record was played with different decks")
+        return self.factory(record.seed, self.registry, auto_advance=record.auto_advance)
+
+    def steps(self, record: GameRecord) -> Iterator[Game]:
+        """
+        Yields the game at the start and after each recorded action. The same Game
+        is advanced in place: clone game.state to keep a position.
+        """
+        game = self.new_game(record)
+        yield game
+        for i, index in enumerate(record.actions):
+            if not game.process_action(index):
+                raise ValueError(f"Recorded action {i} ({index}) is illegal on replay")
+            yield game
+
+    def replay(self, record: GameRecord, stop: Optional[int] = None) -> Game:
+        """The game after the first `stop` recorded actions (all of them by default)."""
+        game = self.new_game(record)
+        actions = record.actions if stop is None else record.actions[:stop]
+        for i, index in enumerate(actions):
+            if not game.process_action(index):
+                raise ValueError(f"Recorded action {i} ({index}) is illegal on replay")
+        return game
@@ -0,0 +1,234 @@
+"""
+Versioned binary snapshots of GameState.
+
+snapshot() packs a state into a compact blob and restore() rebuilds an equal
+state from it, for checkpoints (API, distributed search, crash recovery of long
+runs). Compared to model_dump_json() the blob is ~30x smaller and both directions
+are an order of magnitude faster: zone cards are CardRegistry handles instead of
+full Card dumps, and nothing goes through pydantic validation.
+
+Layout (little-endian):
+
+    header   : magic, format version, reserved
+    counts   : texts, text bytes, card table entries
+    lengths  : u16 UTF-8 byte length of every text (0xFFFF: a missing id)
+    texts    : every id / name / keyword in the order the body reads them, then
+               the card id of each card table entry (UTF-8, back to back)
+    cards    : u16 handle of every card in the state (the card table)
+    body     : state, battle (if any), then per player: DON!!, zone sizes,
+               zone handles, instances (leader, characters, stage)
+
+Handles are only meaningful to a registry holding the same definitions, so the
+card table records each handle's card id: restore() uses the handle when the
+registry agrees and looks the id up otherwise (ValueError if it is unknown).
+The RNG of a Game is not part of its state (see Game.restore).
+"""
+import struct
+from typing import Dict, List, Optional
+
+from engine.compact_state import PHASES, PHASE_INDEX
+from engine.core.battle import BattlePhase
+from engine.core.instance_index import InstanceIndex
+from engine.data.registry import CardRegistry, get_card_registry
+from engine.models.card import Card, CardInstance, keyword_mask
+from engine.models.field import FieldArea
+from engine.models.player import Player
+from engine.state import GameState
+from engine.utils.fast_copy import construct
+
+MAGIC = b"OPSS"
+FORMAT_VERSION = 3
+ABSENT = 0xFFFF         # text length of a missing id (winner, blocker)
+
+_HEADER = struct.Struct("<4sHH")        # magic, version, reserved
+_COUNTS = struct.Struct("<IIH")         # texts, text bytes, card table entries
+# Body records; their texts are read in the order noted after '+'
+_STATE = "IBBB"                         # turn, phase, player count, battle flag     + active, winner
+_BATTLE = "iiiH"                        # attacker / target power, counter bonus, counters
+                                        #   + attacker, attacker / target instance, step, blocker, counters
+_PLAYER = "hhhHHHHHBB"                  # DON!! x3, life / hand / deck / trash / cost area sizes,
+                                        # leader + stage bits, characters            + id, name, cost area
+_INSTANCE = "iBiiiiB"                   # handle, rested, current power, attached DON!!, power / cost
+                                        # modifier, keywords             + card id, instance id, owner, keywords
+
+_HAS_LEADER = 1
+_HAS_STAGE = 2
+_STATE_RECORD, _BATTLE_RECORD, _PLAYER_RECORD, _INSTANCE_RECORD = (
+    struct.Struct("<" + record) for record in (_STATE, _BATTLE, _PLAYER, _INSTANCE))
+
+
+def snapshot(state: GameState, registry: Optional[CardRegistry] = None) -> bytes:
+    """Pack a state into a binary blob (zone cards are registered if they are new)."""
+    registry = registry if registry is not None else get_card_registry()
+    zone_handles = registry.handles
+    fmt: List[str] = ["<", _STATE]
+    values: list = []
+    winner = state.winner_id
+    texts: list = [state.active_player_id, winner]
+    handles = set()
+
+    def put_instance(instance: CardInstance):
+        keywords = instance.granted_keywords
+        if instance.card_handle >= 0:
+            handles.add(instance.card_handle)
+        fmt.append(_INSTANCE)
+        values.extend((instance.card_handle, instance.is_rested, instance.current_power, instance.attached_don,
+                       instance.power_modifier, instance.cost_modifier, len(keywords)))
+        texts.extend((instance.card_id, instance.instance_id, instance.owner_id))
+        if keywords:
+            texts.extend(keywords)
+
+    players = state.players
+    battle = state.current_battle
+    values.extend((state.turn_count, PHASE_INDEX[state.current_phase], len(players), battle is not None))
+    if battle is not None:
+        fmt.append(_BATTLE)
+        values.extend((battle.attacker_power, battle.target_power, battle.counter_power_bonus,
+                       len(battle.counter_cards)))
+        texts.extend((battle.attacker_id, battle.attacker_instance_id, battle.target_instance_id,
+                      battle.current_step, battle.blocker_instance_id))
+        texts.extend(battle.counter_cards)
+
+    for player in players.values():
+        life, hand, deck, trash = player.life, player.hand, player.deck, player.trash
+        zone_cards = zone_handles(life + hand + deck + trash)
+        field = player.field
+        characters = field.character_area
+        flags = (_HAS_LEADER if player.leader is not None else 0) | (_HAS_STAGE if field.stage_area is not None else 0)
+        fmt.append(f"{_PLAYER}{len(zone_cards)}H")
+        values.extend((player.active_don, player.rested_don, player.attached_don,
+                       len(life), len(hand), len(deck), len(trash), len(player.cost_area),
+                       flags, len(characters)))
+        values.extend(zone_cards)
+        handles.update(zone_cards)
+        texts.extend((player.id, player.name))
+        texts.extend(player.cost_area)
+        if player.leader is not None:
+            put_instance(player.leader)
+        for char in characters:
+            put_instance(char)
+        if field.stage_area is not None:
+            put_instance(field.stage_area)
+
+    body = struct.pack("".join(fmt), *values)
+
+    cards = registry.cards
+    table = sorted(handles)
+    texts.extend(cards[handle].id for handle in table)
+    encoded = [b"" if text is None else text.encode("utf-8") for text in texts]
+    lengths = [ABSENT if text is None else len(data) for text, data in zip(texts, encoded)]
+    for text, data in zip(texts, encoded):
+        if len(data) >= ABSENT:
+            raise ValueError(f"Text {text[:40]!r}... is too long for a snapshot ({len(data)} bytes)")
+    blob = b"".join(encoded)
+    return b"".join((
+        _HEADER.pack(MAGIC, FORMAT_VERSION, 0),
+        _COUNTS.pack(len(texts), len(blob), len(table)),
+        struct.pack(f"<{len(lengths)}H", *lengths),
+        blob,
+        struct.pack(f"<{len(table)}H", *table),
+        body,
+    ))
+
+
+def restore(blob: bytes, registry: Optional[CardRegistry] = None) -> GameState:
+    """Rebuild the GameState of a snapshot(). Raises ValueError for foreign data or unknown cards."""
+    registry = registry if registry is not None else get_card_registry()
+    if len(blob) < _HEADER.size + _COUNTS.size:
+        raise ValueError(f"Not a state snapshot of format version {FORMAT_VERSION}")
+    magic, version, _ = _HEADER.unpack_from(blob, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"Not a state snapshot of format version {FORMAT_VERSION}")
+    n_texts, length, n_cards = _COUNTS.unpack_from(blob, _HEADER.size)
+    pos = _HEADER.size + _COUNTS.size
+
+    lengths = struct.unpack_from(f"<{n_texts}H", blob, pos)
+    pos += 2 * n_texts
+    texts: List[Optional[str]] = []
+    end = pos + length
+    for size in lengths:
+        if size == ABSENT:
+            texts.append(None)
+        else:
+            texts.append(blob[pos:pos + size].decode("utf-8"))
+            pos += size
+    if pos != end:
+        raise ValueError("Corrupt snapshot text section")
+    table = struct.unpack_from(f"<{n_cards}H", blob, pos)
+    pos += 2 * n_cards
+    text = iter(texts).__next__
+
+    # Card table: handles whose definition differs in this registry -> Card
+    cards = registry.cards
+    card_ids = texts[n_texts - n_cards:]
+    remap: Dict[int, Card] = {}
+    if table and (table[-1] >= len(cards) or [cards[handle].id for handle in table] != card_ids):
+        for handle, card_id in zip(table, card_ids):
+            if handle >= len(cards) or cards[handle].id != card_id:
+                card = registry.get_by_id(card_id)
+                if card is None:
+                    raise ValueError(f"Snapshot card {card_id} is not in the registry")
+                remap[handle] = card
+    lookup = (lambda handle: remap.get(handle) or cards[handle]) if remap else cards.__getitem__
+
+    def take(record: struct.Struct) -> tuple:
+        nonlocal pos
+        values = record.unpack_from(blob, pos)
+        pos += record.size
+        return values
+
+    def get_instance() -> CardInstance:
+        (handle, rested, current_power, attached_don, power_modifier, cost_modifier,
+         n_keywords) = take(_INSTANCE_RECORD)
+        if handle in remap:
+            handle = registry.register(remap[handle])
+        card_id, instance_id, owner_id = text(), text(), text()
+        keywords = [text() for _ in range(n_keywords)]
+        return construct(CardInstance, {
+            'card_id': card_id, 'card_handle': handle, 'instance_id': instance_id, 'owner_id': owner_id,
+            'is_rested': bool(rested), 'current_power': current_power, 'attached_don': attached_don,
+            'power_modifier': power_modifier, 'cost_modifier': cost_modifier,
+            'granted_keywords': keywords, 'keyword_flags': keyword_mask(keywords) if keywords else 0,
+        })
+
+    turn, phase, n_players, has_battle = take(_STATE_RECORD)
+    active, winner = text(), text()
+    battle = None
+    if has_battle:
+        attacker_power, target_power, bonus, n_counters = take(_BATTLE_RECORD)
+        battle = construct(BattlePhase, {
+            'attacker_id': text(), 'attacker_instance_id': text(), 'target_instance_id': text(),
+            'current_step': text(), 'attacker_power': attacker_power, 'target_power': target_power,
+            'blocker_instance_id': text(), 'counter_cards': [text() for _ in range(n_counters)],
+            'counter_power_bonus': bonus,
+        })
+
+    players = {}
+    for _ in range(n_players):
+        (active_don, rested_don, attached_don, n_life, n_hand, n_deck, n_trash, n_cost, flags,
+         n_chars) = take(_PLAYER_RECORD)
+        zone_size = n_life + n_hand + n_deck + n_trash
+        zone_cards = list(map(lookup, struct.unpack_from(f"<{zone_size}H", blob, pos)))
+        pos += 2 * zone_size
+        pid, name = text(), text()
+        cost_area = [text() for _ in range(n_cost)]
+        leader = get_instance() if flags & _HAS_LEADER else None
+        characters = [get_instance() for _ in range(n_chars)]
+        stage = get_instance() if flags & _HAS_STAGE else None
+        hand_end = n_life + n_hand
+        deck_end = hand_end + n_deck
+        players[pid] = construct(Player, {
+            'id': pid, 'name': name,
+            'life': zone_cards[:n_life], 'hand': zone_cards[n_life:hand_end],
+            'deck': zone_cards[hand_end:deck_end], 'trash': zone_cards[deck_end:],
+            'field': construct(FieldArea, {'character_area': characters, 'stage_area': stage}),
+            'leader': leader, 'cost_area': cost_area,
+            'active_don': active_don, 'rested_don': rested_don, 'attached_don': attached_don,
+        })
+    if pos != len(blob):
+        raise ValueError("Snapshot has trailing data")
+
+    return construct(GameState, {
+        'turn_count': turn, 'current_phase': PHASES[phase], 'active_player_id': active,
+        'winner_id': winner, 'current_battle': battle, 'players': players,
+    }, {'_instance_index': InstanceIndex(), '_zobrist': None})
@@ -1,7 +1,11 @@
 from typing import Dict, Literal, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+from engine.utils.fast_copy import shallow_copy
 from engine.models.player import Player
+from engine.models.card import Card, CardInstance
 from engine.core.battle import BattlePhase
+from engine.core.instance_index import InstanceIndex, InstanceLocation
+from engine.core import zobrist
 
 PhaseType = Literal['REFRESH_PHASE', 'DRAW_PHASE', 'DON_PHASE', 'MAIN_PHASE', 'END_PHASE']
 
@@ -20,6 +24,11 @@ class GameState(BaseModel):
     
     # Players map by ID
     players: Dict[str, Player] = Field(default_factory=dict)
+
+    # instance_id -> (owner, zone, slot) for cards in play (see InstanceIndex)
+    _instance_index: InstanceIndex = PrivateAttr(default_factory=InstanceIndex)
+    # Incrementally maintained part of zobrist_hash; None until first read (no tracking cost before)
+    _zobrist: Optional[int] = PrivateAttr(default=None)
     
     def get_active_player(self) -> Player:
         return self.players[self.active_player_id]
@@ -29,3 +38,157 @@ class GameState(BaseModel):
             if pid != player_id:
                 return p
         raise ValueError("Opponent not found")
+
+    # --- Instance lookup ---
+
+    def _resolve_location(self, location: InstanceLocation) -> Optional[CardInstance]:
+        player = self.players.get(location.owner_id)
+        if player is None:
+            return None
+        if location.zone == 'character':
+            area = player.field.character_area
+            return area[location.slot] if location.slot < len(area) else None
+        if location.zone == 'leader':
+            return player.leader
+        return player.field.stage_area
+
+    def locate_instance(self, instance_id: str) -> Optional[InstanceLocation]:
+        """
+        Where is this card instance? Returns (owner_id, zone, slot) or None.
+        O(1) on the indexed path; falls back to one rebuild if zones were edited directly.
+        """
+        index = self.__pydantic_private__['_instance_index']
+        location = index.locations.get(instance_id)
+        if location is not None:
+            found = self._resolve_location(location)
+            if found is not None and found.instance_id == instance_id:
+                return location
+        index.rebuild(self.players)
+        return index.locations.get(instance_id)
+
+    def find_instance(self, instance_id: str, owner_id: Optional[str] = None, zone: Optional[str] = None) -> Optional[CardInstance]:
+        """
+        Single lookup used by the engine, effects and agents.
+        Optionally restrict the match to an owner and/or zone ('leader', 'character', 'stage').
+        """
+        location = self.locate_instance(instance_id)
+        if location is None:
+            return None
+        if owner_id is not None and location.owner_id != owner_id:
+            return None
+        if zone is not None and location.zone != zone:
+            return None
+        return self._resolve_location(location)
+
+    def add_character(self, player_id: str, character: CardInstance):
+        """
+        Put a character on the field and index it. Raises ValueError if the area is full.
+        """
+        area = self.players[player_id].field
+        area.add_character(character)
+        private = self.__pydantic_private__
+        private['_instance_index'].locations[character.instance_id] = InstanceLocation(player_id, 'character', len(area.character_area) - 1)
+        if private['_zobrist'] is not None:
+            private['_zobrist'] = (private['_zobrist'] + zobrist.instance_key(character)) & zobrist.MASK
+
+    def remove_character(self, instance_id: str) -> Optional[CardInstance]:
+        """
+        Remove a character from whichever field holds it, keeping the index in sync.
+        """
+        location = self.locate_instance(instance_id)
+        if location is None or location.zone != 'character':
+            return None
+        area = self.players[location.owner_id].field.character_area
+        removed = area.pop(location.slot)
+        private = self.__pydantic_private__
+        locations = private['_instance_index'].locations
+        del locations[instance_id]
+        for slot in range(location.slot, len(area)):
+            locations[area[slot].instance_id] = InstanceLocation(location.owner_id, 'character', slot)
+        if private['_zobrist'] is not None:
+            private['_zobrist'] = (private['_zobrist'] - zobrist.instance_key(removed)) & zobrist.MASK
+        return removed
+
+    # --- Zones / hashing ---
+    # Engine code mutates cards and zones through these helpers so that
+    # zobrist_hash stays current in O(1). Code that edits zones or instances
+    # directly must call invalidate_hash() afterwards.
+    # (Private attributes are read through __pydantic_private__: plain attribute
+    # access to them falls back to BaseModel.__getattr__, which is ~50x slower.)
+
+    def add_card(self, player_id: str, zone: str, card: Card, index: Optional[int] = None):
+        """
+        Put a card into 'life' / 'hand' / 'deck' / 'trash' (at the end, or at index).
+        """
+        cards = getattr(self.players[player_id], zone)
+        if index is None:
+            cards.append(card)
+        else:
+            cards.insert(index, card)
+        private = self.__pydantic_private__
+        if private['_zobrist'] is not None:
+            private['_zobrist'] = (private['_zobrist'] + zobrist.card_key(player_id, zone, card)) & zobrist.MASK
+
+    def pop_card(self, player_id: str, zone: str, index: int = -1) -> Card:
+        card = getattr(self.players[player_id], zone).pop(index)
+        private = self.__pydantic_private__
+        if private['_zobrist'] is not None:
+            private['_zobrist'] = (private['_zobrist'] - zobrist.card_key(player_id, zone, card)) & zobrist.MASK
+        return card
+
+    def draw_cards(self, player_id: str, amount: int = 1):
+        """
+        Deck top -> hand (same rules as Player.draw_card: nothing happens on an empty deck).
+        """
+        deck = self.players[player_id].deck
+        for _ in range(amount):
+            if deck:
+                self.add_card(player_id, 'hand', self.pop_card(player_id, 'deck', 0))
+
+    def update_instance(self, instance: CardInstance, **changes):
+        """
+        Set attributes of a card in play, e.g. update_instance(char, is_rested=True).
+        """
+        private = self.__pydantic_private__
+        tracking = private['_zobrist'] is not None
+        if tracking:
+            private['_zobrist'] -= zobrist.instance_key(instance)
+        for name, value in changes.items():
+            setattr(instance, name, value)
+        if 'granted_keywords' in changes and 'keyword_flags' not in changes:
+            instance.sync_keyword_flags()
+        if tracking:
+            private['_zobrist'] = (private['_zobrist'] + zobrist.instance_key(instance)) & zobrist.MASK
+
+    @property
+    def zobrist_hash(self) -> int:
+        """
+        64-bit position hash (see engine.core.zobrist), for transposition tables and caches.
+        The first read computes it in full; from then on engine mutations keep it current.
+        Zone order is not hashed, so hand indices (PLAY_CARD / COUNTER) may name different
+        cards in two positions with the same hash: compare hand order before reusing
+        per-action data.
+        """
+        private = self.__pydantic_private__
+        if private['_zobrist'] is None:
+            private['_zobrist'] = zobrist.collection_hash(self)
+        return (private['_zobrist'] + zobrist.scalar_hash(self)) & zobrist.MASK
+
+    def invalidate_hash(self):
+        """Forget the maintained hash (after direct edits); the next read recomputes it."""
+        self.__pydantic_private__['_zobrist'] = None
+
+    def clone(self) -> "GameState":
+        """
+        Fast branch of the state for lookahead / search.
+        Much cheaper than copy.deepcopy: mutable containers and card instances are
+        copied, immutable Card definitions are shared.
+        """
+        cloned = shallow_copy(
+            self,
+            current_battle=self.current_battle.clone() if self.current_battle else None,
+            players={pid: p.clone() for pid, p in self.players.items()},
+        )
+        cloned._instance_index = self._instance_index.copy()
+        cloned._zobrist = self._zobrist
+        return cloned
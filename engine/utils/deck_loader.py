@@ -1,37 +1,28 @@
 
 import json
 import os
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Mapping, Optional
 from engine.models.card import Card, CardInstance
 from engine.models.player import Player
+from engine.data.registry import CardRegistry, get_card_registry
+from engine.data.card_db import open_card_db, card_from_record
 
-def load_card_db(clean_json_dir: str) -> Dict[str, dict]:
+def load_card_db(clean_json_dir: str) -> Mapping[str, dict]:
     """
-    Loads all JSON files from the directory into a single dictionary mapping ID -> Card Data.
+    Card database as a mapping ID -> normalized card record (see engine.data.card_db).
+    Reads the compiled artifact, building it first if clean_json changed.
     """
-    card_db = {}
     if not os.path.exists(clean_json_dir):
         print(f"Warning: Directory {clean_json_dir} does not exist.")
-        return card_db
+        return {}
+    return open_card_db(clean_json_dir).by_id()
 
-    for filename in os.listdir(clean_json_dir):
-        if filename.endswith(".json"):
-            filepath = os.path.join(clean_json_dir, filename)
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        for card in data:
-                            if 'id' in card:
-                                card_db[card['id']] = card
-            except Exception as e:
-                print(f"Error loading {filename}: {e}")
-    return card_db
-
-def load_deck_from_json(deck_file_path: str, card_db: Dict[str, dict]) -> Tuple[Card, List[Card]]:
+def load_deck_from_json(deck_file_path: str, card_db: Mapping[str, dict], registry: Optional[CardRegistry] = None) -> Tuple[Card, List[Card]]:
     """
     Parses a Deck JSON file and returns (Leader Card Object, List of Deck Card Objects).
+    Cards are interned in the CardRegistry, so every copy of a card shares one definition.
     """
+    registry = registry if registry is not None else get_card_registry()
     if not os.path.exists(deck_file_path):
         raise ValueError(f"Deck file not found: {deck_file_path}")
 
@@ -54,13 +45,8 @@ def load_deck_from_json(deck_file_path: str, card_db: Dict[str, dict]) -> Tuple[
             category="LEADER"
         )
     else:
-        leader_data = card_db[leader_id]
-        # Normalize Enums
-        if 'type' in leader_data: leader_data['type'] = leader_data['type'].upper()
-        if 'attribute' in leader_data: leader_data['attribute'] = leader_data['attribute'].upper()
-        if 'color' in leader_data: leader_data['color'] = leader_data['color'].upper()
-        
-        leader_card = Card(**leader_data)
+        leader_card = card_from_record(card_db[leader_id])
+    leader_card = registry.intern(leader_card)
     
     deck_cards = []
     
@@ -72,20 +58,9 @@ def load_deck_from_json(deck_file_path: str, card_db: Dict[str, dict]) -> Tuple[
             print(f"Warning: Card ID {c_id} not found in DB. Skipping.")
             continue
             
-        card_data = card_db[c_id].copy() # Copy to avoid mutating DB
-        
-        # Normalize
-        if 'type' in card_data: card_data['type'] = card_data['type'].upper()
-        if 'attribute' in card_data: 
-            raw_attr = card_data['attribute'].upper()
-            if ';' in raw_attr:
-                raw_attr = raw_attr.split(';')[0] # Take first for now
-            card_data['attribute'] = raw_attr
-        if 'color' in card_data: card_data['color'] = card_data['color'].upper()
-
         # Instantiate Card
         try:
-            base_card = Card(**card_data)
+            base_card = registry.intern(card_from_record(card_db[c_id]))
             for _ in range(qty):
                 deck_cards.append(base_card) 
         except Exception as e:
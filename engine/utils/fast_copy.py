@@ -0,0 +1,36 @@
+from typing import Optional
+from pydantic import BaseModel
+
+_object_setattr = object.__setattr__
+
+
+def shallow_copy(model: BaseModel, **updates) -> BaseModel:
+    """
+    Shallow-copy a pydantic model without validation.
+    Equivalent to model.model_copy(update=updates) but skips the generic
+    bookkeeping, which matters when branching states thousands of times per move.
+    """
+    cls = model.__class__
+    copied = cls.__new__(cls)
+    data = model.__dict__.copy()
+    data.update(updates)
+    _object_setattr(copied, '__dict__', data)
+    _object_setattr(copied, '__pydantic_fields_set__', model.__pydantic_fields_set__.copy())
+    _object_setattr(copied, '__pydantic_extra__', None)
+    private = model.__pydantic_private__
+    _object_setattr(copied, '__pydantic_private__', None if private is None else private.copy())
+    return copied
+
+
+def construct(cls, data: dict, private: Optional[dict] = None) -> BaseModel:
+    """
+    Build a model from a dict holding every field, without validation.
+    For trusted data only (e.g. decoding a snapshot written by the engine):
+    much cheaper than cls.model_construct(**data).
+    """
+    model = cls.__new__(cls)
+    _object_setattr(model, '__dict__', data)
+    _object_setattr(model, '__pydantic_fields_set__', set(data))
+    _object_setattr(model, '__pydantic_extra__', None)
+    _object_setattr(model, '__pydantic_private__', private)
+    return model
@@ -0,0 +1,26 @@
+import hashlib
+import random
+from typing import Optional
+
+def derive_seed(master_seed: int, *keys) -> int:
+    """
+    Derive an independent 64-bit seed from a master seed and a path of keys,
+    e.g. derive_seed(master, game_index) or derive_seed(master, game_index, "p1").
+
+    The result depends only on the inputs (not on call order, process or worker
+    count), so any single game of a large run can be replayed on its own.
+    """
+    material = ":".join(str(k) for k in (master_seed,) + keys).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(material, digest_size=8).digest(), "little")
+
+def new_master_seed() -> int:
+    """A fresh random master seed (print it so the run can be reproduced)."""
+    return random.SystemRandom().getrandbits(63)
+
+def make_rng(seed: Optional[int] = None, rng: Optional[random.Random] = None) -> random.Random:
+    """
+    Normalize the (seed, rng) pair accepted by Game and agents into a private Random.
+    """
+    if rng is not None:
+        return rng
+    return random.Random(seed)
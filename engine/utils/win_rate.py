@@ -0,0 +1,168 @@
+"""
+Win rate estimates and stopping rules for matchup simulations.
+
+A stopping rule is fed the outcome of each game in game index order (add())
+and says when the result is settled, so run_simulation() can stop before its
+game budget on a lopsided matchup:
+
+- WilsonStop : the Wilson score interval on the P1 win rate is narrower than `width`
+- SPRTStop   : Wald's sequential probability ratio test of "P1 wins with
+               probability >= p1" against "<= p0" reaches a decision
+
+Outcomes are the winner id ("p1" / "p2") or None for a draw. A draw counts as
+half a win in the win rate; the SPRT ignores draws (they carry no evidence for
+either deck). Correlated games are fed as one observation with add_score(), e.g.
+the P1 deck score of a seat-swapped pair (0, 0.25, ..., 1).
+
+mean_interval() / paired_difference() summarize paired runs (one score per seed,
+see tournament_runner.run_paired_game), where a Wilson interval over single
+games would ignore the pairing.
+"""
+import math
+from statistics import NormalDist, fmean, variance
+from typing import Optional, Sequence, Tuple
+
+
+def wilson_interval(wins: float, games: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """Wilson score interval for a win rate of wins / games ((0, 1) with no games)."""
+    if games <= 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = wins / games
+    denominator = 1 + z * z / games
+    center = (p + z * z / (2 * games)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / games + z * z / (4 * games * games)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def mean_interval(values: Sequence[float], confidence: float = 0.95) -> Tuple[float, float, float]:
+    """(mean, low, high): mean of per-seed values with its normal-approximation interval."""
+    mean = fmean(values)
+    if len(values) < 2:
+        return mean, -math.inf, math.inf
+    margin = NormalDist().inv_cdf(0.5 + confidence / 2) * math.sqrt(variance(values) / len(values))
+    return mean, mean - margin, mean + margin
+
+
+def paired_difference(x: Sequence[float], y: Sequence[float],
+                      confidence: float = 0.95) -> Tuple[float, float, float, float]:
+    """
+    (mean, low, high, variance reduction) of x[i] - y[i], for two runs scored on the
+    same seeds. The variance reduction is (var(x) + var(y)) / var(x - y): how many
+    times more seeds independent runs would need for the same interval.
+    """
+    if len(x) != len(y):
+        raise ValueError("Paired runs need the same seeds")
+    differences = [a - b for a, b in zip(x, y)]
+    mean, low, high = mean_interval(differences, confidence)
+    if len(differences) < 2:
+        return mean, low, high, 1.0
+    spread = variance(differences)
+    independent = variance(x) + variance(y)
+    if spread:
+        reduction = independent / spread
+    else:
+        reduction = math.inf if independent else 1.0
+    return mean, low, high, reduction
+
+
+_SCORES = {"p1": 1.0, "p2": 0.0, None: 0.5}
+
+
+class WinRate:
+    """P1 score of the games seen so far (a draw counts as half a win)."""
+    def __init__(self, confidence: float = 0.95):
+        self.confidence = confidence
+        self.games = 0              # observations: games, or pairs fed through add_score()
+        self.score = 0.0
+        self.wins = 0
+        self.draws = 0
+
+    def add(self, winner: Optional[str]) -> bool:
+        if winner == "p1":
+            self.wins += 1
+        elif winner is None:
+            self.draws += 1
+        return self.add_score(_SCORES[winner])
+
+    def add_score(self, score: float) -> bool:
+        """Record one observation with P1 score in [0, 1]."""
+        self.games += 1
+        self.score += score
+        return False
+
+    @property
+    def rate(self) -> float:
+        return self.score / self.games if self.games else 0.0
+
+    def interval(self) -> Tuple[float, float]:
+        return wilson_interval(self.score, self.games, self.confidence)
+
+
+class WilsonStop(WinRate):
+    """
+    Stop once the Wilson interval on the P1 win rate is narrower than `width`
+    (and at least `min_games` were played, so a lucky start cannot end the run).
+    """
+    def __init__(self, width: float = 0.1, confidence: float = 0.95, min_games: int = 20):
+        super().__init__(confidence)
+        self.width = width
+        self.min_games = min_games
+        self.done = False
+
+    def add_score(self, score: float) -> bool:
+        """Record an observation; True once the run can stop."""
+        super().add_score(score)
+        if self.games >= self.min_games:
+            low, high = self.interval()
+            self.done = high - low < self.width
+        return self.done
+
+    def decision(self) -> str:
+        low, high = self.interval()
+        if self.done:
+            return f"CI width {high - low:.4f} < {self.width}"
+        return f"CI width {high - low:.4f} (target {self.width} not reached)"
+
+
+class SPRTStop(WinRate):
+    """
+    Wald's SPRT on the P1 win probability p: H1 "P1 deck beats P2" (p >= p1)
+    against H0 "it does not" (p <= p0), with error rates alpha (accepting H1
+    wrongly) and beta (accepting H0 wrongly). Draws are skipped; a fractional
+    score s adds s wins and 1 - s losses (an even score is skipped like a draw).
+    """
+    def __init__(self, p0: float = 0.45, p1: float = 0.55, alpha: float = 0.05, beta: float = 0.05,
+                 confidence: float = 0.95):
+        if not 0 < p0 < p1 < 1:
+            raise ValueError("SPRT needs 0 < p0 < p1 < 1")
+        super().__init__(confidence)
+        self.p0, self.p1 = p0, p1
+        self.upper = math.log((1 - beta) / alpha)
+        self.lower = math.log(beta / (1 - alpha))
+        self._win = math.log(p1 / p0)
+        self._loss = math.log((1 - p1) / (1 - p0))
+        self.llr = 0.0
+        self.accepted: Optional[bool] = None    # True: H1 (P1 deck wins), False: H0
+
+    @property
+    def done(self) -> bool:
+        return self.accepted is not None
+
+    def add_score(self, score: float) -> bool:
+        """Record an observation; True once the test has decided."""
+        super().add_score(score)
+        if self.accepted is None and score != 0.5:
+            self.llr += score * self._win + (1 - score) * self._loss
+            if self.llr >= self.upper:
+                self.accepted = True
+            elif self.llr <= self.lower:
+                self.accepted = False
+        return self.done
+
+    def decision(self) -> str:
+        hypotheses = f"p >= {self.p1} vs p <= {self.p0}"
+        if self.accepted is None:
+            return f"SPRT undecided ({hypotheses}, LLR {self.llr:.2f})"
+        verdict = "P1 deck beats P2" if self.accepted else "P1 deck does not beat P2"
+        return f"SPRT: {verdict} ({hypotheses}, LLR {self.llr:.2f})"
@@ -8,6 +8,7 @@ from engine.models.player import Player
 from engine.models.card import Card
 from engine.core.game import Game
 from engine.core.actions import PlayCardAction
+from engine.core.events import EventBus, ConsoleSink
 
 def run_simulation():
     print("=== OPTCG Game Engine Simulation ===\n")
@@ -30,7 +31,7 @@ def run_simulation():
     print(f"Player 1 Hand: {[c.name for c in p1.hand]}")
     
     # 3. Start Game
-    game = Game(p1, p2)
+    game = Game(p1, p2, events=EventBus([ConsoleSink()]))
     print(f"Game Started. Active Player: {game.state.get_active_player().name}")
     print(f"Current Phase: {game.state.current_phase}")
     
@@ -8,11 +8,13 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from engine.models.player import Player
 from engine.models.card import Card, CardInstance
 from engine.core.game import Game
+from engine.core.events import EventBus, ConsoleSink
 from agents.gameplay.random_agent import RandomAgent
 from agents.gameplay.rule_based_agent import SimpleRuleAgent
 from agents.gameplay.strategy_agent import StrategyAgent
 
 from engine.models.effect import Effect, EffectType
+from engine.data.registry import get_card_registry
 
 def create_dummy_deck() -> list[Card]:
     """Create a simple deck for testing"""
@@ -46,19 +48,20 @@ def create_dummy_leader(id: str, name: str) -> CardInstance:
     leader_card = Card(id=id, name=name, type="LEADER", life=5, colors=["RED"])
     return CardInstance(
         card_id=leader_card.id,
+        card_handle=get_card_registry().register(leader_card),
         instance_id=f"{id}_leader",
         owner_id=id,
         current_power=5000
     )
 
-def run_simulation(max_turns=20):
+def run_simulation(max_turns=20, seed=None):
     print("=== OPTCG Agent Simulation (Strategy vs Random) ===\n")
     
     # 1. Setup Agents & Players
     # P1 = Strategy (Smart)
     agent1 = StrategyAgent(id="p1", name="Bot Chopper (Strategy)")
     # P2 = Random (Dummy)
-    agent2 = RandomAgent(id="p2", name="Bot Luffy (Random)")
+    agent2 = RandomAgent(id="p2", name="Bot Luffy (Random)", seed=seed)
     
     p1 = Player(id="p1", name="Bot Chopper (Strategy)", deck=create_dummy_deck())
     p2 = Player(id="p2", name="Bot Luffy (Random)", deck=create_dummy_deck())
@@ -68,7 +71,8 @@ def run_simulation(max_turns=20):
     p2.leader = create_dummy_leader("leader_kaido", "Kaido")
 
     # 2. Start Game
-    game = Game(p1, p2)
+    # Forced phase ends / battle passes are played by the engine: agents only see real choices
+    game = Game(p1, p2, events=EventBus([ConsoleSink()]), seed=seed, auto_advance=True)
     game.start_game()
     print(f"Game Started! {p1.name} vs {p2.name}")
     
@@ -2,14 +2,29 @@
 import os
 import sys
 import time
-from collections import defaultdict
+import itertools
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter_ns
+from typing import NamedTuple, Optional
 from engine.core.game import Game
+from engine.core.phases import Phase
+from engine.core.action_space import encode_action
 from engine.models.player import Player
 from engine.models.card import CardInstance
 from agents.gameplay.strategy_agent import StrategyAgent
 from engine.utils.deck_loader import load_card_db, load_deck_from_json
+from engine.data.registry import get_card_registry
+from engine.core.events import EventBus, ConsoleSink, JsonlSink
+from engine.core.profiling import GameStats
+from engine.utils.seeding import derive_seed, new_master_seed
+from engine.utils.win_rate import WinRate, mean_interval, paired_difference
+from engine.replay import GameRecord, ReplayFile, Replayer, ReplayWriter, deck_hash, winner_code
 
-def run_simulation(p1_deck_file, p2_deck_file, num_games=10, verbose=False):
+def load_matchup(p1_deck_file, p2_deck_file, verbose=False):
+    """
+    Load the card database and both decks. Returns (l1, d1, l2, d2).
+    """
     # 1. Load Database
     project_root = os.getcwd() # Assumption: Run from root
     db_path = os.path.join(project_root, "data/clean_json")
@@ -23,102 +38,445 @@ def run_simulation(p1_deck_file, p2_deck_file, num_games=10, verbose=False):
     
     if verbose: print(f"Loading Player 2 Deck: {p2_deck_file}")
     l2, d2 = load_deck_from_json(p2_deck_file, card_db)
+    return l1, d1, l2, d2
 
-    print("-" * 50)
-    print(f"P1 Leader: {l1.name} ({l1.id})")
-    print(f"P2 Leader: {l2.name} ({l2.id})")
-    print(f"Games: {num_games}")
-    print("-" * 50)
-
-    # 3. Setup Agents
-    # Both use StrategyAgent for fairness
-    agent1 = StrategyAgent(id="p1", name="P1 (Strategy)")
-    agent2 = StrategyAgent(id="p2", name="P2 (Strategy)")
+def build_game(l1, d1, l2, d2, game_seed, events=None, auto_advance=True, deck_seeds=None) -> Game:
+    """
+    Fresh players and a started Game; the deck shuffles come from game_seed only.
+    auto_advance: the Game plays forced decisions itself (agents only see real choices).
+    deck_seeds: optional {"p1": seed, "p2": seed}, one shuffle stream per deck (Game.start_game).
+    """
+    registry = get_card_registry()
     
-    # Stats
-    wins = {"p1": 0, "p2": 0}
+    # Fresh Lists
+    p1_list = d1[:]
+    p2_list = d2[:]
     
-    for i in range(num_games):
-        if verbose: print(f"\n=== Game {i+1}/{num_games} ===")
-        
-        # Fresh Lists
-        p1_list = d1[:]
-        p2_list = d2[:]
+    # Init Players (Corrected CardInstance kwargs)
+    player1 = Player(id="p1", name="Player 1", deck=p1_list, life=[])
+    player1.leader = CardInstance(
+        card_id=l1.id, 
+        card_handle=registry.register(l1),
+        instance_id="p1_leader", 
+        owner_id="p1", 
+        current_power=l1.power
+    )
+    
+    player2 = Player(id="p2", name="Player 2", deck=p2_list, life=[])
+    player2.leader = CardInstance(
+        card_id=l2.id, 
+        card_handle=registry.register(l2),
+        instance_id="p2_leader", 
+        owner_id="p2", 
+        current_power=l2.power
+    )
+    
+    # Init Game
+    game = Game(player1, player2, events=events, seed=game_seed, auto_advance=auto_advance)
+    game.start_game(deck_seeds)
+    return game
+
+class GameResult(NamedTuple):
+    game_index: int
+    winner: Optional[str] # None = Draw
+    turns: int
+    actions: int
+    forced_actions: int = 0
+    record: Optional[GameRecord] = None
+
+_PHASES = [phase.value for phase in Phase]
+
+def phases_played(state) -> int:
+    """Phases ended since the start of the game (5 per turn), forced ones included."""
+    return (state.turn_count - 1) * len(_PHASES) + _PHASES.index(state.current_phase)
+
+def play_game(game, agents, verbose=False, max_turns=100, record=None):
+    """
+    Run the game loop until a winner or max_turns (counted in phases, see phases_played).
+    record: optional bytearray; the action index of every agent action is appended.
+    Agent decisions are timed into game.stats when profiling is on (Game.enable_stats).
+    Returns (winner id or None for a draw, turns played, agent actions processed).
+    """
+    stats = game.stats
+    turn_count = phases_played(game.state)
+    action_count = 0
+    while not game.state.winner_id and turn_count < max_turns:
+        # Get Action
+        valid_actions = game.get_valid_actions()
+        # The acting player is not always the active one (the defender answers BLOCK / COUNTER)
+        current_pid = valid_actions[0].player_id
+        active_agent = agents[current_pid]
         
-        # Init Players (Corrected CardInstance kwargs)
-        player1 = Player(id="p1", name="Player 1", deck=p1_list, life=[])
-        player1.leader = CardInstance(
-            card_id=l1.id, 
-            instance_id="p1_leader", 
-            owner_id="p1", 
-            current_power=l1.power
-        )
+        # Logging State
+        if verbose:
+            p1_info = f"Life:{len(game.state.players['p1'].life)} Hand:{len(game.state.players['p1'].hand)} Field:{len(game.state.players['p1'].field.character_area)}"
+            p2_info = f"Life:{len(game.state.players['p2'].life)} Hand:{len(game.state.players['p2'].hand)} Field:{len(game.state.players['p2'].field.character_area)}"
+            print(f"\n[Turn {turn_count}] Active: {current_pid} | {p1_info} vs {p2_info}")
         
-        player2 = Player(id="p2", name="Player 2", deck=p2_list, life=[])
-        player2.leader = CardInstance(
-            card_id=l2.id, 
-            instance_id="p2_leader", 
-            owner_id="p2", 
-            current_power=l2.power
-        )
+        if stats is None:
+            action = active_agent.take_action(game.state, valid_actions)
+        else:
+            start = perf_counter_ns()
+            action = active_agent.take_action(game.state, valid_actions)
+            stats.add_think(current_pid, perf_counter_ns() - start)
         
-        # Init Game
-        game = Game(player1, player2)
-        game.start_game()
+        if not action:
+            print(f"Error: {current_pid} returned no action.")
+            break
         
-        # Agents Map
-        agents = { "p1": agent1, "p2": agent2 }
+        if verbose:
+            print(f"Action: {action}")
+
+        # Execute
+        if record is not None:
+            record.append(encode_action(game.state, action))
+        success = game.process_action(action)
+        if not success:
+           print(f"Error: Action failed {action}")
+           break
+        action_count += 1
+           
+        previous = turn_count
+        turn_count = phases_played(game.state)
+        if not verbose and turn_count // 10 > previous // 10:
+             sys.stdout.write('.')
+             sys.stdout.flush()
+
+    return game.state.winner_id, turn_count, action_count
+
+def make_agents():
+    # Both use StrategyAgent for fairness
+    agent1 = StrategyAgent(id="p1", name="P1 (Strategy)")
+    agent2 = StrategyAgent(id="p2", name="P2 (Strategy)")
+    return { "p1": agent1, "p2": agent2 }
+
+def run_game(l1, d1, l2, d2, agents, master_seed, game_index, events=None, verbose=False,
+             auto_advance=True, record=False, stats=None) -> GameResult:
+    """
+    Play game number `game_index` of a run. Everything random in it is derived from
+    (master_seed, game_index), so the result does not depend on what ran before.
+    record: also return the game as a GameRecord (engine.replay).
+    stats: GameStats to collect profiling counters into (engine.core.profiling).
+    """
+    for pid, agent in agents.items():
+        agent.reset(derive_seed(master_seed, game_index, pid))
+    game_seed = derive_seed(master_seed, game_index)
+    game = build_game(l1, d1, l2, d2, game_seed, events, auto_advance)
+    if stats is not None:
+        game.enable_stats(stats)
+    played = bytearray() if record else None
+    winner, turns, actions = play_game(game, agents, verbose=verbose, record=played)
+    game_record = None
+    if record:
+        game_record = GameRecord(game_seed, (deck_hash(l1, d1), deck_hash(l2, d2)), auto_advance,
+                                 winner_code(game), bytes(played))
+    return GameResult(game_index, winner, turns, actions, game.forced_actions, game_record)
+
+# --- Paired Mode ---
+# Seat order biases a matchup (p1 always goes first), and independent shuffles add
+# noise to any comparison. A paired game plays one seed twice with seats swapped, and
+# each deck shuffles from a stream keyed by its role (deck1 / deck2), never by seat:
+# the deck gets the same order in both games, and in any other run with the same
+# master seed (common random numbers). Comparing a deck change against the baseline
+# with compare_decks() then measures the change, not the luck of the draw.
+
+class PairedResult(NamedTuple):
+    game_index: int
+    first: GameResult   # deck 1 in seat p1
+    second: GameResult  # deck 2 in seat p1
+
+    def deck_winners(self):
+        """Winner of each game by deck role: "p1" = deck 1, "p2" = deck 2, None = draw."""
+        swapped = {"p1": "p2", "p2": "p1", None: None}
+        return self.first.winner, swapped[self.second.winner]
+
+    @property
+    def score(self) -> float:
+        """Deck 1 score over both seats (1 = won both, a draw counts as half a win)."""
+        return sum(1.0 if winner == "p1" else 0.5 if winner is None else 0.0
+                   for winner in self.deck_winners()) / 2
+
+def run_paired_game(l1, d1, l2, d2, agents, master_seed, game_index, events=None, verbose=False,
+                    auto_advance=True, stats=None) -> PairedResult:
+    """
+    Play seed `game_index` twice, deck 1 first in seat p1, then in seat p2. A deck's
+    shuffle and its agent's seed come from derive_seed(master_seed, game_index, role)
+    in both games.
+    """
+    roles = ((l1, d1, "deck1"), (l2, d2, "deck2"))
+    games = []
+    for seats in (roles, roles[::-1]):
+        (la, da, role_a), (lb, db, role_b) = seats
+        deck_seeds = {"p1": derive_seed(master_seed, game_index, role_a),
+                      "p2": derive_seed(master_seed, game_index, role_b)}
+        for pid, role in (("p1", role_a), ("p2", role_b)):
+            agents[pid].reset(derive_seed(master_seed, game_index, role, "agent"))
+        game = build_game(la, da, lb, db, derive_seed(master_seed, game_index), events, auto_advance,
+                          deck_seeds)
+        if stats is not None:
+            game.enable_stats(stats)
+        winner, turns, actions = play_game(game, agents, verbose=verbose)
+        games.append(GameResult(game_index, winner, turns, actions, game.forced_actions))
+    return PairedResult(game_index, games[0], games[1])
+
+# --- Parallel Mode ---
+# Each worker process loads the card database, decks and agents once (initializer),
+# then plays shards of consecutive game indices. Results are merged by game index,
+# so the outcome is identical to the sequential run for the same master seed.
+
+_worker_context = None
+
+def _init_worker(p1_deck_file, p2_deck_file):
+    global _worker_context
+    l1, d1, l2, d2 = load_matchup(p1_deck_file, p2_deck_file)
+    _worker_context = (l1, d1, l2, d2, make_agents())
+
+def _play_shard(master_seed, start, stop, auto_advance=True, record=False, profile=False, paired=False):
+    l1, d1, l2, d2, agents = _worker_context
+    stats = GameStats() if profile else None
+    if paired:
+        results = [run_paired_game(l1, d1, l2, d2, agents, master_seed, i, auto_advance=auto_advance, stats=stats)
+                   for i in range(start, stop)]
+    else:
+        results = [run_game(l1, d1, l2, d2, agents, master_seed, i, auto_advance=auto_advance, record=record,
+                            stats=stats)
+                   for i in range(start, stop)]
+    return results, stats
+
+def iter_games_parallel(p1_deck_file, p2_deck_file, num_games, master_seed, workers, shard_size=None,
+                        auto_advance=True, record=False, stats=None, window=None, paired=False):
+    """
+    Play games [0, num_games) across `workers` processes, yielding results in game index order.
+    stats: GameStats the workers' profiling counters are merged into.
+    paired: play each index as a PairedResult (run_paired_game) instead.
+    window: shards in flight (default: all of them). A bounded window lets the caller stop
+            early (close the generator) without paying for the rest of the budget.
+    """
+    if shard_size is None:
+        # ~4 shards per worker: amortizes IPC while keeping the load balanced
+        shard_size = max(1, num_games // (workers * 4))
+    shards = iter([(start, min(start + shard_size, num_games)) for start in range(0, num_games, shard_size)])
+
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                               initargs=(p1_deck_file, p2_deck_file))
+    try:
+        pending = deque()
+        def submit(count):
+            for start, stop in itertools.islice(shards, count):
+                pending.append(pool.submit(_play_shard, master_seed, start, stop, auto_advance, record,
+                                           stats is not None, paired))
+        submit(window if window is not None else num_games)
+        while pending:
+            shard_results, shard_stats = pending.popleft().result()
+            submit(1)
+            if stats is not None:
+                stats.merge(shard_stats)
+            yield from shard_results
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+def run_games_parallel(p1_deck_file, p2_deck_file, num_games, master_seed, workers, shard_size=None,
+                       auto_advance=True, record=False, stats=None):
+    """
+    Play games [0, num_games) across `workers` processes. Returns results ordered by game index.
+    stats: GameStats the workers' profiling counters are merged into.
+    """
+    return list(iter_games_parallel(p1_deck_file, p2_deck_file, num_games, master_seed, workers, shard_size,
+                                    auto_advance, record, stats))
+
+def run_simulation(p1_deck_file, p2_deck_file, num_games=10, verbose=False, event_log=None, seed=None,
+                   workers=1, shard_size=None, auto_advance=True, replay_log=None, stats=None, profile_json=None,
+                   stopping=None, paired=False):
+    """
+    verbose: print the engine event log to the console.
+    event_log: optional path; engine events of every game are appended there as JSONL.
+    seed: master seed of the run (random if None). Game i uses derive_seed(seed, i),
+          so any single game can be replayed with replay_game(..., seed, i).
+    workers: >1 plays the games in a process pool (same results as workers=1).
+    shard_size: games per task sent to a worker (default: ~4 shards per worker).
+    auto_advance: forced decisions are played by the engine instead of the agents
+                  (same games and results; False consults the agents for every action).
+    replay_log: optional path; every game is appended there as a binary GameRecord
+                (engine.replay), in game index order. See load_replay().
+    stats: GameStats to collect profiling counters into (per action type, phase, effect
+           and agent think time; see engine.core.profiling). Off when None.
+    profile_json: optional path; profiles the run (a new GameStats unless stats is given)
+                  and writes the counters there as JSON at the end.
+    stopping: optional stopping rule (engine.utils.win_rate.WilsonStop / SPRTStop). num_games
+              becomes the budget: the run ends after the first game (in index order) at which
+              the rule is satisfied, so the games used do not depend on `workers`. None plays
+              exactly num_games (fixed-count mode).
+    paired: play each seed twice with seats swapped and per-deck shuffle streams
+            (run_paired_game); results are PairedResults, num_games counts seeds, and
+            "p1" / "p2" in the wins mean deck 1 / deck 2. A stopping rule gets one
+            observation per seed, deck 1's score over both seats (PairedResult.score).
+    """
+    if workers > 1 and (verbose or event_log):
+        raise ValueError("verbose / event_log need workers=1 (worker logs would interleave)")
+    if paired and replay_log:
+        raise ValueError("replay_log is not supported in paired mode (records keep a single game seed)")
+
+    l1, d1, l2, d2 = load_matchup(p1_deck_file, p2_deck_file, verbose)
+    if profile_json and stats is None:
+        stats = GameStats()
+    master_seed = seed if seed is not None else new_master_seed()
+
+    print("-" * 50)
+    print(f"P1 Leader: {l1.name} ({l1.id})")
+    print(f"P2 Leader: {l2.name} ({l2.id})")
+    print(f"{'Seeds (x2 seats)' if paired else 'Games'}: {num_games}"
+          + (" (budget, early stopping)" if stopping is not None else ""))
+    print(f"Master Seed: {master_seed}")
+    if workers > 1: print(f"Workers: {workers}")
+    print("-" * 50)
+
+    if workers > 1:
+        window = None
+        if stopping is not None:
+            # Small shards, ~2 per worker in flight: little is played past the stopping point
+            window = 2 * workers
+            if shard_size is None:
+                shard_size = max(1, min(num_games // (workers * 4), 20))
+        games = iter_games_parallel(p1_deck_file, p2_deck_file, num_games, master_seed, workers, shard_size,
+                                    auto_advance, record=bool(replay_log), stats=stats,
+                                    window=window, paired=paired)
+        events = None
+    else:
+        # 3. Setup Agents
+        agents = make_agents()
         
-        turn_count = 0
-        while not game.state.winner_id and turn_count < 100:
-            current_pid = game.state.active_player_id
-            active_agent = agents[current_pid]
-            
-            # Logging State
-            if verbose:
-                p1_info = f"Life:{len(game.state.players['p1'].life)} Hand:{len(game.state.players['p1'].hand)} Field:{len(game.state.players['p1'].field.character_area)}"
-                p2_info = f"Life:{len(game.state.players['p2'].life)} Hand:{len(game.state.players['p2'].hand)} Field:{len(game.state.players['p2'].field.character_area)}"
-                print(f"\n[Turn {turn_count}] Active: {current_pid} | {p1_info} vs {p2_info}")
-            
-            # Get Action
-            valid_actions = game.get_valid_actions()
-            action = active_agent.take_action(game.state, valid_actions)
-            
-            if not action:
-                print(f"Error: {current_pid} returned no action.")
+        # Engine Events (silent unless requested)
+        sinks = []
+        if verbose: sinks.append(ConsoleSink())
+        if event_log: sinks.append(JsonlSink(event_log))
+        events = EventBus(sinks)
+
+        def play_sequential():
+            for i in range(num_games):
+                if verbose: print(f"\n=== Game {i+1}/{num_games} ===")
+                
+                if paired:
+                    result = run_paired_game(l1, d1, l2, d2, agents, master_seed, i, events, verbose,
+                                             auto_advance, stats)
+                    if verbose:
+                        print(f"  Result (deck 1 score over both seats): {result.score}")
+                else:
+                    result = run_game(l1, d1, l2, d2, agents, master_seed, i, events, verbose, auto_advance,
+                                      record=bool(replay_log), stats=stats)
+                    if verbose:
+                        print(f"  Result: {result.winner} Wins!" if result.winner else "  Result: Draw")
+                yield result
+        games = play_sequential()
+
+    results = []
+    for result in games:
+        results.append(result)
+        if stopping is not None:
+            # The two games of a pair share their shuffles: one observation per seed
+            done = stopping.add_score(result.score) if paired else stopping.add(result.winner)
+            if done:
                 break
-            
-            if verbose:
-                print(f"Action: {action}")
-
-            # Execute
-            success = game.process_action(action)
-            if not success:
-               print(f"Error: Action failed {action}")
-               break
-               
-            if action.action_type == 'END_PHASE':
-                turn_count += 1
-                if not verbose and turn_count % 10 == 0:
-                     sys.stdout.write('.')
-                     sys.stdout.flush()
-
-        winner = game.state.winner_id
+    games.close()
+    if events is not None:
+        events.close()
+
+    if replay_log:
+        with ReplayWriter(replay_log) as writer:
+            for result in results:
+                writer.write(result.record)
+
+    # Stats
+    wins = {"p1": 0, "p2": 0}
+    win_rate = WinRate(stopping.confidence if stopping is not None else 0.95)
+    seeds = len(results)
+    if paired:
+        winners = [winner for result in results for winner in result.deck_winners()]
+        paired_results = results
+        results = [game for result in paired_results for game in (result.first, result.second)]
+        seat_wins = sum(game.winner == "p1" for game in results)
+    else:
+        winners = [result.winner for result in results]
+    for winner in winners:
+        win_rate.add(winner)
         if winner:
             wins[winner] += 1
-            if verbose: print(f"  Result: {winner} Wins!")
-        else:
-            if verbose: print("  Result: Draw")
+    played = len(results)
 
     print("\n" + "=" * 50)
-    print(f"FINAL RESULTS: {num_games} Games")
-    print(f"Player 1 ({os.path.basename(p1_deck_file)}): {wins['p1']} Wins ({(wins['p1']/num_games)*100}%)")
-    print(f"Player 2 ({os.path.basename(p2_deck_file)}): {wins['p2']} Wins ({(wins['p2']/num_games)*100}%)")
+    print(f"FINAL RESULTS: {played} Games")
+    print(f"Player 1 ({os.path.basename(p1_deck_file)}): {wins['p1']} Wins ({(wins['p1']/max(1, played))*100}%)")
+    print(f"Player 2 ({os.path.basename(p2_deck_file)}): {wins['p2']} Wins ({(wins['p2']/max(1, played))*100}%)")
+    print(f"Avg Turns: {sum(r.turns for r in results) / max(1, played):.1f} | Avg Actions: {sum(r.actions for r in results) / max(1, played):.1f}"
+          f" | Avg Forced: {sum(r.forced_actions for r in results) / max(1, played):.1f}")
+    if not paired:
+        low, high = win_rate.interval()
+        print(f"P1 Win Rate: {win_rate.rate:.3f} ({win_rate.confidence:.0%} CI {low:.3f} - {high:.3f})")
+    else:
+        # A Wilson interval over the games would treat the two games of a pair as independent
+        mean, low, high = mean_interval([result.score for result in paired_results], win_rate.confidence)
+        print(f"Paired Deck 1 Score: {mean:.3f} ({win_rate.confidence:.0%} CI {low:.3f} - {high:.3f},"
+              f" {seeds} seeds) | Seat P1 Win Rate: {seat_wins / max(1, played):.3f}")
+    if stopping is not None:
+        saved = num_games - seeds
+        unit = "seeds" if paired else "games"
+        print(f"Early Stopping: {stopping.decision()} after {seeds} of {num_games} {unit}"
+              f" (saved {saved}, {saved / max(1, num_games) * 100:.1f}%)")
     print("=" * 50)
+    if stats is not None:
+        print(stats.summary())
+        if profile_json:
+            stats.dump_json(profile_json)
+            print(f"Profile written to {profile_json}")
+    return wins, (paired_results if paired else results)
+
+def compare_decks(base_deck_file, variant_deck_file, opponent_deck_file, num_games=100, seed=None, workers=1,
+                  shard_size=None, auto_advance=True, confidence=0.95):
+    """
+    Paired comparison of a deck change: the base and the variant each play a paired
+    run (run_simulation(paired=True)) against the same opponent with the same master
+    seed, so both see the same opponent shuffles, seat order and agent seeds per seed.
+    Returns (mean, low, high, variance reduction) of the per-seed score difference
+    variant - base (see engine.utils.win_rate.paired_difference).
+    """
+    master_seed = seed if seed is not None else new_master_seed()
+    scores = []
+    for deck_file in (base_deck_file, variant_deck_file):
+        _, results = run_simulation(deck_file, opponent_deck_file, num_games, seed=master_seed, workers=workers,
+                                    shard_size=shard_size, auto_advance=auto_advance, paired=True)
+        scores.append([result.score for result in results])
+    mean, low, high, reduction = paired_difference(scores[1], scores[0], confidence)
+    print("\n" + "=" * 50)
+    print(f"PAIRED COMPARISON vs {os.path.basename(opponent_deck_file)}: {num_games} seeds x 2 seats")
+    print(f"Base    ({os.path.basename(base_deck_file)}): {sum(scores[0]) / max(1, num_games):.3f}")
+    print(f"Variant ({os.path.basename(variant_deck_file)}): {sum(scores[1]) / max(1, num_games):.3f}")
+    print(f"Difference: {mean:+.3f} ({confidence:.0%} CI {low:+.3f} - {high:+.3f})"
+          f" | Variance Reduction vs Independent Runs: {reduction:.1f}x")
+    print("=" * 50)
+    return mean, low, high, reduction
+
+def replay_game(p1_deck_file, p2_deck_file, seed, game_index, verbose=True):
+    """
+    Re-play a single game of an earlier run (same master seed and game index).
+    """
+    l1, d1, l2, d2 = load_matchup(p1_deck_file, p2_deck_file)
+    events = EventBus([ConsoleSink()] if verbose else [])
+    result = run_game(l1, d1, l2, d2, make_agents(), seed, game_index, events, verbose)
+    print(f"Game {game_index} (seed {seed}): {result.winner or 'Draw'}")
+    return result
+
+def load_replay(p1_deck_file, p2_deck_file, replay_log, record_index, stop=None):
+    """
+    Position of a game recorded with run_simulation(replay_log=...): the Game after
+    its first `stop` agent actions (the final position by default). No agents are run.
+    """
+    l1, d1, l2, d2 = load_matchup(p1_deck_file, p2_deck_file)
+    with ReplayFile(replay_log) as replays:
+        record = replays[record_index]
+    return Replayer(l1, d1, l2, d2).replay(record, stop)
 
 if __name__ == "__main__":
     p1 = "engine/data/deck/OP11_luffy.json"
     p2 = "engine/data/deck/OP14_mihawk.json"
     
     # Run 1 Game in Verbose Mode
-    run_simulation(p1, p2, num_games=1, verbose=True)
+    run_simulation(p1, p2, num_games=1, verbose=True, seed=42)
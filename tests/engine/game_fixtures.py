@@ -0,0 +1,62 @@
+"""
+Card and game fixtures shared by the engine tests.
+
+    from tests.engine.game_fixtures import make_deck, make_game, advance_to_choice
+"""
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.core.game import Game
+from engine.models.player import Player
+from engine.models.card import Card, CardInstance
+from engine.models.effect import Effect, EffectType
+
+
+def blockers(i):
+    """Every third card is a [Blocker]."""
+    return [Effect(type=EffectType.ON_PLAY, action_code=EffectType.BLOCKER)] if i % 3 == 0 else []
+
+
+def make_deck(prefix="OP01", distinct=12, effects=blockers, counter=lambda i: 1000):
+    """
+    50 characters: cost i % 4, power 4000-6000. Card i gets id f"{prefix}-{i % distinct:03d}"
+    (distinct=None: 50 different ids), effects(i) and counter(i).
+    """
+    return [Card(id=f"{prefix}-{i if distinct is None else i % distinct:03d}", name=f"Card {i}",
+                 type="CHARACTER", cost=i % 4, power=4000 + 1000 * (i % 3), counter=counter(i),
+                 effect_list=effects(i))
+            for i in range(50)]
+
+
+def make_leaders(p2_power=5000):
+    return (CardInstance(card_id="L1", instance_id="p1_leader", owner_id="p1", current_power=5000),
+            CardInstance(card_id="L2", instance_id="p2_leader", owner_id="p2", current_power=p2_power))
+
+
+def make_game(seed=0, deck1=None, deck2=None, auto_advance=False, p2_power=5000) -> Game:
+    """Started game between two decks (make_deck() by default)."""
+    p1 = Player(id="p1", name="P1", deck=list(deck1) if deck1 is not None else make_deck())
+    p2 = Player(id="p2", name="P2", deck=list(deck2) if deck2 is not None else make_deck())
+    p1.leader, p2.leader = make_leaders(p2_power)
+    game = Game(p1, p2, seed=seed, auto_advance=auto_advance)
+    game.start_game()
+    return game
+
+
+def advance_to_choice(game: Game):
+    """Play forced moves until a player has more than one option ([] once the game is over)."""
+    while not game.state.winner_id:
+        actions = game.get_valid_actions()
+        if len(actions) > 1:
+            return actions
+        game.process_action(actions[0])
+    return []
+
+
+# Leader / deck Cards for DeckGameFactory-style setups; every card id is unique
+LEADER1 = Card(id="L1", name="Leader 1", type="LEADER", power=5000)
+LEADER2 = Card(id="L2", name="Leader 2", type="LEADER", power=5000)
+DECK1, DECK2 = make_deck("A", distinct=None), make_deck("B", distinct=None)
@@ -0,0 +1,88 @@
+import unittest
+import sys
+import os
+import random
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.core.action_space import (
+    NUM_ACTIONS, PASS, PLAY, BLOCK, COUNTER, attack_index, decode_action, encode_action
+)
+from engine.core.actions import CounterAction
+from tests.engine.game_fixtures import make_deck, make_game
+
+
+# Counter values 0 / 1000 / 2000
+DECK = make_deck(counter=lambda i: 1000 * (i % 3))
+
+
+class TestActionSpace(unittest.TestCase):
+    def test_indices_match_game_actions(self):
+        """legal_actions() and get_valid_actions() describe the same moves, in the same order."""
+        game = make_game(1, DECK, DECK)
+        rng = random.Random(1)
+        seen = set()
+        for _ in range(300):
+            if game.state.winner_id:
+                break
+            indices = game.legal_actions()
+            actions = game.get_valid_actions()
+            self.assertEqual([encode_action(game.state, a) for a in actions], indices)
+            self.assertEqual([decode_action(game.state, i) for i in indices], actions)
+            mask = game.legal_action_mask()
+            self.assertEqual(mask.shape, (NUM_ACTIONS,))
+            self.assertEqual(np.flatnonzero(mask).tolist(), sorted(indices))
+            seen.update(a.action_type for a in actions)
+            self.assertTrue(game.process_action(rng.choice(actions)))
+        self.assertTrue({'END_PHASE', 'PLAY_CARD', 'ATTACK', 'RESOLVE_BATTLE', 'BLOCK', 'COUNTER'} <= seen)
+
+    def test_integer_actions_replay_game(self):
+        """Playing indices gives the same game as playing the GameActions."""
+        hashes = []
+        for use_index in (False, True):
+            game = make_game(2, DECK, DECK)
+            rng = random.Random(2)
+            trace = []
+            while not game.state.winner_id and len(trace) < 300:
+                choices = game.legal_actions() if use_index else game.get_valid_actions()
+                self.assertTrue(game.process_action(rng.choice(choices)))
+                trace.append(game.state.zobrist_hash)
+            hashes.append(trace)
+        self.assertEqual(hashes[0], hashes[1])
+
+    def test_invalid_indices(self):
+        game = make_game(3, DECK, DECK)
+        self.assertFalse(game.process_action(PLAY + 63))          # empty hand slot
+        self.assertFalse(game.process_action(attack_index(3, 0)))  # no character in slot 2
+        self.assertFalse(game.process_action(BLOCK))               # no battle
+        self.assertFalse(game.process_action(NUM_ACTIONS))
+        with self.assertRaises(ValueError):
+            decode_action(game.state, PLAY + 63)
+        with self.assertRaises(ValueError):
+            decode_action(game.state, NUM_ACTIONS)
+
+    def test_counter_index(self):
+        game = make_game(4, DECK, DECK)
+        state = game.state
+        state.current_phase = 'MAIN_PHASE'
+        self.assertTrue(game.process_action(attack_index(0, 0)))
+        self.assertEqual(game.legal_actions(), [PASS])
+        self.assertFalse(game.process_action(COUNTER + 1))         # counters come after the block step
+        self.assertTrue(game.process_action(PASS))                  # no block
+        hand = state.players["p2"].hand
+        self.assertEqual(game.legal_actions(), [PASS] + [COUNTER + i for i, card in enumerate(hand) if card.counter])
+        no_counter = next(i for i, card in enumerate(hand) if not card.counter)
+        self.assertFalse(game.process_action(COUNTER + no_counter))
+        action = decode_action(state, COUNTER + 1)
+        self.assertEqual(action, CounterAction(player_id="p2", card_hand_index=1))
+        counter = state.players["p2"].hand[1].counter
+        self.assertTrue(game.process_action(COUNTER + 1))
+        self.assertEqual(state.current_battle.target_power, 5000 + counter)
+        self.assertEqual(encode_action(state, action), COUNTER + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
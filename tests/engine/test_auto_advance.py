@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+import random
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.core.action_space import PASS, BLOCK, COUNTER, attack_index
+from engine.models.card import CardInstance
+from tests.engine.game_fixtures import make_deck, make_game
+
+
+NO_COUNTERS = make_deck(counter=lambda i: 0)
+
+
+class TestAutoAdvance(unittest.TestCase):
+    def test_starts_at_first_decision(self):
+        game = make_game(auto_advance=True)
+        self.assertEqual(game.state.current_phase, 'MAIN_PHASE')
+        self.assertEqual(game.forced_actions, 3)
+
+    def test_battle_without_blockers_or_counters_resolves(self):
+        game = make_game(deck2=NO_COUNTERS, auto_advance=True)
+        life = len(game.state.players["p2"].life)
+        self.assertTrue(game.process_action(attack_index(0, 0)))
+        self.assertIsNone(game.state.current_battle)
+        self.assertEqual(len(game.state.players["p2"].life), life - 1)
+        self.assertEqual(game.state.current_phase, 'MAIN_PHASE')
+
+    def test_same_game_as_manual_play(self):
+        """Only decisions with one option are skipped: the game is unchanged."""
+        for seed in range(5):
+            manual, auto = make_game(seed), make_game(seed, auto_advance=True)
+            rng_manual, rng_auto = random.Random(seed), random.Random(seed)
+            decisions = 0
+            while not manual.state.winner_id and manual.state.turn_count < 30:
+                actions = manual.legal_actions()
+                if len(actions) == 1 and (manual.state.current_battle or manual.state.current_phase != 'MAIN_PHASE'):
+                    manual.process_action(actions[0])
+                    continue
+                self.assertEqual(auto.state.zobrist_hash, manual.state.zobrist_hash)
+                self.assertEqual(auto.legal_actions(), actions)
+                choice = rng_manual.randrange(len(actions))
+                self.assertEqual(rng_auto.randrange(len(actions)), choice)
+                manual.process_action(actions[choice])
+                auto.process_action(actions[choice])
+                decisions += 1
+            self.assertGreater(auto.forced_actions, decisions)
+
+    def test_stops_for_block_choice(self):
+        game = make_game(auto_advance=True)
+        state = game.state
+        defender = state.players["p2"]
+        blocker = CardInstance(card_id="OP01-000", instance_id="blocker", owner_id="p2", current_power=4000,
+                               granted_keywords=["BLOCKER"])
+        state.add_character("p2", blocker)
+        self.assertTrue(game.process_action(attack_index(0, 0)))
+        self.assertEqual(state.current_battle.current_step, 'BLOCK')
+        self.assertEqual(game.legal_actions(), [PASS, BLOCK])
+        self.assertTrue(game.process_action(BLOCK))
+        # Every hand card has a counter value: the defender chooses again
+        self.assertEqual(state.current_battle.current_step, 'COUNTER')
+        self.assertEqual(game.legal_actions(), [PASS] + [COUNTER + i for i in range(len(defender.hand))])
+        self.assertTrue(game.process_action(PASS))
+        self.assertIsNone(state.current_battle)
+        self.assertEqual(len(defender.field.character_area), 0)
+
+    def test_stops_for_counter_choice(self):
+        game = make_game(auto_advance=True)
+        state = game.state
+        self.assertTrue(game.process_action(attack_index(0, 0)))   # nothing to block with: skipped
+        self.assertEqual(state.current_battle.current_step, 'COUNTER')
+        self.assertTrue(game.process_action(COUNTER))
+        self.assertEqual(state.current_battle.target_power, 6000)
+        self.assertTrue(game.process_action(PASS))                  # 5000 vs 6000: no damage
+        self.assertIsNone(state.current_battle)
+        self.assertEqual(len(state.players["p2"].life), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
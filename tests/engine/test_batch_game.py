@@ -0,0 +1,144 @@
+import unittest
+import random
+import sys
+import os
+
+import numpy as np
+from tests.engine.game_fixtures import make_game, make_leaders
+
+# Add project root to path
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(PROJECT_ROOT)
+
+from engine.core import batch_game
+from engine.core.batch_game import BatchGame, KEYWORDS, LEADER
+from engine.core.action_space import encode_action
+from engine.models.card import Card
+from engine.models.effect import Effect, EffectType
+from engine.utils.deck_loader import load_card_db, load_deck_from_json
+from scripts.tournament_runner import build_game
+
+
+def make_deck(prefix):
+    deck = []
+    for i in range(50):
+        effects = []
+        if i % 5 == 0:
+            effects.append(Effect(type=EffectType.ON_PLAY, action_code=EffectType.BUFF_POWER, action_power=1000))
+        if i % 7 == 0:
+            effects.append(Effect(type=EffectType.ON_PLAY, action_code=EffectType.DRAW_CARD, action_value=2))
+        if i % 9 == 0:
+            effects.append(Effect(type=EffectType.ON_PLAY, action_code=EffectType.TRASH_CARD, action_value=1))
+        if i % 3 == 0:
+            effects.append(Effect(type=EffectType.ON_PLAY, action_code=EffectType.BLOCKER))
+        card_type = "EVENT" if i % 11 == 0 else "CHARACTER"
+        deck.append(Card(id=f"{prefix}-{i % 17:03d}", name=f"Card {i}", type=card_type, cost=i % 5,
+                         power=3000 + 1000 * (i % 4), counter=1000, effect_list=effects))
+    return deck
+
+
+def position(state, instance_id):
+    location = state.locate_instance(instance_id)
+    return LEADER if location.zone == 'leader' else location.slot
+
+
+def game_snapshot(state):
+    """The BatchGame.snapshot structure built from a GameState."""
+    players = {}
+    for pid, player in state.players.items():
+        players[pid] = {
+            "hand": [c.id for c in player.hand],
+            "deck": [c.id for c in player.deck],
+            "life": [c.id for c in player.life],
+            "trash": [c.id for c in player.trash],
+            "characters": [(c.card_id, c.total_power, c.is_rested,
+                            sum(KEYWORDS[k] for k in c.granted_keywords)) for c in player.field.character_area],
+            "leader": (player.leader.total_power, player.leader.is_rested),
+            "don": (player.active_don, player.rested_don),
+        }
+    battle = None
+    if state.current_battle:
+        b = state.current_battle
+        battle = (b.current_step, position(state, b.attacker_instance_id), position(state, b.target_instance_id),
+                  b.attacker_power, b.target_power)
+    return {"turn": state.turn_count, "phase": state.current_phase, "active": state.active_player_id,
+            "winner": state.winner_id, "battle": battle, "players": players}
+
+
+class TestBatchGameParity(unittest.TestCase):
+    def run_parity(self, batch, games, seeds, max_steps=2000):
+        """Play seeded random games on both engines; state and legal actions must agree at every step."""
+        batch.reset(seeds=seeds)
+        choosers = [random.Random(seed) for seed in seeds]
+
+        for _ in range(max_steps):
+            mask = batch.legal_mask()
+            actions = np.full(len(seeds), batch_game.PASS)
+            for i, game in enumerate(games):
+                self.assertEqual(batch.snapshot(i), game_snapshot(game.state))
+                if game.state.winner_id:
+                    self.assertFalse(mask[i].any())
+                    continue
+                valid = game.get_valid_actions()
+                self.assertEqual(sorted(encode_action(game.state, a) for a in valid),
+                                 np.nonzero(mask[i])[0].tolist())
+                action = choosers[i].choice(valid)
+                actions[i] = encode_action(game.state, action)
+                self.assertTrue(game.process_action(action))
+            if batch.done.all():
+                break
+            batch.step(actions, validate=True)
+        return games
+
+    def test_seeded_random_games(self):
+        deck1, deck2 = make_deck("A"), make_deck("B")
+        seeds = list(range(12))
+        l1, l2 = make_leaders()
+        batch = BatchGame(l1, deck1, l2, deck2, n=len(seeds))
+        games = self.run_parity(batch, [make_game(seed, deck1, deck2) for seed in seeds], seeds)
+        # The random games get far enough to exercise blocks, life damage and wins
+        self.assertTrue(all(g.state.winner_id for g in games))
+
+    def test_real_decks(self):
+        card_db = load_card_db(os.path.join(PROJECT_ROOT, "data/clean_json"))
+        l1, d1 = load_deck_from_json(os.path.join(PROJECT_ROOT, "engine/data/deck/OP11_luffy.json"), card_db)
+        l2, d2 = load_deck_from_json(os.path.join(PROJECT_ROOT, "engine/data/deck/OP14_mihawk.json"), card_db)
+        seeds = list(range(6))
+        batch = BatchGame.from_cards(l1, d1, l2, d2, n=len(seeds))
+        games = self.run_parity(batch, [build_game(l1, d1, l2, d2, seed, auto_advance=False) for seed in seeds], seeds)
+        self.assertTrue(all(g.state.winner_id for g in games))
+
+    def test_reset_subset(self):
+        deck1, deck2 = make_deck("A"), make_deck("B")
+        l1, l2 = make_leaders()
+        batch = BatchGame(l1, deck1, l2, deck2, n=4)
+        batch.reset(seeds=[0, 1, 2, 3])
+        before = batch.snapshot(0)
+        batch.step(np.full(4, batch_game.END_PHASE))
+        batch.reset(seeds=[99], games=[2])
+        self.assertEqual(batch.snapshot(2), game_snapshot(make_game(99, deck1, deck2).state))
+        self.assertEqual(batch.snapshot(0)["phase"], "DRAW_PHASE")
+        self.assertEqual(batch.snapshot(0)["players"], before["players"])
+
+    def test_vectorized_reset_and_random_play(self):
+        l1, l2 = make_leaders()
+        batch = BatchGame(l1, make_deck("A"), l2, make_deck("B"), n=64, max_turns=200)
+        rng = np.random.default_rng(0)
+        batch.reset(rng=rng)
+        self.assertTrue((batch.hand_len == 5).all())
+        self.assertTrue((batch.life_len == 5).all())
+        for _ in range(20000):
+            if batch.done.all():
+                break
+            batch.step(batch.random_actions(rng), validate=True)
+        self.assertTrue(batch.done.all())
+        # Cards are conserved in every game
+        total = (batch.deck_len - batch.deck_top) + batch.hand_len + batch.trash_len \
+            + (batch.life_len - batch.life_top) + batch.field_len
+        self.assertTrue((total == 50).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.data.card_db import compile_card_db, open_card_db, CompiledCardDB, normalize_record, read_raw_records
+from engine.data.loader import CardLoader
+from engine.data.registry import CardRegistry
+from engine.models.effect import EffectType
+from engine.utils.deck_loader import load_card_db, load_deck_from_json
+
+ZORO = {"id": "OP01-025", "name": "Roronoa Zoro", "type": "Character", "color": "Red", "attribute": "Slash",
+        "power": 5000, "counter": 1000, "cost": 3, "rarity": "SR", "subtypes": ["Supernovas", "Straw Hat Crew"],
+        "effect": "[Rush]<br>(This card can attack on the turn in which it is played.)"}
+NAMI = {"id": "OP01-016", "name": "Nami", "type": "Character", "color": "Red;Green", "attribute": "Special;Wisdom",
+        "power": 1000, "cost": 1, "rarity": "R", "subtypes": ["Straw Hat Crew"],
+        "effect": "[On Play] Draw 1 card."}
+LUFFY = {"id": "OP01-001", "name": "Monkey.D.Luffy", "type": "Leader", "color": "Red", "attribute": "Strike",
+         "power": 5000, "life": 5, "rarity": "L", "subtypes": ["Supernovas"], "effect": ""}
+
+
+class TestCardDB(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.json_dir = os.path.join(self.tmp.name, "clean_json")
+        os.makedirs(self.json_dir)
+        self._write("cards_1.json", [ZORO, LUFFY])
+        self._write("cards_2.json", [NAMI])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, filename, records):
+        with open(os.path.join(self.json_dir, filename), 'w', encoding='utf-8') as f:
+            json.dump(records, f)
+
+    def test_normalization(self):
+        record = normalize_record(NAMI)
+        self.assertEqual(record["type"], "CHARACTER")
+        self.assertEqual(record["colors"], ["RED", "GREEN"])
+        self.assertEqual(record["attribute"], "SPECIAL")
+        self.assertIsNone(record["counter"])
+
+    def test_raw_records_keep_display_strings(self):
+        # Embedding text / metadata use the records as written, not the engine's normal form
+        records = read_raw_records(self.json_dir)
+        self.assertEqual([r["id"] for r in records], ["OP01-025", "OP01-001", "OP01-016"])
+        self.assertEqual(records[2], NAMI)
+
+    def test_compiled_records(self):
+        db = CompiledCardDB(compile_card_db(self.json_dir))
+        self.assertEqual(len(db), 3)
+        self.assertEqual(db.ids(), ["OP01-025", "OP01-001", "OP01-016"])
+
+        zoro = db.get_record("OP01-025")
+        self.assertEqual(zoro["power"], 5000)
+        self.assertEqual(zoro["subtypes"], ["Supernovas", "Straw Hat Crew"])
+        self.assertEqual(db.power[db.index_of("OP01-025")], 5000)
+        self.assertIsNone(db.get_record("OP01-001")["counter"])
+        self.assertEqual(db.get_record("OP01-001")["life"], 5)
+
+        # effect_list is stored pre-parsed
+        nami = db.card(db.index_of("OP01-016"))
+        self.assertEqual([e.action_code for e in nami.effect_list], [EffectType.DRAW_CARD])
+        self.assertEqual(db.card(0).effect_list[0].type, EffectType.RUSH)
+
+    def test_loaders_share_normalization(self):
+        db = open_card_db(self.json_dir)
+        loader = CardLoader(self.json_dir, registry=CardRegistry())
+        for raw in (ZORO, NAMI, LUFFY):
+            self.assertEqual(loader._parse_card_json(raw), db.card(db.index_of(raw["id"])))
+
+        cards = loader.load_all_cards()
+        self.assertEqual([c.id for c in cards], ["OP01-025", "OP01-001", "OP01-016"])
+
+        deck_path = os.path.join(self.tmp.name, "deck.json")
+        with open(deck_path, 'w', encoding='utf-8') as f:
+            json.dump({"leader": "OP01-001", "cards": [{"id": "OP01-016", "quantity": 4}]}, f)
+        leader, deck = load_deck_from_json(deck_path, load_card_db(self.json_dir), CardRegistry())
+        self.assertEqual(leader, loader.cards["OP01-001"])
+        self.assertEqual(deck, [loader.cards["OP01-016"]] * 4)
+
+    def test_reload_adds_no_handles(self):
+        # Zoro reprints: one with the same definition, one variant without the effect
+        self._write("cards_3.json", [dict(ZORO, rarity="SP"), dict(ZORO, rarity="SP", effect="")])
+        registry = CardRegistry()
+        CardLoader(self.json_dir, registry=registry).load_all_cards()
+        size = len(registry)
+        self.assertEqual(size, 4)
+        CardLoader(self.json_dir, registry=registry).load_all_cards()
+        self.assertEqual(len(registry), size)
+
+    def test_rebuild_when_sources_change(self):
+        db = open_card_db(self.json_dir)
+        self.assertIsNone(db.index_of("OP01-013"))
+
+        self._write("cards_3.json", [dict(ZORO, id="OP01-013", name="Sanji")])
+        db = open_card_db(self.json_dir)
+        self.assertEqual(db.get_record("OP01-013")["name"], "Sanji")
+        self.assertEqual(len(db), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
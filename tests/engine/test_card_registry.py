@@ -0,0 +1,93 @@
+import unittest
+import sys
+import os
+import weakref
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.core.game import Game
+from engine.core.effect_manager import EffectManager
+from engine.core.actions import PlayCardAction
+from engine.data.registry import CardRegistry, NO_HANDLE
+from engine.models.player import Player
+from engine.models.effect import Effect, EffectType
+from engine.models.card import Card, CardInstance
+
+class TestCardRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = CardRegistry()
+        self.zoro = Card(id="OP01-025", name="Roronoa Zoro", type="CHARACTER", cost=3, power=5000)
+
+    def test_handles_are_dense_and_interned(self):
+        h1 = self.registry.register(self.zoro)
+        h2 = self.registry.register(Card(id="OP01-025", name="Roronoa Zoro", type="CHARACTER", cost=3, power=5000))
+        h3 = self.registry.register(Card(id="OP01-026", name="Nami", type="CHARACTER"))
+        self.assertEqual((h1, h2, h3), (0, 0, 1))
+        self.assertIs(self.registry.get(h1), self.zoro)
+        self.assertEqual(self.registry.handle_of("OP01-026"), 1)
+
+    def test_conflicting_definition_gets_new_handle(self):
+        h1 = self.registry.register(self.zoro)
+        h2 = self.registry.register(Card(id="OP01-025", name="Other", type="CHARACTER"))
+        self.assertNotEqual(h1, h2)
+        self.assertIs(self.registry.get_by_id("OP01-025"), self.zoro)
+
+    def test_variants_registered_once(self):
+        # Printings sharing an id are separate definitions, each interned by value
+        variant = lambda: Card(id="OP01-025", name="Roronoa Zoro (Parallel)", type="CHARACTER", cost=3, power=5000,
+                               tags=["Supernovas"])
+        handles = [self.registry.register(card) for card in (self.zoro, variant(), variant(), self.zoro.model_copy())]
+        self.assertEqual(handles, [0, 1, 1, 0])
+        self.assertEqual(len(self.registry), 2)
+
+    def test_duplicates_not_kept_alive(self):
+        self.registry.register(self.zoro)
+        duplicate = Card(id="OP01-025", name="Roronoa Zoro", type="CHARACTER", cost=3, power=5000)
+        ref = weakref.ref(duplicate)
+        self.assertIs(self.registry.intern(duplicate), self.zoro)
+        del duplicate
+        self.assertIsNone(ref())
+
+    def test_card_for_falls_back_to_card_id(self):
+        self.registry.register(self.zoro)
+        instance = CardInstance(card_id="OP01-025", instance_id="z", owner_id="p1")
+        self.assertEqual(instance.card_handle, NO_HANDLE)
+        self.assertIs(self.registry.card_for(instance), self.zoro)
+
+class TestZoneTransfers(unittest.TestCase):
+    def setUp(self):
+        self.registry = CardRegistry()
+        self.p1 = Player(id="p1", name="Player 1")
+        self.p2 = Player(id="p2", name="Player 2")
+        self.game = Game(self.p1, self.p2, registry=self.registry)
+        self.game.state.current_phase = "MAIN_PHASE"
+
+        self.zoro = Card(id="OP01-025", name="Roronoa Zoro", type="CHARACTER", cost=0, power=5000)
+        self.p1.hand.append(self.zoro)
+        self.game.process_action(PlayCardAction(player_id="p1", card_hand_index=0))
+        self.zoro_instance = self.p1.field.character_area[0]
+        self.manager = EffectManager(self.game.state, self.registry)
+
+    def test_played_instance_has_handle(self):
+        self.assertIs(self.registry.get(self.zoro_instance.card_handle), self.zoro)
+
+    def test_ko_moves_card_to_owner_trash(self):
+        effect = Effect(type=EffectType.KO_CHARACTER, action_code=EffectType.KO_CHARACTER)
+        self.assertTrue(self.manager.resolve_effect(effect, "source", target_id=self.zoro_instance.instance_id))
+        self.assertEqual(self.p1.trash, [self.zoro])
+
+    def test_bounce_moves_card_to_owner_hand(self):
+        effect = Effect(type=EffectType.RETURN_TO_HAND, action_code=EffectType.RETURN_TO_HAND)
+        self.assertTrue(self.manager.resolve_effect(effect, "source", target_id=self.zoro_instance.instance_id))
+        self.assertEqual(self.p1.hand, [self.zoro])
+        self.assertEqual(len(self.p1.field.character_area), 0)
+
+    def test_bottom_deck_moves_card_to_owner_deck(self):
+        self.p1.deck = [Card(id="C1", name="Dummy", type="CHARACTER")]
+        effect = Effect(type=EffectType.RETURN_TO_BOTTOM_DECK, action_code=EffectType.RETURN_TO_BOTTOM_DECK)
+        self.assertTrue(self.manager.resolve_effect(effect, "source", target_id=self.zoro_instance.instance_id))
+        self.assertIs(self.p1.deck[-1], self.zoro)
+
+if __name__ == '__main__':
+    unittest.main()
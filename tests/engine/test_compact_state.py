@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.core.game import Game
+from engine.models.player import Player
+from engine.models.card import Card, CardInstance
+from engine.core.actions import AttackAction, BlockAction
+from engine.compact_state import to_compact, from_compact
+
+class TestCompactState(unittest.TestCase):
+    def setUp(self):
+        self.p1 = Player(id="p1", name="Player 1")
+        self.p2 = Player(id="p2", name="Player 2")
+        self.game = Game(self.p1, self.p2)
+
+        self.p1.deck = [Card(id=f"C{i}", name=f"Card {i}", type="CHARACTER", cost=i % 4, power=1000 * i) for i in range(20)]
+        self.p2.deck = [Card(id="C1", name="Dummy", type="CHARACTER", power=1000, counter=1000)] * 20
+        self.game.start_game()
+
+        self.p1.leader = CardInstance(card_id="L1", instance_id="p1_leader", owner_id="p1", current_power=5000)
+        self.p2.leader = CardInstance(card_id="L2", instance_id="p2_leader", owner_id="p2", current_power=5000, attached_don=2)
+        blocker = CardInstance(card_id="B1", instance_id="p2_blocker", owner_id="p2", current_power=1000, power_modifier=2000)
+        blocker.granted_keywords.append("BLOCKER")
+        self.p2.field.add_character(blocker)
+        self.p1.trash.append(self.p1.hand.pop())
+        self.p2.active_don = 3
+        self.p2.rested_don = 1
+
+    def test_round_trip_is_lossless(self):
+        restored = from_compact(to_compact(self.game.state))
+        self.assertEqual(restored, self.game.state)
+
+    def test_round_trip_during_battle(self):
+        self.game.process_action(AttackAction(
+            player_id="p1", action_type="ATTACK",
+            attacker_instance_id="p1_leader", target_instance_id="p2_leader"
+        ))
+        self.game.process_action(BlockAction(
+            player_id="p2", action_type="BLOCK", blocker_instance_id="p2_blocker"
+        ))
+        compact = to_compact(self.game.state)
+        self.assertEqual(compact.battle.current_step, "COUNTER")
+        self.assertEqual(from_compact(compact), self.game.state)
+
+    def test_shared_cards_are_interned(self):
+        compact = to_compact(self.game.state)
+        p2 = compact.players[1]
+        self.assertEqual(set(p2.deck) | set(p2.hand) | set(p2.life), {p2.deck[0]})
+        self.assertEqual(p2.character_count(), 1)
+
+    def test_compact_clone_is_independent(self):
+        compact = to_compact(self.game.state)
+        clone = compact.clone()
+        clone.players[1].life.pop()
+        clone.players[1].characters[0].keywords.append("RUSH")
+        self.assertEqual(from_compact(compact), self.game.state)
+
+if __name__ == '__main__':
+    unittest.main()
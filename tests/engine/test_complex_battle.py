@@ -7,7 +7,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 from engine.core.game import Game
 from engine.models.player import Player
-from engine.models.card import Card, CardInstance
+from engine.models.card import Card, CardInstance, KEYWORD_FLAGS
 from engine.core.actions import AttackAction, BlockAction, CounterAction, ResolveBattleAction
 
 class TestComplexBattle(unittest.TestCase):
@@ -36,6 +36,18 @@ class TestComplexBattle(unittest.TestCase):
         self.blocker.granted_keywords.append("BLOCKER") # Manually grant keyword
         self.p2.field.add_character(self.blocker)
 
+    def test_appended_keyword_offers_block(self):
+        """A keyword appended to granted_keywords after construction still counts"""
+        self.assertTrue(self.blocker.keyword_flags & KEYWORD_FLAGS["BLOCKER"])
+        self.game.process_action(AttackAction(
+            player_id="p1",
+            action_type="ATTACK",
+            attacker_instance_id="p1_leader",
+            target_instance_id="p2_leader"
+        ))
+        self.assertEqual([action.action_type for action in self.game.get_valid_actions()],
+                         ["RESOLVE_BATTLE", "BLOCK"])
+
     def test_blocker_intercept(self):
         """Test Attack -> Block -> Blocker dies -> Original Target safe"""
         
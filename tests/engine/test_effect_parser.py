@@ -0,0 +1,47 @@
+import unittest
+import sys
+import os
+import tempfile
+from unittest import mock
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.data import parser as parser_module
+from engine.data.parser import EffectParser, ParseCache
+from engine.models.effect import EffectType
+
+TEXT = ("[Activate:Main] DON!! -1: Give this Character +2000 power.<br>"
+        "[Blocker]<br>[Trigger] K.O. up to 1 of your opponent's Characters with a cost of 3 or less. Draw 1 card.")
+
+
+class TestEffectParser(unittest.TestCase):
+    def test_tags_and_text_rules(self):
+        effects = EffectParser().parse_effects(TEXT)
+        self.assertEqual([e.type for e in effects],
+                         [EffectType.ACTIVATE_MAIN, EffectType.BLOCKER, EffectType.DRAW_CARD, EffectType.TRIGGER])
+        activate, _, _, trigger = effects
+        self.assertEqual(activate.action_code, EffectType.BUFF_POWER)
+        self.assertEqual(activate.condition_cost, 1)
+        self.assertEqual(trigger.action_code, EffectType.KO_CHARACTER)
+        self.assertEqual(trigger.target_filter, "opponent|character|cost<=3")
+
+    def test_cache_roundtrip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "effect_cache.json")
+            cache = ParseCache(path)
+            expected = EffectParser(cache).parse_effects(TEXT)
+            cache.save()
+
+            parser = EffectParser(ParseCache(path))
+            with mock.patch.object(parser, "_parse", side_effect=AssertionError("cache miss")):
+                self.assertEqual(parser.parse_effects(TEXT), expected)
+
+    def test_cache_key_includes_parser_version(self):
+        key = ParseCache.key(TEXT)
+        with mock.patch.object(parser_module, "PARSER_VERSION", parser_module.PARSER_VERSION + 1):
+            self.assertNotEqual(ParseCache.key(TEXT), key)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import sys
+import os
+import pickle
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.core.game import GameState, Player
+from engine.core.effect_manager import EffectManager
+from engine.core.effect_program import OP_KO, OP_NONE, OP_GRANT_KEYWORD, compile_effect
+from engine.core.targeting import compile_filter
+from engine.data.registry import CardRegistry
+from engine.models.effect import Effect, EffectType
+from engine.models.card import Card, CardInstance
+
+
+class TestEffectPrograms(unittest.TestCase):
+    def setUp(self):
+        self.registry = CardRegistry()
+        self.p1 = Player(id="p1", name="Player 1")
+        self.p2 = Player(id="p2", name="Player 2")
+        self.state = GameState(players={"p1": self.p1, "p2": self.p2}, active_player_id="p1")
+        self.manager = EffectManager(self.state, self.registry)
+        self.p1.leader = CardInstance(card_id="L1", instance_id="p1_leader", owner_id="p1", current_power=5000)
+        self.p2.leader = CardInstance(card_id="L2", instance_id="p2_leader", owner_id="p2", current_power=5000)
+        for pid, cost, rested in (("p1", 2, False), ("p2", 2, True), ("p2", 5, False)):
+            card = Card(id=f"C{cost}", name=f"Cost {cost}", type="CHARACTER", cost=cost, power=1000 * cost)
+            instance = CardInstance(card_id=card.id, card_handle=self.registry.register(card),
+                                    instance_id=f"{pid}_c{cost}", owner_id=pid, current_power=card.power,
+                                    is_rested=rested)
+            self.state.add_character(pid, instance)
+
+    def targets(self, text, source_id=None):
+        found = compile_filter(text).targets(self.state, self.registry, "p1", source_id)
+        return [instance.instance_id for instance in found]
+
+    def test_filter_terms(self):
+        self.assertEqual(self.targets("opponent|character|cost<=4"), ["p2_c2"])
+        self.assertEqual(self.targets("opponent|character|rested"), ["p2_c2"])
+        self.assertEqual(self.targets("opponent|active"), ["p2_leader", "p2_c5"])
+        self.assertEqual(self.targets("own|leader"), ["p1_leader"])
+        self.assertEqual(self.targets("character|power>=2000|power<5000"), ["p1_c2", "p2_c2"])
+        self.assertEqual(self.targets("self", source_id="p1_c2"), ["p1_c2"])
+        self.assertEqual(self.targets("leader"), ["p1_leader", "p2_leader"])
+        with self.assertRaises(ValueError):
+            compile_filter("opponent|cost~4")
+
+    def test_cost_uses_modifiers(self):
+        self.state.update_instance(self.state.find_instance("p2_c5"), cost_modifier=-2)
+        self.assertEqual(self.targets("opponent|character|cost<=3"), ["p2_c2", "p2_c5"])
+
+    def test_compile(self):
+        effect = Effect(type=EffectType.ON_PLAY, action_code=EffectType.KO_CHARACTER,
+                        target_filter="opponent|character|cost<=4")
+        program = compile_effect(effect)
+        self.assertEqual((program.op, program.trigger), (OP_KO, "ON_PLAY"))
+        self.assertIs(program.target, compile_filter("opponent|character|cost<=4"))
+        keyword = compile_effect(Effect(type=EffectType.BLOCKER, action_code=EffectType.BLOCKER))
+        self.assertEqual((keyword.op, keyword.keyword), (OP_GRANT_KEYWORD, "BLOCKER"))
+        self.assertEqual(compile_effect(Effect(type=EffectType.ON_PLAY, action_code=EffectType.SET_ACTIVE)).op,
+                         OP_NONE)
+        copy = pickle.loads(pickle.dumps(program))
+        self.assertEqual((copy.op, copy.target), (OP_KO, program.target))
+
+    def test_registry_compiles_on_register(self):
+        card = Card(id="K1", name="KO", type="CHARACTER", effect_list=[
+            Effect(type=EffectType.ON_PLAY, action_code=EffectType.KO_CHARACTER, target_filter="opponent|character"),
+            Effect(type=EffectType.RUSH, action_code=EffectType.RUSH)])
+        handle = self.registry.register(card)
+        self.assertEqual([p.op for p in self.registry.programs[handle]], [OP_KO, OP_GRANT_KEYWORD])
+        self.assertEqual(len(self.registry.programs), len(self.registry.cards))
+
+    def test_program_for_keyed_by_value(self):
+        effect = Effect(type=EffectType.ON_PLAY, action_code=EffectType.BUFF_POWER, action_power=1000)
+        program = self.registry.program_for(effect)
+        same = Effect(type=EffectType.ON_PLAY, action_code=EffectType.BUFF_POWER, action_power=1000)
+        self.assertIs(self.registry.program_for(same), program)
+        effect.action_power = 2000
+        self.assertEqual(self.registry.program_for(effect).power, 2000)
+        self.assertEqual(program.power, 1000)
+
+    def test_target_filter_enforced(self):
+        effect = Effect(type=EffectType.ON_PLAY, action_code=EffectType.KO_CHARACTER,
+                        target_filter="opponent|character|cost<=4")
+        program = compile_effect(effect)
+        self.assertEqual([i.instance_id for i in self.manager.valid_targets(program)], ["p2_c2"])
+        self.assertFalse(self.manager.run(program, "source", "p2_c5"))      # cost 5
+        self.assertFalse(self.manager.run(program, "source", "p1_c2"))      # own character
+        self.assertTrue(self.manager.run(program, "source", "p2_c2"))
+        self.assertEqual([c.instance_id for c in self.p2.field.character_area], ["p2_c5"])
+        self.assertEqual(self.p2.trash[0].id, "C2")
+
+
+if __name__ == '__main__':
+    unittest.main()
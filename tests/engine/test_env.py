@@ -0,0 +1,106 @@
+import unittest
+import functools
+import sys
+import os
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.env import GameEnv, VecEnv
+from engine.core.batch_game import NUM_ACTIONS
+from engine.core.action_space import END_PHASE
+from engine.core.actions import PlayCardAction
+from agents.gameplay.random_agent import RandomAgent
+from tests.engine.game_fixtures import DECK1, DECK2, LEADER1, LEADER2
+
+
+def make_env(**kwargs):
+    return GameEnv.from_decks(LEADER1, DECK1, LEADER2, DECK2, **kwargs)
+
+
+def pick(mask, rng):
+    return rng.choice(np.flatnonzero(mask))
+
+
+class TestGameEnv(unittest.TestCase):
+    def test_episode(self):
+        env = make_env()
+        obs, mask = env.reset(seed=3)
+        self.assertEqual(mask.shape, (NUM_ACTIONS,))
+        self.assertIs(obs, env.game.state)
+        rng = np.random.default_rng(0)
+        done, steps = False, 0
+        while not done:
+            actor = env.player
+            obs, mask, reward, done, info = env.step(pick(mask, rng))
+            steps += 1
+        self.assertGreater(steps, 10)
+        if info["winner"]:
+            self.assertEqual(reward, 1.0 if info["winner"] == actor else -1.0)
+        with self.assertRaises(ValueError):
+            env.step(0)
+
+    def test_opponent_plays_inside_step(self):
+        env = make_env(opponent=RandomAgent("p2", seed=1))
+        obs, mask = env.reset(seed=5)
+        rng = np.random.default_rng(1)
+        done = False
+        while not done:
+            self.assertEqual(env.player, "p1")
+            obs, mask, reward, done, info = env.step(pick(mask, rng))
+
+    def test_rejected_opponent_action_raises(self):
+        """An opponent move the engine rejects stops the episode instead of looping forever."""
+        class EmptySlotAgent(RandomAgent):
+            def take_action(self, game_state, valid_actions):
+                return PlayCardAction(player_id=self.id, card_hand_index=63)
+
+        class NoneAgent(RandomAgent):
+            def take_action(self, game_state, valid_actions):
+                return None
+
+        for opponent in (EmptySlotAgent("p2"), NoneAgent("p2")):
+            env = make_env(opponent=opponent)
+            env.reset(seed=0)
+            with self.assertRaisesRegex(RuntimeError, type(opponent).__name__):
+                for _ in range(10):
+                    env.step(END_PHASE)
+
+    def test_same_seed_same_game(self):
+        turns = []
+        for _ in range(2):
+            env = make_env()
+            _, mask = env.reset(seed=11)
+            rng = np.random.default_rng(2)
+            done = False
+            while not done:
+                _, mask, _, done, info = env.step(pick(mask, rng))
+            turns.append((info["turn"], info["winner"]))
+        self.assertEqual(turns[0], turns[1])
+
+
+class TestVecEnv(unittest.TestCase):
+    def run_vec(self, workers, steps=300):
+        venv = VecEnv([functools.partial(make_env, max_turns=30)] * 6, workers=workers)
+        try:
+            _, masks = venv.reset(seed=42)
+            rng = np.random.default_rng(0)
+            trace = []
+            for _ in range(steps):
+                actions = [pick(mask, rng) for mask in masks]
+                _, masks, rewards, dones, infos = venv.step(actions)
+                trace.append((tuple(actions), rewards.tolist(), dones.tolist()))
+            return trace
+        finally:
+            venv.close()
+
+    def test_workers_match_in_process(self):
+        local = self.run_vec(workers=0)
+        self.assertTrue(any(any(dones) for _, _, dones in local))   # auto-reset happened
+        self.assertEqual(self.run_vec(workers=2), local)
+
+
+if __name__ == '__main__':
+    unittest.main()
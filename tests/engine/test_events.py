@@ -0,0 +1,86 @@
+import unittest
+import sys
+import os
+import io
+import json
+import tempfile
+from contextlib import redirect_stdout
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.core.game import Game
+from engine.core.events import (
+    EventBus, RecordingSink, ConsoleSink, JsonlSink, AttackDeclared, BattleResolved, LifeLost, CardPlayed
+)
+from engine.models.player import Player
+from engine.models.card import Card, CardInstance
+from engine.core.actions import AttackAction, ResolveBattleAction, PlayCardAction
+
+class TestEvents(unittest.TestCase):
+    def setUp(self):
+        self.recorder = RecordingSink()
+        self.p1 = Player(id="p1", name="Player 1")
+        self.p2 = Player(id="p2", name="Player 2")
+        self.game = Game(self.p1, self.p2, events=EventBus([self.recorder]))
+
+        dummy_card = Card(id="C1", name="Dummy", type="CHARACTER", power=1000, counter=1000)
+        self.p1.deck = [dummy_card] * 10
+        self.p2.deck = [dummy_card] * 10
+        self.game.start_game()
+        self.p1.leader = CardInstance(card_id="L1", instance_id="p1_leader", owner_id="p1", current_power=5000)
+        self.p2.leader = CardInstance(card_id="L2", instance_id="p2_leader", owner_id="p2", current_power=5000)
+
+    def attack_leader(self, game):
+        game.process_action(AttackAction(
+            player_id="p1", action_type="ATTACK",
+            attacker_instance_id="p1_leader", target_instance_id="p2_leader"
+        ))
+        game.process_action(ResolveBattleAction(player_id="p2", action_type="RESOLVE_BATTLE"))
+        game.process_action(ResolveBattleAction(player_id="p2", action_type="RESOLVE_BATTLE"))
+
+    def test_battle_events(self):
+        self.attack_leader(self.game)
+        self.assertEqual(
+            [type(e) for e in self.recorder.events],
+            [AttackDeclared, BattleResolved, LifeLost]
+        )
+        self.assertEqual(self.recorder.events[2].remaining, 4)
+
+    def test_play_event(self):
+        self.game.state.current_phase = "MAIN_PHASE"
+        self.p1.hand.insert(0, Card(id="Z", name="Zoro", type="CHARACTER", cost=0, power=5000))
+        self.game.process_action(PlayCardAction(player_id="p1", card_hand_index=0))
+        played = self.recorder.events[-1]
+        self.assertIsInstance(played, CardPlayed)
+        self.assertEqual(played.card_name, "Zoro")
+
+    def test_no_sink_is_silent(self):
+        game = Game(self.p1, self.p2)
+        self.assertFalse(game.events.enabled)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.attack_leader(game)
+        self.assertEqual(out.getvalue(), "")
+
+    def test_fork_does_not_emit(self):
+        self.attack_leader(self.game.fork())
+        self.assertEqual(self.recorder.events, [])
+
+    def test_console_and_jsonl_sinks(self):
+        out = io.StringIO()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "events.jsonl")
+            jsonl = JsonlSink(path)
+            self.game.events.attach(ConsoleSink(out))
+            self.game.events.attach(jsonl)
+            self.attack_leader(self.game)
+            jsonl.close()
+            with open(path, encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
+
+        self.assertIn("[Battle] Resolve: 5000 vs 5000", out.getvalue())
+        self.assertEqual([r["event"] for r in records], ["AttackDeclared", "BattleResolved", "LifeLost"])
+
+if __name__ == '__main__':
+    unittest.main()
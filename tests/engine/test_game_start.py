@@ -26,3 +26,29 @@ def test_start_game_initialization():
     # Check Deck (Start 50 - 5 Life - 5 Hand = 40)
     assert len(p1.deck) == 40
     assert len(p2.deck) == 40
+
+def _seeded_game(seed):
+    deck = [Card(id=f"OP01-{i:03d}", name=f"Card {i}", type="CHARACTER") for i in range(50)]
+    p1 = Player(id="p1", name="Luffy", deck=deck[:])
+    p2 = Player(id="p2", name="Kaido", deck=deck[:])
+    game = Game(p1, p2, seed=seed)
+    game.start_game()
+    return game
+
+def test_same_seed_same_setup():
+    g1 = _seeded_game(1234)
+    g2 = _seeded_game(1234)
+    assert g1.state == g2.state
+
+def test_different_seed_different_setup():
+    g1 = _seeded_game(1)
+    g2 = _seeded_game(2)
+    assert [c.id for c in g1.state.players["p1"].hand] != [c.id for c in g2.state.players["p1"].hand]
+
+def test_seeded_game_ignores_global_random():
+    import random
+    random.seed(0)
+    g1 = _seeded_game(99)
+    random.seed(1)
+    g2 = _seeded_game(99)
+    assert g1.state == g2.state
@@ -0,0 +1,52 @@
+import unittest
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.state import GameState
+from engine.models.player import Player
+from engine.models.card import CardInstance
+
+class TestInstanceIndex(unittest.TestCase):
+    def setUp(self):
+        self.p1 = Player(id="p1", name="Player 1")
+        self.p2 = Player(id="p2", name="Player 2")
+        self.state = GameState(players={"p1": self.p1, "p2": self.p2}, active_player_id="p1")
+        self.p1.leader = CardInstance(card_id="L1", instance_id="p1_leader", owner_id="p1")
+        for i in range(3):
+            self.state.add_character("p2", CardInstance(card_id="C1", instance_id=f"c{i}", owner_id="p2"))
+
+    def test_locate_leader_and_characters(self):
+        self.assertEqual(tuple(self.state.locate_instance("p1_leader")), ("p1", "leader", 0))
+        self.assertEqual(tuple(self.state.locate_instance("c2")), ("p2", "character", 2))
+        self.assertIsNone(self.state.locate_instance("missing"))
+
+    def test_find_instance_filters(self):
+        self.assertIs(self.state.find_instance("c1"), self.p2.field.character_area[1])
+        self.assertIsNone(self.state.find_instance("c1", owner_id="p1"))
+        self.assertIsNone(self.state.find_instance("p1_leader", zone="character"))
+
+    def test_remove_shifts_slots(self):
+        removed = self.state.remove_character("c0")
+        self.assertEqual(removed.instance_id, "c0")
+        self.assertIsNone(self.state.locate_instance("c0"))
+        self.assertEqual(self.state.locate_instance("c2").slot, 1)
+
+    def test_direct_zone_edits_are_detected(self):
+        self.p2.field.character_area.reverse()
+        self.assertIs(self.state.find_instance("c0"), self.p2.field.character_area[2])
+        self.p1.leader = CardInstance(card_id="L9", instance_id="new_leader", owner_id="p1")
+        self.assertIsNone(self.state.find_instance("p1_leader"))
+        self.assertIs(self.state.find_instance("new_leader"), self.p1.leader)
+
+    def test_clone_has_its_own_index(self):
+        clone = self.state.clone()
+        clone.remove_character("c0")
+        self.assertEqual(self.state.locate_instance("c1").slot, 1)
+        self.assertIs(self.state.find_instance("c0"), self.p2.field.character_area[0])
+        self.assertEqual(clone.locate_instance("c1").slot, 0)
+
+if __name__ == '__main__':
+    unittest.main()
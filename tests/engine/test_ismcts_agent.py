@@ -0,0 +1,102 @@
+import unittest
+import random
+import sys
+import os
+from collections import Counter
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.models.card import Card
+from agents.gameplay.ismcts_agent import ISMCTSAgent, determinize, action_key
+from tests.engine.game_fixtures import advance_to_choice, make_game
+
+
+def ids(cards):
+    return Counter(card.id for card in cards)
+
+
+class TestDeterminize(unittest.TestCase):
+    def test_keeps_visible_information(self):
+        state = make_game().state
+        sample = determinize(state, "p1", random.Random(1))
+        me, opp = state.players["p1"], state.players["p2"]
+        s_me, s_opp = sample.players["p1"], sample.players["p2"]
+
+        # Own hand is known; zone sizes and the hidden multisets are preserved
+        self.assertEqual([c.id for c in s_me.hand], [c.id for c in me.hand])
+        self.assertEqual(ids(s_me.deck + s_me.life), ids(me.deck + me.life))
+        self.assertEqual(ids(s_opp.hand + s_opp.deck + s_opp.life), ids(opp.hand + opp.deck + opp.life))
+        for zone in ("hand", "deck", "life"):
+            self.assertEqual(len(getattr(s_opp, zone)), len(getattr(opp, zone)))
+        # The original is untouched
+        self.assertEqual(state.zobrist_hash, make_game().state.zobrist_hash)
+
+    def test_action_key_follows_card(self):
+        game = make_game()
+        actions = advance_to_choice(game)
+        play = next(a for a in actions if a.action_type == 'PLAY_CARD')
+        card_id = game.state.players[play.player_id].hand[play.card_hand_index].id
+        self.assertIn(card_id, action_key(game.state, play))
+
+
+def hide_differently(state, pid):
+    """Copy of state with pid's hand swapped for the top of its deck (same zone sizes)."""
+    clone = state.clone()
+    player = clone.players[pid]
+    n = len(player.hand)
+    player.hand[:], player.deck[:n] = player.deck[:n], player.hand[:]
+    clone.invalidate_hash()
+    return clone
+
+
+class TestISMCTSAgent(unittest.TestCase):
+    def test_search_ignores_hidden_cards(self):
+        game = make_game()
+        actions = advance_to_choice(game)
+        observer = actions[0].player_id
+        opponent = "p2" if observer == "p1" else "p1"
+        other = hide_differently(game.state, opponent)
+        self.assertNotEqual(ids(other.players[opponent].hand), ids(game.state.players[opponent].hand))
+        results = []
+        for state in (game.state, other):
+            agent = ISMCTSAgent(observer, iterations=40, rollout_depth=5, seed=1)
+            results.append([(visits, value) for _, visits, value in agent.search_stats(state, actions)])
+        self.assertEqual(results[0], results[1])
+
+    def test_availability_counts_legal_siblings(self):
+        game = make_game()
+        actions = advance_to_choice(game)
+        agent = ISMCTSAgent(actions[0].player_id, rollout_depth=5, seed=2)
+        root, done = agent._search(game.state, 30, None)
+        # The root position is fully known, so every root action is legal in every
+        # determinization: the k-th child created was available from iteration k on.
+        children = len(root.children)
+        self.assertEqual(children, len({action_key(game.state, a) for a in actions}))
+        self.assertEqual(sorted(child.available for child in root.children.values()),
+                         list(range(done - children + 1, done + 1)))
+        for child in root.children.values():
+            self.assertLessEqual(child.visits, child.available)
+
+    def test_root_parallel_deterministic(self):
+        game = make_game()
+        actions = advance_to_choice(game)
+        runs = []
+        for _ in range(2):
+            agent = ISMCTSAgent(actions[0].player_id, iterations=40, rollout_depth=5, workers=2, seed=1)
+            try:
+                runs.append(agent.search_stats(game.state, actions))
+                # Cards registered after the pool started reach the workers with the next task
+                agent.registry.register(Card(id="NEW-001", name="New", type="CHARACTER"))
+                agent.search_stats(game.state, actions)
+            finally:
+                agent.close()
+        self.assertEqual(agent.last_stats["iterations"], 40)
+        # Every root visit went to one of the legal actions
+        self.assertEqual(sum(visits for _, visits, _ in runs[0]), 40)
+        self.assertEqual([(actions.index(a), v, q) for a, v, q in runs[0]],
+                         [(actions.index(a), v, q) for a, v, q in runs[1]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from agents.gameplay.mcts_agent import MCTSAgent, acting_player
+from engine.core.game import Game
+from tests.engine.game_fixtures import advance_to_choice, make_game
+
+
+class TestMCTSAgent(unittest.TestCase):
+    def test_returns_caller_action_and_stats(self):
+        game = make_game()
+        actions = advance_to_choice(game)
+        agent = MCTSAgent(acting_player(game.state), iterations=30, rollout_depth=5, seed=1)
+        action = agent.take_action(game.state, actions)
+        self.assertTrue(any(action is a for a in actions))
+        self.assertEqual(agent.last_stats["iterations"], 30)
+        self.assertGreater(agent.iterations_per_sec, 0)
+
+    def test_deterministic_with_seed(self):
+        picks = []
+        for _ in range(2):
+            game = make_game()
+            actions = advance_to_choice(game)
+            agent = MCTSAgent(acting_player(game.state), iterations=30, rollout_depth=5, seed=7)
+            picks.append(actions.index(agent.take_action(game.state, actions)))
+        self.assertEqual(picks[0], picks[1])
+
+    def test_budget_always_searches(self):
+        with self.assertRaises(ValueError):
+            MCTSAgent("p1", iterations=0)
+        game = make_game()
+        actions = advance_to_choice(game)
+        agent = MCTSAgent(acting_player(game.state), time_limit=1e-6, rollout_depth=5, seed=2)
+        self.assertTrue(any(agent.take_action(game.state, actions) is a for a in actions))
+        self.assertEqual(agent.last_stats["iterations"], 1)
+
+    def test_tree_reuse(self):
+        game = make_game()
+        agent = MCTSAgent("p1", iterations=60, rollout_depth=5, seed=3)
+        reused = 0
+        for _ in range(200):
+            actions = advance_to_choice(game)
+            if not actions:
+                break
+            if actions[0].player_id != "p1":
+                game.process_action(actions[0])
+                continue
+            game.process_action(agent.take_action(game.state, actions))
+            reused = max(reused, agent.last_stats["reused_visits"])
+        self.assertGreater(reused, 0)
+
+    def test_tree_reuse_checks_hand_order(self):
+        """Same hash, hand reordered: PLAY_CARD indices name other cards, so the subtree is not reused."""
+        game = make_game()
+        actions = advance_to_choice(game)
+        agent = MCTSAgent(acting_player(game.state), iterations=60, rollout_depth=5, seed=4)
+        game.process_action(agent.take_action(game.state, actions))
+        state = agent.root.game.state
+        self.assertIs(agent._reuse_root(state.clone(), agent.root.game.get_valid_actions()), agent.root)
+
+        swapped = state.clone()
+        # Two neighbouring hand cards that differ but are equally playable (same legal actions)
+        hand, i = next((p.hand, i) for p in swapped.players.values() for i in range(len(p.hand) - 1)
+                       if p.hand[i].id != p.hand[i + 1].id
+                       and (p.hand[i].type, p.hand[i].cost) == (p.hand[i + 1].type, p.hand[i + 1].cost))
+        hand[i], hand[i + 1] = hand[i + 1], hand[i]
+        swapped.invalidate_hash()
+        valid = Game.from_state(swapped.clone()).get_valid_actions()
+        self.assertEqual(swapped.zobrist_hash, state.zobrist_hash)
+        self.assertEqual(valid, agent.root.game.get_valid_actions())
+        self.assertIsNone(agent._reuse_root(swapped, valid))
+
+
+if __name__ == '__main__':
+    unittest.main()
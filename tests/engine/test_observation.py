@@ -0,0 +1,81 @@
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.ai.observation import ObservationEncoder, SLOT_SIZE
+from engine.env import GameEnv
+from engine.models.card import Card
+from agents.gameplay.random_agent import RandomAgent
+from tests.engine.game_fixtures import make_deck, make_game
+
+
+def play(game, actions, seed=0):
+    agent = RandomAgent("bot", seed=seed)
+    for _ in range(actions):
+        if game.state.winner_id:
+            break
+        game.process_action(agent.take_action(game.state, game.get_valid_actions()))
+
+
+# Counter values 0 / 1000 / 2000
+DECK = make_deck(counter=lambda i: 1000 * (i % 3))
+
+
+class TestObservationEncoder(unittest.TestCase):
+    def setUp(self):
+        self.encoder = ObservationEncoder()
+        self.layout = self.encoder.layout
+
+    def test_start_position(self):
+        state = make_game(0, DECK, DECK, p2_power=6000).state
+        obs = self.encoder.encode(state, "p1")
+        self.assertEqual(obs.shape, (self.encoder.size,))
+        self.assertEqual(obs.dtype, np.float32)
+        self.assertEqual(obs[self.layout["phase"]].tolist(), [1, 0, 0, 0, 0])
+        self.assertEqual(obs[self.layout["my_turn"]][0], 1)
+        self.assertEqual(obs[self.layout["me_leader"]].tolist(), [5, 0, 0])
+        self.assertEqual(obs[self.layout["opp_leader"]].tolist(), [6, 0, 0])
+        self.assertEqual(obs[self.layout["me_zones"]].tolist(), [5, 5, 40, 0])
+        self.assertEqual(obs[self.layout["hand_cost"]].sum(), 5)
+        self.assertEqual(obs[self.layout["hand_counter"]].sum(), 5)
+
+    def test_perspective(self):
+        game = make_game(0, DECK, DECK, p2_power=6000)
+        play(game, 120)
+        state = game.state
+        p1, p2 = self.encoder.encode(state, "p1"), self.encoder.encode(state, "p2")
+        for name in ("leader", "characters", "zones", "don"):
+            self.assertEqual(p1[self.layout[f"me_{name}"]].tolist(), p2[self.layout[f"opp_{name}"]].tolist())
+        chars = p1[self.layout["me_characters"]].reshape(-1, SLOT_SIZE)
+        self.assertEqual(int(chars[:, 0].sum()), len(state.players["p1"].field.character_area))
+
+    def test_batch_and_buffers(self):
+        games = [make_game(seed, DECK, DECK, p2_power=6000) for seed in range(4)]
+        for i, game in enumerate(games):
+            play(game, 30 * i, seed=i)
+        states = [game.state for game in games]
+        out = np.full((4, self.encoder.size), 99, dtype=np.float32)
+        result = self.encoder.encode_batch(states, ["p1", "p2", "p1", "p2"], out)
+        self.assertIs(result, out)
+        for row, state, pid in zip(out, states, ["p1", "p2", "p1", "p2"]):
+            np.testing.assert_array_equal(row, self.encoder.encode(state, pid))
+
+        int_encoder = ObservationEncoder(dtype=np.int16)
+        np.testing.assert_array_equal(int_encoder.encode(states[3], "p2"), out[3].astype(np.int16))
+
+    def test_env_observation(self):
+        leader = Card(id="L1", name="Leader", type="LEADER", power=5000)
+        env = GameEnv.from_decks(leader, DECK, leader, DECK, observe=self.encoder)
+        obs, mask = env.reset(seed=1)
+        self.assertEqual(obs.shape, (self.encoder.size,))
+        obs, *_ = env.step(np.flatnonzero(mask)[0])
+        np.testing.assert_array_equal(obs, self.encoder.encode(env.game.state, env.player))
+
+
+if __name__ == '__main__':
+    unittest.main()
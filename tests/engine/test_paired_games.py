@@ -0,0 +1,47 @@
+import unittest
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scripts.tournament_runner import build_game, make_agents, run_paired_game
+from tests.engine.game_fixtures import DECK1, DECK2, LEADER1, LEADER2
+
+
+def zones(player):
+    return [card.id for card in player.life + player.hand + player.deck]
+
+
+class TestPairedGames(unittest.TestCase):
+    def test_deck_seeds_ignore_seat(self):
+        game = build_game(LEADER1, DECK1, LEADER2, DECK2, 1, deck_seeds={"p1": 10, "p2": 20})
+        swapped = build_game(LEADER2, DECK2, LEADER1, DECK1, 2, deck_seeds={"p1": 20, "p2": 10})
+        self.assertEqual(zones(game.state.players["p1"]), zones(swapped.state.players["p2"]))
+        self.assertEqual(zones(game.state.players["p2"]), zones(swapped.state.players["p1"]))
+        # Without deck seeds both decks come from the game rng, in seat order
+        plain = build_game(LEADER1, DECK1, LEADER2, DECK2, 1)
+        self.assertNotEqual(zones(plain.state.players["p1"]), zones(game.state.players["p1"]))
+
+    def test_paired_game(self):
+        agents = make_agents()
+        result = run_paired_game(LEADER1, DECK1, LEADER2, DECK2, agents, 7, 0)
+        again = run_paired_game(LEADER1, DECK1, LEADER2, DECK2, agents, 7, 0)
+        self.assertEqual(result, again)
+        self.assertIn(result.score, (0.0, 0.25, 0.5, 0.75, 1.0))
+        first, second = result.deck_winners()
+        self.assertEqual(first, result.first.winner)
+        self.assertEqual(second, {"p1": "p2", "p2": "p1", None: None}[result.second.winner])
+
+    def test_common_random_numbers(self):
+        # A deck change that never matters to play leaves every paired game unchanged
+        renamed = [card.model_copy(update={'name': card.name + "'"}) for card in DECK1]
+        agents = make_agents()
+        for index in range(2):
+            base = run_paired_game(LEADER1, DECK1, LEADER2, DECK2, agents, 3, index)
+            variant = run_paired_game(LEADER1, renamed, LEADER2, DECK2, agents, 3, index)
+            self.assertEqual(variant, base)
+
+
+if __name__ == '__main__':
+    unittest.main()
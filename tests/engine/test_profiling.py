@@ -0,0 +1,84 @@
+import unittest
+import random
+import sys
+import os
+import json
+import tempfile
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.core.action_space import END_PHASE, PASS, PLAY, ATTACK, BLOCK, COUNTER, action_type
+from engine.core.profiling import GameStats, Histogram
+from engine.env import DeckGameFactory
+from tests.engine.game_fixtures import DECK1, DECK2, LEADER1, LEADER2
+
+
+def play_random(seed, stats=None, auto_advance=True, max_actions=300):
+    game = DeckGameFactory(LEADER1, DECK1, LEADER2, DECK2)(seed, auto_advance=auto_advance)
+    if stats is not None:
+        game.enable_stats(stats)
+    game.forced_actions = 0     # the start of the game was advanced before profiling
+    rng = random.Random(seed)
+    played = 0
+    while not game.state.winner_id and played < max_actions:
+        game.process_action(rng.choice(game.legal_actions()))
+        played += 1
+    return game, played
+
+
+class TestProfiling(unittest.TestCase):
+    def test_action_type(self):
+        self.assertEqual([action_type(i) for i in (END_PHASE, PASS, PLAY, ATTACK, BLOCK, COUNTER)],
+                         ['END_PHASE', 'RESOLVE_BATTLE', 'PLAY_CARD', 'ATTACK', 'BLOCK', 'COUNTER'])
+
+    def test_counters(self):
+        stats = GameStats()
+        game, played = play_random(1, stats)
+        self.assertIs(game.effect_manager.stats, stats)
+        calls = sum(timer.calls for timer in stats.actions.values())
+        self.assertEqual(calls, played + game.forced_actions)
+        self.assertEqual(calls, sum(timer.calls for timer in stats.phases.values()))
+        self.assertIn('ATTACK', stats.actions)
+        self.assertIn('MAIN_PHASE', stats.phases)
+        self.assertGreater(stats.effects['BLOCKER'].calls, 0)
+        self.assertGreater(stats.legal_actions.calls, 0)
+        game.get_valid_actions()
+        self.assertIsNone(game.fork().stats)
+
+    def test_off_by_default(self):
+        game, _ = play_random(2)
+        self.assertIsNone(game.stats)
+        self.assertIsNone(game.effect_manager.stats)
+
+    def test_merge_and_json(self):
+        first, second = GameStats(), GameStats()
+        play_random(3, first)
+        play_random(4, second)
+        for agent, ns in (("p1", 500), ("p1", 3000), ("p2", 10 ** 6)):
+            first.add_think(agent, ns)
+        second.add_think("p2", 1500)
+        expected = {kind: first.actions[kind].calls + second.actions[kind].calls
+                    for kind in set(first.actions) | set(second.actions)}
+        first.merge(second)
+        self.assertEqual({kind: timer.calls for kind, timer in first.actions.items()}, expected)
+        self.assertEqual(first.think["p2"].calls, 2)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "profile.json")
+            first.dump_json(path)
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        self.assertEqual(data, json.loads(json.dumps(first.to_dict())))
+        self.assertEqual(data["think"]["p1"]["histogram"], {"<1us": 1, "<4us": 1})
+        self.assertEqual(data["actions"]["ATTACK"]["calls"], expected["ATTACK"])
+        self.assertIn("Agent think", first.summary())
+
+    def test_histogram_buckets(self):
+        histogram = Histogram()
+        for ns in (999, 1000, 1999, 2000, 1_000_000):
+            histogram.add(ns)
+        self.assertEqual(histogram.to_dict(), {"<1us": 1, "<2us": 2, "<4us": 1, "<1024us": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import random
+import sys
+import os
+import tempfile
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.env import DeckGameFactory
+from engine.replay import GameRecord, ReplayFile, Replayer, ReplayWriter, deck_hash, winner_code
+from tests.engine.game_fixtures import DECK1, DECK2, LEADER1, LEADER2
+
+
+def play_random(seed, auto_advance, max_actions=300):
+    """A random game and its record."""
+    game = DeckGameFactory(LEADER1, DECK1, LEADER2, DECK2)(seed, auto_advance=auto_advance)
+    rng = random.Random(seed)
+    actions = bytearray()
+    while not game.state.winner_id and len(actions) < max_actions:
+        index = rng.choice(game.legal_actions())
+        actions.append(index)
+        game.process_action(index)
+    hashes = (deck_hash(LEADER1, DECK1), deck_hash(LEADER2, DECK2))
+    return game, GameRecord(seed, hashes, auto_advance, winner_code(game), bytes(actions))
+
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        self.replayer = Replayer(LEADER1, DECK1, LEADER2, DECK2)
+
+    def test_replay_reproduces_game(self):
+        for seed, auto_advance in ((1, False), (2, True)):
+            game, record = play_random(seed, auto_advance)
+            replayed = self.replayer.replay(record)
+            self.assertEqual(replayed.state.model_dump(), game.state.model_dump())
+
+    def test_intermediate_positions(self):
+        game, record = play_random(3, True, max_actions=40)
+        positions = [g.state.model_dump() for g in self.replayer.steps(record)]
+        self.assertEqual(len(positions), len(record.actions) + 1)
+        middle = len(record.actions) // 2
+        self.assertEqual(self.replayer.replay(record, stop=middle).state.model_dump(), positions[middle])
+        self.assertEqual(positions[-1], game.state.model_dump())
+
+    def test_file_round_trip(self):
+        records = [play_random(seed, seed % 2 == 0)[1] for seed in range(4)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "games.oprp")
+            with ReplayWriter(path) as writer:
+                for record in records[:3]:
+                    writer.write(record)
+            with ReplayWriter(path) as writer:
+                writer.write(records[3])
+            with ReplayFile(path) as replays:
+                self.assertEqual(len(replays), 4)
+                self.assertEqual(replays[2], records[2])
+                self.assertEqual(list(replays), records)
+            self.assertEqual(os.path.getsize(path), 8 + sum(30 + len(r.actions) for r in records))
+
+    def test_rejects_other_decks(self):
+        _, record = play_random(4, False, max_actions=10)
+        with self.assertRaises(ValueError):
+            Replayer(LEADER2, DECK2, LEADER1, DECK1).replay(record)
+        with tempfile.NamedTemporaryFile(suffix=".oprp", delete=False) as f:
+            f.write(b"not a replay")
+        try:
+            with self.assertRaises(ValueError):
+                ReplayFile(f.name)
+        finally:
+            os.unlink(f.name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+import random
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.core.game import Game
+from engine.data.registry import CardRegistry
+from engine.env import DeckGameFactory
+from engine.snapshot import snapshot, restore
+from tests.engine.game_fixtures import DECK1, DECK2, LEADER1, LEADER2
+
+
+def without_handles(data):
+    """model_dump() with every card_handle removed."""
+    if isinstance(data, dict):
+        return {key: without_handles(value) for key, value in data.items() if key != 'card_handle'}
+    if isinstance(data, list):
+        return [without_handles(value) for value in data]
+    return data
+
+
+def random_positions(seed, registry=None):
+    """Every position of a random game (cloned)."""
+    game = DeckGameFactory(LEADER1, DECK1, LEADER2, DECK2)(seed, registry)
+    rng = random.Random(seed)
+    positions = [game.state.clone()]
+    while not game.state.winner_id and len(positions) < 400:
+        game.process_action(rng.choice(game.legal_actions()))
+        positions.append(game.state.clone())
+    return game, positions
+
+
+class TestSnapshot(unittest.TestCase):
+    def test_round_trip(self):
+        _, positions = random_positions(1)
+        self.assertTrue(any(state.current_battle for state in positions))
+        self.assertTrue(any(char.granted_keywords for state in positions
+                            for player in state.players.values() for char in player.field.character_area))
+        for state in positions:
+            restored = restore(snapshot(state))
+            self.assertEqual(restored.model_dump(), state.model_dump())
+            self.assertEqual(restored.zobrist_hash, state.zobrist_hash)
+            self.assertEqual(snapshot(restored), snapshot(state))
+
+    def test_smaller_than_json(self):
+        _, positions = random_positions(2)
+        state = positions[len(positions) // 2]
+        self.assertLess(len(snapshot(state)) * 10, len(state.model_dump_json()))
+
+    def test_game_restore_continues(self):
+        game, positions = random_positions(3)
+        middle = Game.from_state(positions[len(positions) // 2].clone())
+        restored = Game.restore(middle.snapshot())
+        self.assertEqual(restored.legal_actions(), middle.legal_actions())
+        for _ in range(20):
+            if middle.state.winner_id:
+                break
+            index = middle.legal_actions()[-1]
+            self.assertTrue(middle.process_action(index))
+            self.assertTrue(restored.process_action(index))
+        self.assertEqual(restored.state.model_dump(), middle.state.model_dump())
+        self.assertIsNot(restored.state.players["p1"].leader, middle.state.players["p1"].leader)
+
+    def test_other_registry(self):
+        _, positions = random_positions(4)
+        blob = snapshot(positions[-1])
+        # Same definitions under different handles: resolved by card id
+        registry = CardRegistry()
+        registry.register_all(reversed(DECK2 + DECK1 + [LEADER2, LEADER1]))
+        restored = restore(blob, registry)
+        self.assertEqual(without_handles(restored.model_dump()), without_handles(positions[-1].model_dump()))
+        self.assertEqual(registry.get(restored.players["p1"].leader.card_handle), LEADER1)
+        for char in restored.players["p1"].field.character_area:
+            self.assertEqual(registry.card_for(char).id, char.card_id)
+        with self.assertRaises(ValueError):
+            restore(blob, CardRegistry())
+
+    def test_texts_with_control_characters(self):
+        state = random_positions(6)[1][-1]
+        player = state.players["p1"]
+        player.name = "P\x1f1\x00"
+        player.cost_area = ["", "\x00", "don \x1f 1"]
+        restored = restore(snapshot(state))
+        self.assertEqual(restored.model_dump(), state.model_dump())
+        player.name = "x" * 0xFFFF
+        with self.assertRaises(ValueError):
+            snapshot(state)
+
+    def test_rejects_foreign_data(self):
+        blob = snapshot(random_positions(5)[1][0])
+        with self.assertRaises(ValueError):
+            restore(b"OPSS")
+        with self.assertRaises(ValueError):
+            restore(blob[:4] + b"\x09\x00" + blob[6:])
+        with self.assertRaises(ValueError):
+            restore(blob + b"\x00")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.core.game import Game
+from engine.models.player import Player
+from engine.models.card import Card, CardInstance
+from engine.core.actions import AttackAction, ResolveBattleAction
+
+class TestStateClone(unittest.TestCase):
+    def setUp(self):
+        self.p1 = Player(id="p1", name="Player 1")
+        self.p2 = Player(id="p2", name="Player 2")
+        self.game = Game(self.p1, self.p2)
+
+        dummy_card = Card(id="C1", name="Dummy", type="CHARACTER", power=1000, counter=1000)
+        self.p1.deck = [dummy_card] * 10
+        self.p2.deck = [dummy_card] * 10
+        self.game.start_game()
+
+        self.p1.leader = CardInstance(card_id="L1", instance_id="p1_leader", owner_id="p1", current_power=5000)
+        self.p2.leader = CardInstance(card_id="L2", instance_id="p2_leader", owner_id="p2", current_power=5000)
+        self.blocker = CardInstance(card_id="B1", instance_id="p2_blocker", owner_id="p2", current_power=1000)
+        self.blocker.granted_keywords.append("BLOCKER")
+        self.p2.field.add_character(self.blocker)
+
+    def test_clone_is_equal_but_independent(self):
+        clone = self.game.state.clone()
+        self.assertEqual(clone, self.game.state)
+
+        clone.players["p2"].life.pop()
+        clone.players["p2"].field.character_area[0].granted_keywords.append("RUSH")
+        clone.players["p1"].leader.is_rested = True
+
+        self.assertEqual(len(self.p2.life), 5)
+        self.assertEqual(self.blocker.granted_keywords, ["BLOCKER"])
+        self.assertFalse(self.p1.leader.is_rested)
+
+    def test_clone_shares_card_definitions(self):
+        clone = self.game.state.clone()
+        self.assertIs(clone.players["p1"].hand[0], self.p1.hand[0])
+
+    def test_fork_does_not_touch_original_game(self):
+        fork = self.game.fork()
+        fork.process_action(AttackAction(
+            player_id="p1",
+            action_type="ATTACK",
+            attacker_instance_id="p1_leader",
+            target_instance_id="p2_leader"
+        ))
+        fork.process_action(ResolveBattleAction(player_id="p2", action_type="RESOLVE_BATTLE"))
+        fork.process_action(ResolveBattleAction(player_id="p2", action_type="RESOLVE_BATTLE"))
+
+        self.assertEqual(len(fork.state.players["p2"].life), 4)
+        self.assertEqual(len(self.p2.life), 5)
+        self.assertIsNone(self.game.state.current_battle)
+        self.assertFalse(self.p1.leader.is_rested)
+
+if __name__ == '__main__':
+    unittest.main()
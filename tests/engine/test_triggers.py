@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.core.game import GameState, Player
+from engine.core.effect_manager import EffectManager
+from engine.data.registry import CardRegistry
+from engine.models.effect import Effect, EffectType
+from engine.models.card import Card, CardInstance, KEYWORD_FLAGS, keyword_mask
+
+
+class TestTriggers(unittest.TestCase):
+    def setUp(self):
+        self.registry = CardRegistry()
+        self.p1 = Player(id="p1", name="Player 1")
+        self.p2 = Player(id="p2", name="Player 2")
+        self.state = GameState(players={"p1": self.p1, "p2": self.p2}, active_player_id="p1")
+        self.manager = EffectManager(self.state, self.registry)
+        self.filler = Card(id="F", name="Filler", type="CHARACTER", cost=1, power=1000)
+        self.p1.deck = [self.filler] * 5
+
+    def put_into_play(self, card, instance_id, owner="p1"):
+        instance = CardInstance(card_id=card.id, card_handle=self.registry.register(card),
+                                instance_id=instance_id, owner_id=owner, current_power=card.power)
+        self.state.add_character(owner, instance)
+        self.manager.enter_play(self.state.find_instance(instance_id))
+        return instance_id
+
+    def test_printed_keywords_set_flags(self):
+        blocker = Card(id="B", name="Blocker", type="CHARACTER", cost=2, power=2000, effect_list=[
+            Effect(type=EffectType.BLOCKER, action_code=EffectType.BLOCKER)])
+        self.put_into_play(blocker, "p1_b")
+        instance = self.state.find_instance("p1_b")
+        self.assertEqual(instance.granted_keywords, ["BLOCKER"])
+        self.assertEqual(instance.keyword_flags, KEYWORD_FLAGS["BLOCKER"])
+        self.assertNotIn("BLOCKER", self.manager.triggers.listeners)
+
+    def test_fire_runs_only_listeners(self):
+        drawer = Card(id="D", name="Drawer", type="CHARACTER", cost=2, power=2000, effect_list=[
+            Effect(type=EffectType.WHEN_ATTACKING, action_code=EffectType.DRAW_CARD, action_value=1)])
+        self.put_into_play(drawer, "p1_d")
+        self.put_into_play(self.filler, "p1_f")
+        self.assertEqual(list(self.manager.triggers.subscribed("WHEN_ATTACKING")), ["p1_d"])
+        self.assertEqual(self.manager.fire("WHEN_ATTACKING", "p1_f"), 0)
+        self.assertEqual(self.manager.fire("WHEN_ATTACKING", "p1_d"), 1)
+        self.assertEqual(len(self.p1.hand), 1)
+        self.assertEqual(self.manager.fire("ON_PLAY", "p1_d"), 0)
+
+    def test_leaving_play_unsubscribes(self):
+        drawer = Card(id="D", name="Drawer", type="CHARACTER", cost=2, power=2000, effect_list=[
+            Effect(type=EffectType.WHEN_ATTACKING, action_code=EffectType.DRAW_CARD, action_value=1)])
+        self.put_into_play(drawer, "p1_d")
+        self.assertIn("p1_d", self.manager.triggers)
+        ko = Effect(type=EffectType.ON_PLAY, action_code=EffectType.KO_CHARACTER)
+        self.assertTrue(self.manager.resolve_effect(ko, "p2_leader", "p1_d"))
+        self.assertNotIn("p1_d", self.manager.triggers)
+        self.assertEqual(self.manager.fire_all("WHEN_ATTACKING"), 0)
+
+    def test_fire_card_not_in_play(self):
+        trigger = Card(id="T", name="Trigger", type="EVENT", cost=1, effect_list=[
+            Effect(type=EffectType.TRIGGER, action_code=EffectType.DRAW_CARD, action_value=2)])
+        self.assertEqual(self.manager.fire_card("TRIGGER", trigger, "p1"), 1)
+        self.assertEqual(len(self.p1.hand), 2)
+
+    def test_keyword_flags_derived_and_copied(self):
+        instance = CardInstance(card_id="X", instance_id="x", owner_id="p1",
+                                granted_keywords=["RUSH", "BLOCKER"])
+        self.assertEqual(instance.keyword_flags, keyword_mask(["RUSH", "BLOCKER"]))
+        self.assertEqual(instance.clone().keyword_flags, instance.keyword_flags)
+        # Edited in place: the flags catch up when the instance enters the field
+        instance.granted_keywords.append("DOUBLE_ATTACK")
+        self.state.add_character("p1", instance)
+        self.assertTrue(instance.keyword_flags & KEYWORD_FLAGS["DOUBLE_ATTACK"])
+        self.state.update_instance(instance, granted_keywords=["RUSH"])
+        self.assertEqual(instance.keyword_flags, KEYWORD_FLAGS["RUSH"])
+
+
+if __name__ == '__main__':
+    unittest.main()
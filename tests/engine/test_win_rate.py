@@ -0,0 +1,106 @@
+import unittest
+import math
+import random
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.utils.win_rate import (
+    SPRTStop, WilsonStop, WinRate, mean_interval, paired_difference, wilson_interval
+)
+
+
+def outcomes(p, seed, count=5000):
+    rng = random.Random(seed)
+    return ["p1" if rng.random() < p else "p2" for _ in range(count)]
+
+
+class TestWinRate(unittest.TestCase):
+    def test_wilson_interval(self):
+        low, high = wilson_interval(8, 10)
+        self.assertAlmostEqual(low, 0.4902, places=3)
+        self.assertAlmostEqual(high, 0.9433, places=3)
+        self.assertEqual(wilson_interval(0, 0), (0.0, 1.0))
+        low, high = wilson_interval(0, 20)
+        self.assertAlmostEqual(low, 0.0)
+        self.assertLess(high, 0.2)
+
+    def test_draws_count_half(self):
+        rate = WinRate()
+        for winner in ("p1", None, "p2", None):
+            rate.add(winner)
+        self.assertEqual((rate.games, rate.wins, rate.draws), (4, 1, 2))
+        self.assertEqual(rate.rate, 0.5)
+
+    def test_wilson_stop(self):
+        early = WilsonStop(width=0.5, min_games=50)
+        for _ in range(49):
+            self.assertFalse(early.add("p1"))
+        self.assertTrue(early.add("p1"))
+        rules = [WilsonStop(width=0.1), WilsonStop(width=0.05)]
+        for rule in rules:
+            for winner in outcomes(0.7, 1):
+                if rule.add(winner):
+                    break
+            low, high = rule.interval()
+            self.assertTrue(rule.done)
+            self.assertLess(high - low, rule.width)
+        # A tighter target needs more games
+        self.assertGreater(rules[1].games, rules[0].games)
+
+    def test_sprt(self):
+        strong, weak = SPRTStop(), SPRTStop()
+        for winner in outcomes(0.8, 2):
+            if strong.add(winner):
+                break
+        for winner in outcomes(0.2, 3):
+            if weak.add(winner):
+                break
+        self.assertTrue(strong.accepted)
+        self.assertFalse(weak.accepted)
+        self.assertLess(strong.games, 100)
+        self.assertIn("beats", strong.decision())
+        undecided = SPRTStop()
+        self.assertFalse(undecided.add(None))
+        self.assertEqual(undecided.llr, 0.0)
+        with self.assertRaises(ValueError):
+            SPRTStop(p0=0.6, p1=0.5)
+
+    def test_pair_scores(self):
+        wilson = WilsonStop(width=0.7, min_games=4)
+        for score in (1.0, 0.75, 0.5, 1.0):
+            wilson.add_score(score)
+        self.assertEqual((wilson.games, wilson.score), (4, 3.25))
+        self.assertTrue(wilson.done)
+        sprt = SPRTStop()
+        sprt.add_score(0.5)
+        self.assertEqual(sprt.llr, 0.0)
+        sprt.add_score(0.75)
+        self.assertAlmostEqual(sprt.llr, 0.75 * math.log(0.55 / 0.45) + 0.25 * math.log(0.45 / 0.55))
+        # Two wins fed as one pair count once
+        single, pair = SPRTStop(), SPRTStop()
+        single.add("p1")
+        single.add("p1")
+        pair.add_score(1.0)
+        self.assertAlmostEqual(pair.llr * 2, single.llr)
+
+    def test_paired_difference(self):
+        rng = random.Random(4)
+        base = [rng.choice((0.0, 0.5, 1.0)) for _ in range(400)]
+        variant = [min(1.0, score + 0.5) if rng.random() < 0.1 else score for score in base]
+        mean, low, high, reduction = paired_difference(variant, base)
+        self.assertGreater(mean, 0)
+        self.assertLess(low, mean)
+        self.assertGreater(high, mean)
+        self.assertGreater(low, 0)
+        self.assertGreater(reduction, 5)
+        self.assertEqual(mean_interval([1.0, 1.0, 1.0]), (1.0, 1.0, 1.0))
+        self.assertEqual(paired_difference(base, base)[3], float('inf'))
+        with self.assertRaises(ValueError):
+            paired_difference(base, base[1:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.core import zobrist
+from engine.models.card import CardInstance
+from engine.models.effect import Effect, EffectType
+from agents.gameplay.random_agent import RandomAgent
+from tests.engine.game_fixtures import make_deck, make_game
+
+
+def buff_and_draw(i):
+    effects = []
+    if i % 5 == 0:
+        effects.append(Effect(type=EffectType.ON_PLAY, action_code=EffectType.BUFF_POWER, action_power=1000))
+    if i % 7 == 0:
+        effects.append(Effect(type=EffectType.ON_PLAY, action_code=EffectType.DRAW_CARD, action_value=1))
+    return effects
+
+
+DECK = make_deck(effects=buff_and_draw)
+
+
+class TestZobrist(unittest.TestCase):
+    def test_incremental_matches_full_hash(self):
+        for seed in range(5):
+            game = make_game(seed, DECK, DECK)
+            game.state.zobrist_hash  # start tracking
+            agent = RandomAgent("bot", seed=seed)
+            for _ in range(400):
+                if game.state.winner_id:
+                    break
+                game.process_action(agent.take_action(game.state, game.get_valid_actions()))
+                self.assertEqual(game.state.zobrist_hash, zobrist.full_hash(game.state))
+
+    def test_clone_and_fork_share_hash(self):
+        game = make_game(0, DECK, DECK)
+        h = game.state.zobrist_hash
+        self.assertEqual(game.state.clone().zobrist_hash, h)
+        self.assertEqual(game.fork().state.zobrist_hash, h)
+
+        fork = game.fork()
+        fork.process_action(fork.get_valid_actions()[0])
+        self.assertNotEqual(fork.state.zobrist_hash, h)
+        self.assertEqual(game.state.zobrist_hash, h)
+
+    def test_zones_are_multisets(self):
+        state = make_game(0, DECK, DECK).state
+        card = state.players["p1"].hand[0]
+        h0 = state.zobrist_hash
+        state.add_card("p1", "hand", card)
+        h1 = state.zobrist_hash
+        state.add_card("p1", "hand", card)
+        self.assertNotIn(state.zobrist_hash, (h0, h1))
+
+        # Order does not matter; removing restores the previous hash
+        state.add_card("p1", "trash", state.pop_card("p1", "hand", 0))
+        state.add_card("p1", "hand", state.pop_card("p1", "trash"), 0)
+        state.pop_card("p1", "hand")
+        self.assertEqual(state.zobrist_hash, h1)
+
+    def test_transposition(self):
+        # Resting two characters in either order reaches the same position
+        a, b = make_game(0, DECK, DECK).state, make_game(0, DECK, DECK).state
+        for state in (a, b):
+            for i in range(2):
+                state.add_character("p1", CardInstance(card_id=f"OP01-00{i}", instance_id=f"c{i}", owner_id="p1", current_power=3000))
+        self.assertEqual(a.zobrist_hash, b.zobrist_hash)
+
+        chars_a, chars_b = a.players["p1"].field.character_area, b.players["p1"].field.character_area
+        a.update_instance(chars_a[0], is_rested=True)
+        a.update_instance(chars_a[1], power_modifier=1000)
+        b.update_instance(chars_b[1], power_modifier=1000)
+        b.update_instance(chars_b[0], is_rested=True)
+        self.assertEqual(a.zobrist_hash, b.zobrist_hash)
+        self.assertEqual(a.zobrist_hash, zobrist.full_hash(a))
+
+    def test_invalidate_after_direct_edit(self):
+        state = make_game(0, DECK, DECK).state
+        h = state.zobrist_hash
+        state.players["p1"].hand.pop()
+        state.invalidate_hash()
+        self.assertNotEqual(state.zobrist_hash, h)
+        self.assertEqual(state.zobrist_hash, zobrist.full_hash(state))
+
+
+if __name__ == '__main__':
+    unittest.main()